@@ -0,0 +1,67 @@
+# -*- mode: python ; coding: utf-8 -*-
+# Generated by Win-11-Python-EXE-Builder from the build options.
+# Rewritten only when those options change; edits here are overwritten.
+from PyInstaller.utils.hooks import collect_all
+
+datas = [
+    ('/root/package/Tests/test-temp/test_unchanged_options_leave_s0/project/Icons', 'Icons'),
+    ('/root/package/Tests/test-temp/test_unchanged_options_leave_s0/app.ico', '_exe_builder_tray_icon.ico'),
+]
+binaries = []
+hiddenimports = [
+    'pynput',
+    'psutil',
+]
+for package in ['qt_material']:
+    collected = collect_all(package)
+    datas += collected[0]
+    binaries += collected[1]
+    hiddenimports += collected[2]
+
+a = Analysis(
+    [
+        '/root/package/Tests/test-temp/test_unchanged_options_leave_s0/project/main.py',
+    ],
+    pathex=[
+        '/root/package/Tests/test-temp/test_unchanged_options_leave_s0/project',
+    ],
+    binaries=binaries,
+    datas=datas,
+    hiddenimports=hiddenimports,
+    hookspath=[],
+    hooksconfig={},
+    runtime_hooks=[
+        '/root/package/Tests/test-temp/test_unchanged_options_leave_s0/hook.py',
+    ],
+    excludes=[],
+    noarchive=False,
+)
+pyz = PYZ(a.pure)
+
+exe = EXE(
+    pyz,
+    a.scripts,
+    [],
+    exclude_binaries=True,
+    name='App',
+    debug=False,
+    bootloader_ignore_signals=False,
+    strip=False,
+    upx=True,
+    console=False,
+    disable_windowed_traceback=False,
+    argv_emulation=False,
+    target_arch=None,
+    codesign_identity=None,
+    entitlements_file=None,
+    icon=['/root/package/Tests/test-temp/test_unchanged_options_leave_s0/app.ico'],
+)
+coll = COLLECT(
+    exe,
+    a.binaries,
+    a.datas,
+    strip=False,
+    upx=True,
+    upx_exclude=[],
+    name='App',
+)
@@ -1,12 +1,22 @@
+import io
 import os
+import threading
+import time
 import warnings
 from datetime import datetime as real_datetime
 from pathlib import Path
 from types import SimpleNamespace
 
+import pytest
+from PySide6.QtCore import QEventLoop, QTimer
+from PySide6.QtWidgets import QApplication
+
 import build_controller
 import build_icon_contract
 from build_controller import BuildController, BuildWorker
+from build_history import BuildHistory
+from build_jobs import MAX_PARALLEL_MASS_BUILDS, mass_build_concurrency
+from build_report import build_report_path, read_build_reports
 from datetime_build_options import (
     ISO_MASS_DATETIME_BUILD_SENTINEL,
     MASS_DATETIME_BUILD_SENTINEL,
@@ -14,6 +24,7 @@ from datetime_build_options import (
     UK_MASS_DATETIME_BUILD_SENTINEL,
     USA_MASS_DATETIME_BUILD_SENTINEL,
 )
+from pyinstaller_progress import PyInstallerProgress
 
 
 class DummyInput:
@@ -281,8 +292,11 @@ def test_build_worker_writes_sectioned_command_and_result_log(tmp_path, monkeypa
     class FakeProcess:
         returncode = 0
 
-        def communicate(self):
-            return "stdout text", "warning text"
+        def __init__(self):
+            self.stdout = io.StringIO("warning text\n")
+
+        def wait(self):
+            return self.returncode
 
     monkeypatch.setattr(
         build_controller.subprocess,
@@ -297,10 +311,134 @@ def test_build_worker_writes_sectioned_command_and_result_log(tmp_path, monkeypa
     assert "--- PyInstaller Command ---" in contents
     assert "  ENTERED run_build" in contents
     assert "  CMD: python -m PyInstaller app.py" in contents
+    assert "--- PyInstaller Output ---" in contents
+    assert "    warning text" in contents
     assert "--- Build Result ---" in contents
     assert "  RETURN CODE: 0" in contents
-    assert "  STDERR:" in contents
-    assert "    warning text" in contents
+    assert contents.index("    warning text") < contents.index("--- Build Result ---")
+
+
+def test_build_worker_streams_output_and_reports_stage_progress(tmp_path, monkeypatch):
+    log_path = tmp_path / "build.log"
+    app = make_app(debug_log_path=str(log_path), build_process=None)
+    output_lines = [
+        "123 INFO: PyInstaller: 6.10.0",
+        "456 INFO: Analyzing hidden import 'json'",
+        "789 INFO: Processing standard module hook 'hook-encodings.py'",
+        "1200 INFO: checking PYZ",
+        "1300 INFO: Building PKG (CArchive) app.pkg",
+        "1400 INFO: Building EXE from EXE-00.toc",
+        "1500 INFO: Building COLLECT COLLECT-00.toc",
+        "1600 INFO: Build complete! The results are available in: dist",
+    ]
+
+    class FakeProcess:
+        returncode = 0
+
+        def __init__(self):
+            self.stdout = io.StringIO("".join(f"{line}\n" for line in output_lines))
+
+        def wait(self):
+            return self.returncode
+
+    popen_kwargs = {}
+
+    def fake_popen(*_args, **kwargs):
+        popen_kwargs.update(kwargs)
+        return FakeProcess()
+
+    monkeypatch.setattr(build_controller.subprocess, "Popen", fake_popen)
+
+    output_dir = tmp_path / "dist" / "App"
+    (output_dir / "_internal").mkdir(parents=True)
+    (output_dir / "App.exe").write_bytes(b"MZ")
+    (output_dir / "_internal" / "base_library.zip").write_bytes(b"zip")
+
+    worker = BuildWorker(app, ["python", "-m", "PyInstaller", "app.py"])
+    worker.build_job = SimpleNamespace(
+        label="ISO",
+        debug_log_path=str(log_path),
+        process=None,
+        output_paths=[str(output_dir)],
+    )
+    progress_events = []
+    finished = []
+    worker.progress.connect(progress_events.append)
+    worker.finished.connect(lambda ret, out, err, totals: finished.append((ret, out, err, totals)))
+    worker.run()
+
+    assert popen_kwargs["stderr"] == build_controller.subprocess.STDOUT
+    stages = [progress.stage for progress in progress_events]
+    assert stages[-1] == "Done"
+    assert [stage for stage in ("PYZ", "PKG", "EXE", "COLLECT") if stage in stages] == [
+        "PYZ",
+        "PKG",
+        "EXE",
+        "COLLECT",
+    ]
+    assert progress_events[-1].modules_processed == 2
+    assert finished[0][0] == 0
+    assert finished[0][2].splitlines()[-1] == output_lines[-1]
+    assert finished[0][3] == (5, 2)
+
+    contents = log_path.read_text(encoding="utf-8")
+    assert "    [ISO] 1500 INFO: Building COLLECT COLLECT-00.toc" in contents
+
+
+def test_build_worker_runs_generated_spec_when_enabled(tmp_path, monkeypatch):
+    log_path = tmp_path / "build.log"
+    app = make_app(debug_log_path=str(log_path), build_process=None)
+    spec_dir = tmp_path / "spec" / "App"
+    options = [
+        "python",
+        "-m",
+        "PyInstaller",
+        "--onedir",
+        "--noconfirm",
+        f"--distpath={tmp_path}",
+        f"--workpath={tmp_path / 'build' / 'App'}",
+        f"--specpath={spec_dir}",
+        "--name=App",
+        "--icon=NONE",
+        "app.py",
+    ]
+
+    class FakeProcess:
+        returncode = 0
+
+        def __init__(self):
+            self.stdout = io.StringIO("")
+
+        def wait(self):
+            return self.returncode
+
+    popen_cmds = []
+    monkeypatch.setattr(
+        build_controller.subprocess,
+        "Popen",
+        lambda cmd, **_kwargs: popen_cmds.append(cmd) or FakeProcess(),
+    )
+
+    job = SimpleNamespace(
+        label="",
+        debug_log_path=str(log_path),
+        process=None,
+        use_spec_file=True,
+        cache_info={},
+    )
+    for _ in range(2):
+        worker = BuildWorker(app, options)
+        worker.build_job = job
+        worker.run()
+
+    spec_file = str(spec_dir / "App.spec")
+    assert popen_cmds[0][-1] == spec_file
+    assert "--name=App" not in popen_cmds[0]
+    assert job.cache_info["spec_file"] == "unchanged"
+
+    contents = log_path.read_text(encoding="utf-8")
+    assert f"  SPEC: {spec_file} (written," in contents
+    assert f"  SPEC: {spec_file} (unchanged," in contents
 
 
 class DummySignal:
@@ -393,6 +531,9 @@ class DummyValidationController:
     def update_ui_state(self):
         pass
 
+    def flush_ui_state(self):
+        pass
+
     def set_build_error(self, _message):
         pass
 
@@ -438,6 +579,7 @@ class FakeWorker:
     def __init__(self, app, cmd):
         app.captured_cmd = cmd
         self.finished = DummySignal()
+        self.progress = DummySignal()
 
     def moveToThread(self, _thread):
         pass
@@ -453,6 +595,7 @@ class CapturingWorker:
     def __init__(self, app, cmd):
         app.captured_cmds.append(cmd)
         self.finished = DummySignal()
+        self.progress = DummySignal()
 
     def moveToThread(self, _thread):
         pass
@@ -738,6 +881,474 @@ def patch_build_runtime(monkeypatch):
         lambda *args, **kwargs: SimpleNamespace(returncode=0, stdout="", stderr=""),
     )
     monkeypatch.setattr(build_controller.QTimer, "singleShot", lambda _ms, callback: callback())
+    monkeypatch.setattr(BuildController, "_mass_build_concurrency", lambda self, _count: 1)
+
+
+def test_repeated_builds_reuse_cached_pyinstaller_probe(tmp_path, monkeypatch):
+    patch_build_runtime(monkeypatch)
+    probes = []
+    monkeypatch.setattr(
+        build_controller.subprocess,
+        "run",
+        lambda command, **kwargs: probes.append(command)
+        or SimpleNamespace(returncode=0, stdout="6.16.0", stderr=""),
+    )
+    app = make_buildable_app(tmp_path)
+    controller = BuildController(app)
+
+    controller.build_exe(None)
+    finish_current_build_successfully(controller, app)
+    controller.build_exe(None)
+
+    assert len(app.captured_cmds) == 2
+    assert probes == [[app.python_interpreter_path, "-m", "PyInstaller", "--version"]]
+
+
+def test_completed_build_records_stage_history_used_by_eta(tmp_path, monkeypatch):
+    patch_build_runtime(monkeypatch)
+    history = BuildHistory()
+    monkeypatch.setattr(build_controller, "BUILD_HISTORY", history)
+    app = make_buildable_app(tmp_path)
+    controller = BuildController(app)
+
+    controller.build_exe(None)
+    job = controller._running_build_jobs()[0]
+    controller._on_build_progress(
+        job,
+        PyInstallerProgress(
+            stage="Done",
+            stage_index=5,
+            modules_processed=3,
+            lines_read=10,
+            stage_started_at=0.0,
+            stage_durations={"Analysis": 12.0, "PKG": 4.0},
+        ),
+    )
+    finish_current_build_successfully(controller, app)
+
+    entry = history.lookup(job.project_root, app.python_interpreter_path)
+    assert entry.mode == "clean"
+    assert entry.stage_seconds["Analysis"] == 12.0
+    assert "prebuild" in entry.stage_seconds
+    contents = Path(job.debug_log_path).read_text(encoding="utf-8")
+    assert "--- Stage Timings ---" in contents
+    assert "  Analysis: 12.0s" in contents
+
+    controller.build_exe(None)
+    next_job = controller._running_build_jobs()[0]
+    next_job.pyinstaller_progress = PyInstallerProgress(
+        stage="Analysis",
+        stage_index=0,
+        modules_processed=0,
+        lines_read=1,
+        stage_started_at=time.monotonic() - 2,
+    )
+
+    assert 13 <= controller._estimate_remaining_seconds(2) <= 14
+
+
+def test_stamp_mode_eta_counts_one_build_plus_stamping(tmp_path, monkeypatch):
+    patch_build_runtime(monkeypatch)
+    app = make_buildable_app(
+        tmp_path,
+        date_time_dropdown=mass_datetime_dropdown(),
+        mass_build_stamp_variants_enabled=True,
+        last_build_seconds=0,
+    )
+    history = BuildHistory()
+    history.record(app.project_root, app.python_interpreter_path, "clean", {"Analysis": 40.0, "PKG": 20.0}, 60.0)
+    monkeypatch.setattr(build_controller, "BUILD_HISTORY", history)
+    controller = BuildController(app)
+
+    controller.build_exe(None)
+
+    assert len(controller._mass_datetime_queue) == 6
+    assert 55 <= controller._estimate_remaining_seconds(0) <= 70
+
+    controller._mass_datetime_stamping = False
+    assert controller._estimate_remaining_seconds(0) >= 400
+
+
+def test_successful_build_writes_structured_report(tmp_path, monkeypatch):
+    patch_build_runtime(monkeypatch)
+    app = make_buildable_app(tmp_path)
+    controller = BuildController(app)
+
+    controller.build_exe(None)
+    latest_build_target(app).mkdir(parents=True)
+    (job,) = controller._running_build_jobs()
+    monkeypatch.setattr(build_controller, "measure_output", lambda _path: pytest.fail("measured on the GUI thread"))
+    controller.on_build_complete(0, "", "", job, (3, 1))
+
+    reports = read_build_reports(build_report_path(app.debug_log_path))
+    assert len(reports) == 1
+    report = reports[0]
+    assert report["kind"] == "build"
+    assert report["return_code"] == 0
+    assert report["status"] == "succeeded"
+    assert {"validation", "probe", "data_scan", "cleanup", "pyinstaller", "presentation"} <= set(
+        report["phases"]
+    )
+    assert report["cache"]["workpath"] == "miss"
+    assert report["cache"]["interpreter_probe"] in {"hit", "miss"}
+    assert report["output"] == {"bytes": 3, "files": 1}
+
+
+def test_eta_ticks_from_a_single_fixed_rate_timer(tmp_path, monkeypatch):
+    _qapp()
+    ticks = []
+    monkeypatch.setattr(BuildController, "_tick_eta", lambda self: ticks.append(True))
+    app = make_buildable_app(tmp_path)
+    controller = BuildController(app)
+
+    controller.start_eta()
+    timer = controller._eta_timer
+    controller.start_eta()
+
+    assert controller._eta_timer is timer
+    assert timer.isActive()
+    assert timer.interval() == build_controller.ETA_TICK_INTERVAL_MS
+    assert len(ticks) == 2
+
+    controller.stop_eta()
+    assert not timer.isActive()
+
+
+def _qapp():
+    app = QApplication.instance()
+    if app is None:
+        app = QApplication([])
+    return app
+
+
+def run_in_event_loop(callback, until, timeout_ms=5000):
+    _qapp()
+    loop = QEventLoop()
+    poll = QTimer()
+    poll.setInterval(10)
+    poll.timeout.connect(lambda: loop.quit() if until() else None)
+    QTimer.singleShot(0, callback)
+    QTimer.singleShot(timeout_ms, loop.quit)
+    poll.start()
+    loop.exec()
+    poll.stop()
+
+
+def patch_async_build_runtime(monkeypatch, validate):
+    monkeypatch.setattr(build_controller, "validate_bundle_inputs", validate)
+    monkeypatch.setattr(BuildController, "start_eta", lambda self: None)
+    monkeypatch.setattr(BuildController, "stop_eta", lambda self: None)
+    monkeypatch.setattr(build_controller, "datetime", FixedDateTime)
+    monkeypatch.setattr(
+        build_controller.subprocess,
+        "run",
+        lambda *args, **kwargs: SimpleNamespace(returncode=0, stdout="", stderr=""),
+    )
+    monkeypatch.setattr(
+        BuildController,
+        "_launch_build_worker",
+        lambda self, job, cmd: self.app.captured_cmds.append(cmd),
+    )
+
+
+def test_prebuild_stage_runs_off_the_gui_thread_with_progress(tmp_path, monkeypatch):
+    validation_threads = []
+
+    def validate(_inputs):
+        validation_threads.append(threading.current_thread())
+        return True, ""
+
+    patch_async_build_runtime(monkeypatch, validate)
+    statuses = []
+    app = make_buildable_app(tmp_path)
+    app.status_label.setText = statuses.append
+    controller = BuildController(app)
+
+    run_in_event_loop(
+        lambda: controller.build_exe(None),
+        lambda: app.captured_cmds and not controller._retained_threads,
+    )
+
+    assert build_names(app) == ["Builder"]
+    assert validation_threads and validation_threads[0] is not threading.main_thread()
+    assert "Scanning project data files..." in statuses
+    assert (Path(app.output_path_input.text()) / "build" / "Builder").is_dir()
+
+
+def test_cancel_during_prebuild_stops_before_pyinstaller(tmp_path, monkeypatch):
+    import build_cancellation
+
+    release = threading.Event()
+
+    def validate(_inputs):
+        release.wait(5)
+        return True, ""
+
+    patch_async_build_runtime(monkeypatch, validate)
+    monkeypatch.setattr(
+        build_cancellation.BuildCancellation,
+        "cancel_build",
+        lambda self: setattr(self.app, "building", False),
+    )
+    app = make_buildable_app(tmp_path)
+    controller = BuildController(app)
+
+    def start_then_cancel():
+        controller.build_exe(None)
+        assert controller._prebuilding_build_jobs()
+        controller.build_exe(None)
+        release.set()
+
+    run_in_event_loop(
+        start_then_cancel,
+        lambda: not controller._build_jobs and not controller._retained_threads,
+    )
+
+    assert app.captured_cmds == []
+    assert app.last_status == "Build cancelled."
+    assert app.building is False
+    assert not (Path(app.output_path_input.text()) / "build").exists()
+
+
+def test_cancel_before_pyinstaller_starts_is_not_treated_as_a_new_build(tmp_path, monkeypatch):
+    import build_cancellation
+
+    patch_build_runtime(monkeypatch)
+    cancels = []
+    monkeypatch.setattr(build_cancellation.BuildCancellation, "cancel_build", lambda self: cancels.append(self))
+    app = make_buildable_app(tmp_path)
+    controller = BuildController(app)
+
+    controller.build_exe(None)
+    (job,) = controller._running_build_jobs()
+    assert job.process is None and not app.build_process and not controller._prebuilding_build_jobs()
+
+    controller.build_exe(None)
+
+    assert len(cancels) == 1
+    assert len(app.captured_cmds) == 1
+    assert job.cancel_event.is_set()
+
+    worker = BuildWorker(app, app.captured_cmds[0])
+    worker.build_job = job
+    finished = []
+    worker.finished.connect(lambda ret, out, err, totals: finished.append(ret))
+    monkeypatch.setattr(build_controller.subprocess, "Popen", lambda *_args, **_kwargs: pytest.fail("PyInstaller started"))
+    worker.run()
+    assert finished == [-1]
+
+
+def test_build_settles_a_pending_validation_pass_before_starting(tmp_path, monkeypatch):
+    patch_build_runtime(monkeypatch)
+    app = make_buildable_app(tmp_path)
+    app._was_build_ready = True
+    app.validation_controller.flush_ui_state = lambda: setattr(app, "_was_build_ready", False)
+    controller = BuildController(app)
+
+    controller.build_exe(None)
+
+    assert app.captured_cmds == []
+    assert controller._build_jobs == []
+
+    app.validation_controller.flush_ui_state = lambda: setattr(app, "_was_build_ready", True)
+    controller.build_exe(None)
+
+    assert build_names(app) == ["Builder"]
+
+
+def test_parallel_variants_do_not_clean_the_shared_pyinstaller_cache(tmp_path, monkeypatch):
+    patch_build_runtime(monkeypatch)
+    monkeypatch.setattr(BuildController, "_mass_build_concurrency", lambda self, _count: 3)
+    app = make_buildable_app(tmp_path, date_time_dropdown=mass_datetime_dropdown())
+    controller = BuildController(app)
+
+    controller.build_exe(None)
+
+    assert len(app.captured_cmds) == 3
+    assert all("--clean" not in cmd for cmd in app.captured_cmds)
+
+    (tmp_path / "single").mkdir()
+    single_app = make_buildable_app(tmp_path / "single")
+    BuildController(single_app).build_exe(None)
+    assert "--clean" in single_app.captured_cmds[0]
+
+
+def test_mass_build_concurrency_is_capped_by_cpu_and_memory():
+    gib = 1024 * 1024 * 1024
+
+    assert mass_build_concurrency(7, cpu_count=16, available_memory=64 * gib) == MAX_PARALLEL_MASS_BUILDS
+    assert mass_build_concurrency(7, cpu_count=4, available_memory=64 * gib) == 2
+    assert mass_build_concurrency(7, cpu_count=16, available_memory=2 * gib) == 1
+    assert mass_build_concurrency(2, cpu_count=16, available_memory=64 * gib) == 2
+    assert mass_build_concurrency(1, cpu_count=16, available_memory=64 * gib) == 1
+
+
+def test_parallel_mass_datetime_build_fills_slots_and_collects_every_output(tmp_path, monkeypatch):
+    patch_build_runtime(monkeypatch)
+    monkeypatch.setattr(BuildController, "_mass_build_concurrency", lambda self, _count: 3)
+    app = make_buildable_app(tmp_path, date_time_dropdown=mass_datetime_dropdown())
+    controller = BuildController(app)
+
+    controller.build_exe(None)
+
+    assert build_names(app) == [
+        "Builder",
+        "Builder_ISO_2026-05-19",
+        "Builder_ISO_2026-05-19_12-34",
+    ]
+    assert len({cmd_part for cmd in app.captured_cmds for cmd_part in cmd if cmd_part.startswith("--workpath=")}) == 3
+
+    built_dirs = []
+    for _ in range(7):
+        built_dirs.append(finish_current_build_successfully(controller, app))
+        if controller._mass_datetime_active:
+            assert len(controller._running_build_jobs()) <= 3
+
+    assert len(build_names(app)) == 7
+    assert controller._mass_datetime_active is False
+    assert controller._running_build_jobs() == []
+    assert app.saved_state is True
+    assert all(str(path) in app.current_build_paths for path in built_dirs)
+    assert app.debug_log_path in app.current_build_paths
+    summary = Path(app.debug_log_path).read_text(encoding="utf-8")
+    assert "--- Mass Build Summary ---" in summary
+    assert "  CONCURRENCY=3" in summary
+
+
+def test_parallel_mass_datetime_failure_stops_running_siblings(tmp_path, monkeypatch):
+    patch_build_runtime(monkeypatch)
+    monkeypatch.setattr(BuildController, "_mass_build_concurrency", lambda self, _count: 3)
+    app = make_buildable_app(tmp_path, date_time_dropdown=mass_datetime_dropdown())
+    controller = BuildController(app)
+
+    controller.build_exe(None)
+    running_jobs = controller._running_build_jobs()
+    controller._on_build_complete_ui(1, "", "failed", running_jobs[1])
+
+    assert controller._mass_datetime_active is False
+    assert controller._running_build_jobs() == []
+    assert all(job.status == "stopped" for job in (running_jobs[0], running_jobs[2]))
+    assert app.last_status == "Mass build failed on ISO | YYYY-MM-DD. See debug log."
+
+    controller._on_build_complete_ui(-9, "", "killed", running_jobs[0])
+
+    assert app.last_status == "Mass build failed on ISO | YYYY-MM-DD. See debug log."
+    assert len(build_names(app)) == 3
+
+
+def write_onedir_output(target_dir):
+    target_dir.mkdir(parents=True, exist_ok=True)
+    (target_dir / f"{target_dir.name}.exe").write_bytes(b"MZ")
+    (target_dir / "_internal").mkdir(exist_ok=True)
+    (target_dir / "_internal" / "base_library.zip").write_bytes(b"zip")
+
+
+def test_stamped_mass_datetime_build_runs_pyinstaller_once(tmp_path, monkeypatch):
+    patch_build_runtime(monkeypatch)
+    app = make_buildable_app(
+        tmp_path,
+        date_time_dropdown=mass_datetime_dropdown(),
+        mass_build_stamp_variants_enabled=True,
+    )
+    controller = BuildController(app)
+
+    controller.build_exe(None)
+    write_onedir_output(latest_build_target(app))
+    controller._on_build_complete_ui(0, "", "")
+
+    output_dir = Path(app.output_path_input.text())
+    variant_names = [
+        "Builder_ISO_2026-05-19",
+        "Builder_ISO_2026-05-19_12-34",
+        "Builder_UK_19-05-2026",
+        "Builder_UK_19-05-2026_12-34",
+        "Builder_USA_05-19-2026",
+        "Builder_USA_05-19-2026_12-34",
+    ]
+    assert build_names(app) == ["Builder"]
+    assert controller._mass_datetime_active is False
+    assert app.datetime_format == MASS_DATETIME_BUILD_SENTINEL
+    for name in variant_names:
+        assert (output_dir / name / f"{name}.exe").is_file()
+        assert str(output_dir / name) in app.current_build_paths
+    assert "  HARDLINKED_FILES=1" in Path(app.debug_log_path).read_text(encoding="utf-8")
+
+
+def test_stamped_mass_datetime_build_falls_back_to_rebuilding(tmp_path, monkeypatch):
+    patch_build_runtime(monkeypatch)
+    app = make_buildable_app(
+        tmp_path,
+        date_time_dropdown=iso_mass_datetime_dropdown(),
+        mass_build_stamp_variants_enabled=True,
+    )
+    controller = BuildController(app)
+
+    controller.build_exe(None)
+    finish_current_build_successfully(controller, app)
+
+    assert build_names(app) == ["Builder_ISO_2026-05-19", "Builder_ISO_2026-05-19_12-34"]
+    assert controller._mass_datetime_active is True
+
+    finish_current_build_successfully(controller, app)
+
+    assert controller._mass_datetime_active is False
+    assert "FALLBACK=rebuild" in Path(app.debug_log_path).read_text(encoding="utf-8")
+
+
+def test_variant_stamping_runs_off_the_gui_thread_and_can_be_cancelled(tmp_path, monkeypatch):
+    import build_cancellation
+    from PySide6.QtCore import QThread
+
+    single_shot = QTimer.singleShot
+    patch_build_runtime(monkeypatch)
+    monkeypatch.setattr(QTimer, "singleShot", single_shot)
+    monkeypatch.setattr(
+        build_cancellation.BuildCancellation,
+        "cancel_build",
+        lambda self: setattr(self.app, "building", False),
+    )
+    app = make_buildable_app(
+        tmp_path,
+        date_time_dropdown=mass_datetime_dropdown(),
+        mass_build_stamp_variants_enabled=True,
+    )
+    controller = BuildController(app)
+    controller.build_exe(None)
+    write_onedir_output(latest_build_target(app))
+    monkeypatch.setattr(build_controller, "QThread", QThread)
+
+    started = threading.Event()
+    release = threading.Event()
+    stamp_threads = []
+    stamp_build_variant = build_controller.stamp_build_variant
+
+    def slow_stamp(*args):
+        stamp_threads.append(threading.current_thread())
+        started.set()
+        release.wait(5)
+        return stamp_build_variant(*args)
+
+    monkeypatch.setattr(build_controller, "stamp_build_variant", slow_stamp)
+
+    def finish_then_cancel():
+        controller._on_build_complete_ui(0, "", "")
+        assert app.last_status == "Stamping 6 variants..."
+        assert started.wait(5)
+        controller.build_exe(None)
+        release.set()
+
+    run_in_event_loop(
+        finish_then_cancel,
+        lambda: controller._stamp_cancel_event is None
+        and not any(isinstance(thread, QThread) for thread in controller._retained_threads),
+    )
+
+    assert stamp_threads == [stamp_threads[0]]
+    assert stamp_threads[0] is not threading.main_thread()
+    assert build_names(app) == ["Builder"]
+    assert controller._mass_datetime_active is False
+    assert controller._stamp_cancel_event is None
+    assert app.last_status == "Build cancelled."
 
 
 def test_mass_datetime_build_runs_all_outputs_in_sequence(tmp_path, monkeypatch):
@@ -781,6 +1392,7 @@ def test_rebuilding_same_output_uses_new_icon_and_clears_exact_artifacts(tmp_pat
     controller = BuildController(app)
 
     controller.build_exe(None)
+    finish_current_build_successfully(controller, app)
 
     output_dir = Path(app.output_path_input.text())
     stale_paths = [
@@ -843,6 +1455,64 @@ def test_rebuilding_same_output_with_no_icon_passes_explicit_none(tmp_path, monk
     assert_folder_has_no_generated_icon_metadata(target_dir)
 
 
+def test_rebuilding_unchanged_output_reuses_workpath_without_clean(tmp_path, monkeypatch):
+    patch_build_runtime(monkeypatch)
+    app = make_buildable_app(tmp_path)
+    controller = BuildController(app)
+
+    controller.build_exe(None)
+    finish_current_build_successfully(controller, app)
+
+    output_dir = Path(app.output_path_input.text())
+    cached_analysis = output_dir / "build" / "Builder" / "Analysis-00.toc"
+    cached_analysis.write_text("cached", encoding="utf-8")
+    stale_target_file = output_dir / "Builder" / "stale.txt"
+    stale_target_file.write_text("old", encoding="utf-8")
+
+    controller.build_exe(None)
+
+    first_cmd, second_cmd = app.captured_cmds
+    assert "--clean" in first_cmd
+    assert "--clean" not in second_cmd
+    assert cached_analysis.exists()
+    assert not stale_target_file.exists()
+
+
+def test_rebuilding_after_interpreter_change_forces_clean_build(tmp_path, monkeypatch):
+    patch_build_runtime(monkeypatch)
+    app = make_buildable_app(tmp_path)
+    controller = BuildController(app)
+
+    controller.build_exe(None)
+    finish_current_build_successfully(controller, app)
+
+    output_dir = Path(app.output_path_input.text())
+    cached_analysis = output_dir / "build" / "Builder" / "Analysis-00.toc"
+    cached_analysis.write_text("cached", encoding="utf-8")
+    Path(app.python_interpreter_path).write_text("upgraded", encoding="utf-8")
+
+    controller.build_exe(None)
+
+    assert "--clean" in app.captured_cmds[-1]
+    assert not cached_analysis.exists()
+
+
+def test_failed_or_disabled_incremental_builds_always_clean(tmp_path, monkeypatch):
+    patch_build_runtime(monkeypatch)
+    app = make_buildable_app(tmp_path)
+    controller = BuildController(app)
+
+    controller.build_exe(None)
+    controller._on_build_complete_ui(1, "", "boom")
+    controller.build_exe(None)
+    finish_current_build_successfully(controller, app)
+
+    app.incremental_build_enabled = False
+    controller.build_exe(None)
+
+    assert ["--clean" in cmd for cmd in app.captured_cmds] == [True, True, True]
+
+
 def test_mass_datetime_build_uses_explicit_no_icon_for_every_output(tmp_path, monkeypatch):
     patch_build_runtime(monkeypatch)
 
@@ -1521,7 +2191,7 @@ def test_build_exe_suppresses_empty_clicked_disconnect_warning(tmp_path, monkeyp
     ]
 
 
-def test_get_project_png_data_args_preserves_relative_destinations(tmp_path):
+def test_get_project_data_args_preserves_relative_destinations(tmp_path):
     project_root = tmp_path / "project with spaces"
     nested_dir = project_root / "Icons" / "Screen Mover"
     nested_dir.mkdir(parents=True)
@@ -1536,7 +2206,7 @@ def test_get_project_png_data_args_preserves_relative_destinations(tmp_path):
 
     controller = BuildController(make_app())
 
-    args = controller._get_project_png_data_args(str(project_root))
+    args = controller._get_project_data_args(str(project_root))
 
     assert args == [
         f"--add-data={os.path.normpath(str(root_png))}{os.pathsep}.",
@@ -1548,7 +2218,7 @@ def test_get_project_png_data_args_preserves_relative_destinations(tmp_path):
     assert str(ignored_svg) not in " ".join(args)
 
 
-def test_get_project_png_data_args_includes_parent_project_sibling_assets(tmp_path):
+def test_get_project_data_args_includes_parent_project_sibling_assets(tmp_path):
     repo_root = tmp_path / "Browser-App-Mover"
     package_root = repo_root / "browser_app_mover"
     dock_icon_dir = repo_root / "Icon Pngs" / "Green"
@@ -1565,7 +2235,7 @@ def test_get_project_png_data_args_includes_parent_project_sibling_assets(tmp_pa
 
     controller = BuildController(make_app())
 
-    args = controller._get_project_png_data_args(str(package_root))
+    args = controller._get_project_data_args(str(package_root))
 
     assert (
         f"--add-data={os.path.normpath(str(dock_icon))}{os.pathsep}"
@@ -0,0 +1,71 @@
+from build_fingerprint import (
+    BuildFingerprint,
+    clear_build_fingerprint,
+    compute_build_fingerprint,
+    decide_incremental_build,
+    read_build_fingerprint,
+    write_build_fingerprint,
+)
+
+
+def make_project(tmp_path):
+    project_root = tmp_path / "project"
+    project_root.mkdir()
+    script = project_root / "app.py"
+    script.write_text("print('hello')\n", encoding="utf-8")
+    python = tmp_path / "python.exe"
+    python.write_text("", encoding="utf-8")
+    return project_root, script, python
+
+
+def fingerprint_for(project_root, script, python, cmd=None):
+    cmd = cmd or ["python", "-m", "PyInstaller", "--clean", str(script)]
+    return compute_build_fingerprint(cmd, str(python), str(script), str(project_root))
+
+
+def test_fingerprint_ignores_clean_flag_and_skipped_folders(tmp_path):
+    project_root, script, python = make_project(tmp_path)
+    first = fingerprint_for(project_root, script, python)
+
+    (project_root / "__pycache__").mkdir()
+    (project_root / "__pycache__" / "app.cpython-314.pyc").write_bytes(b"pyc")
+    second = fingerprint_for(
+        project_root,
+        script,
+        python,
+        cmd=["python", "-m", "PyInstaller", str(script)],
+    )
+
+    assert first == second
+
+
+def test_project_change_keeps_cache_key_but_changes_inputs(tmp_path):
+    project_root, script, python = make_project(tmp_path)
+    first = fingerprint_for(project_root, script, python)
+
+    (project_root / "helper.py").write_text("VALUE = 1\n", encoding="utf-8")
+    second = fingerprint_for(project_root, script, python)
+
+    decision = decide_incremental_build(first, second)
+    assert first.cache_key == second.cache_key
+    assert first.inputs_digest != second.inputs_digest
+    assert decision.reuse_workpath is True
+    assert decision.mode == "incremental"
+
+
+def test_cache_key_change_requires_clean_build():
+    previous = BuildFingerprint(cache_key="a", inputs_digest="x")
+    current = BuildFingerprint(cache_key="b", inputs_digest="x")
+
+    assert decide_incremental_build(previous, current).mode == "clean"
+    assert decide_incremental_build(None, current).mode == "clean"
+
+
+def test_fingerprint_round_trips_through_workpath(tmp_path):
+    fingerprint = BuildFingerprint(cache_key="key", inputs_digest="digest")
+
+    assert read_build_fingerprint(str(tmp_path)) is None
+    assert write_build_fingerprint(str(tmp_path), fingerprint) is True
+    assert read_build_fingerprint(str(tmp_path)) == fingerprint
+    assert clear_build_fingerprint(str(tmp_path)) is True
+    assert read_build_fingerprint(str(tmp_path)) is None
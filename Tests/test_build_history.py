@@ -0,0 +1,45 @@
+from build_history import BuildHistory
+
+
+def test_record_smooths_stage_durations_per_project_interpreter_and_mode():
+    history = BuildHistory()
+
+    history.record("C:/proj", "C:/py/python.exe", "clean", {"prebuild": 2, "Analysis": 30}, 40, now=1)
+    entry = history.record(
+        "C:/proj", "C:/py/python.exe", "clean", {"prebuild": 2, "Analysis": 40}, 50, now=2
+    )
+
+    assert entry.samples == 2
+    assert entry.stage_seconds["Analysis"] == 34.0
+    assert entry.total_seconds == 44.0
+    assert history.lookup("C:/proj", "C:/py/python.exe", "incremental") is entry
+    assert history.lookup("C:/other", "C:/py/python.exe", "clean") is None
+
+
+def test_estimate_remaining_uses_current_stage_and_later_stages():
+    history = BuildHistory()
+    entry = history.record(
+        "C:/proj",
+        "C:/py/python.exe",
+        "clean",
+        {"prebuild": 3, "Analysis": 20, "PYZ": 2, "PKG": 5, "EXE": 1, "COLLECT": 4},
+        35,
+    )
+
+    assert history.estimate_remaining(entry, "Analysis", 15, 18, 45) == 5 + 2 + 5 + 1 + 4
+    assert history.estimate_remaining(entry, "COLLECT", 10, 40, 45) == 0
+    assert history.estimate_remaining(entry, "Done", 0, 40, 45) == 0
+    assert history.estimate_remaining(None, "Analysis", 5, 10, 45) == 35
+
+
+def test_serialized_history_round_trips_and_skips_invalid_entries():
+    history = BuildHistory()
+    history.record("C:/proj", "C:/py/python.exe", "incremental", {"Analysis": 8}, 12, now=5)
+
+    restored = BuildHistory()
+    restored.load_serialized([*history.serialize(), {"project": ""}, "bad", {"project": "x", "stage_seconds": {"PKG": "slow"}}])
+
+    entry = restored.lookup("C:/proj", "C:/py/python.exe", "incremental")
+    assert entry.stage_seconds == {"Analysis": 8.0}
+    assert entry.total_seconds == 12.0
+    assert len(restored.serialize()) == 1
@@ -0,0 +1,56 @@
+import os
+
+from build_report import (
+    BuildReport,
+    PhaseClock,
+    ProcessTreeSampler,
+    append_build_report,
+    build_report_path,
+    measure_output,
+    read_build_reports,
+)
+
+
+def test_phase_clock_charges_each_lap_to_its_phase():
+    ticks = iter([0.0, 1.5, 4.0, 4.5])
+    clock = PhaseClock(clock=lambda: next(ticks))
+
+    clock.lap("validation")
+    clock.lap("probe")
+    clock.lap("validation")
+
+    assert clock.phases == {"validation": 2.0, "probe": 2.5}
+
+
+def test_build_reports_append_as_json_lines_next_to_debug_log(tmp_path):
+    debug_log = tmp_path / "EXE_BUILDER_DEBUG_app.txt"
+    output_dir = tmp_path / "app" / "_internal"
+    output_dir.mkdir(parents=True)
+    (output_dir / "base_library.zip").write_bytes(b"12345")
+    (tmp_path / "app" / "app.exe").write_bytes(b"MZ")
+
+    report_path = build_report_path(str(debug_log))
+    total_bytes, file_count = measure_output(str(tmp_path / "app"))
+    append_build_report(
+        report_path,
+        BuildReport(kind="build", label="ISO", phases={"probe": 0.12345}, output={"bytes": total_bytes}),
+    )
+    append_build_report(report_path, BuildReport(kind="build_all"))
+
+    assert report_path == str(tmp_path / "EXE_BUILDER_DEBUG_app.report.jsonl")
+    assert (total_bytes, file_count) == (7, 2)
+    reports = read_build_reports(report_path)
+    assert [report["kind"] for report in reports] == ["build", "build_all"]
+    assert reports[0]["phases"] == {"probe": 0.123}
+    assert reports[0]["output"] == {"bytes": 7}
+
+
+def test_process_tree_sampler_records_peak_rss_and_cpu_time():
+    sampler = ProcessTreeSampler(os.getpid())
+
+    sampler.sample()
+
+    assert sampler.usage.samples == 1
+    assert sampler.usage.peak_rss_bytes > 0
+    assert sampler.usage.cpu_seconds > 0
+    assert ProcessTreeSampler(None).usage.samples == 0
@@ -0,0 +1,63 @@
+import os
+
+import pytest
+
+from build_variants import VariantStampError, stamp_build_variant
+
+
+def make_template(output_dir, name="Builder"):
+    template_dir = output_dir / name
+    contents_dir = template_dir / "_internal" / "PySide6"
+    contents_dir.mkdir(parents=True)
+    (template_dir / f"{name}.exe").write_bytes(b"MZ-bootloader")
+    (template_dir / "_internal" / "base_library.zip").write_bytes(b"zip")
+    (contents_dir / "Qt6Core.dll").write_bytes(b"dll")
+    return template_dir
+
+
+def test_stamp_build_variant_renames_exe_and_links_contents(tmp_path):
+    template_dir = make_template(tmp_path)
+    (template_dir / "desktop.ini").write_text("[.ShellClassInfo]\n", encoding="utf-8")
+
+    stamped = stamp_build_variant(str(template_dir), "Builder", "Builder_ISO_2026-05-19")
+
+    target_dir = tmp_path / "Builder_ISO_2026-05-19"
+    assert stamped.target_dir == str(target_dir)
+    assert (target_dir / "Builder_ISO_2026-05-19.exe").read_bytes() == b"MZ-bootloader"
+    assert not (target_dir / "Builder.exe").exists()
+    assert not (target_dir / "desktop.ini").exists()
+    assert os.path.samefile(
+        template_dir / "_internal" / "PySide6" / "Qt6Core.dll",
+        target_dir / "_internal" / "PySide6" / "Qt6Core.dll",
+    )
+    assert stamped.linked_files == 2
+    assert stamped.copied_files == 1
+    assert not (tmp_path / "Builder_ISO_2026-05-19.stamping").exists()
+
+
+def test_stamp_build_variant_replaces_existing_variant(tmp_path):
+    template_dir = make_template(tmp_path)
+    stale_dir = tmp_path / "Builder_UK"
+    stale_dir.mkdir()
+    (stale_dir / "stale.txt").write_text("old", encoding="utf-8")
+
+    stamp_build_variant(str(template_dir), "Builder", "Builder_UK")
+
+    assert not (stale_dir / "stale.txt").exists()
+    assert (stale_dir / "Builder_UK.exe").is_file()
+
+
+def test_stamp_build_variant_rejects_unrecognised_layouts(tmp_path):
+    legacy_dir = tmp_path / "Builder"
+    legacy_dir.mkdir()
+    (legacy_dir / "Builder.exe").write_bytes(b"MZ")
+
+    with pytest.raises(VariantStampError):
+        stamp_build_variant(str(legacy_dir), "Builder", "Builder_ISO")
+
+    template_dir = make_template(tmp_path / "named", name="Tool")
+    (template_dir / "_internal" / "Tool.pkg").write_bytes(b"pkg")
+
+    with pytest.raises(VariantStampError):
+        stamp_build_variant(str(template_dir), "Tool", "Tool_ISO")
+    assert not (tmp_path / "named" / "Tool_ISO").exists()
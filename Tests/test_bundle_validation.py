@@ -3,7 +3,7 @@ from types import SimpleNamespace
 
 import pytest
 
-import bundle_validation
+import interpreter_cache
 from bundle_validation import validate_bundle_inputs
 
 
@@ -36,7 +36,7 @@ def python_version_ok(monkeypatch):
     def fake_run(*args, **kwargs):
         return SimpleNamespace(returncode=0)
 
-    monkeypatch.setattr(bundle_validation.subprocess, "run", fake_run)
+    monkeypatch.setattr(interpreter_cache.subprocess, "run", fake_run)
 
 
 def test_validate_bundle_inputs_accepts_valid_required_values(tmp_path, python_version_ok):
@@ -0,0 +1,100 @@
+import hashlib
+
+import pytest
+
+from environment_lockfile import (
+    LockfileError,
+    attach_wheel_hashes,
+    lock_from_packages,
+    read_lockfile,
+    write_lockfile,
+)
+from wheelhouse import index_wheel_filename, record_index_wheels
+
+
+PACKAGES = {
+    "numpy": {"name": "numpy", "version": "2.3.0"},
+    "pyside6-essentials": {"name": "PySide6_Essentials", "version": "6.9.0"},
+}
+
+
+def write_wheel(wheelhouse, filename, from_index=True):
+    wheelhouse.mkdir(exist_ok=True)
+    path = wheelhouse / filename
+    path.write_bytes(filename.encode("utf-8"))
+    if from_index:
+        record_index_wheels(str(wheelhouse), [filename])
+    return "sha256:" + hashlib.sha256(filename.encode("utf-8")).hexdigest()
+
+
+def test_requirements_lockfile_round_trips_with_wheel_hashes(tmp_path):
+    wheelhouse = tmp_path / "wheelhouse"
+    numpy_hashes = [
+        write_wheel(wheelhouse, "numpy-2.3.0-cp312-cp312-win_amd64.whl"),
+        write_wheel(wheelhouse, "numpy-2.3.0-cp313-cp313-win_amd64.whl"),
+    ]
+    pyside_hash = write_wheel(wheelhouse, "PySide6_Essentials-6.9.0-cp39-abi3-win_amd64.whl")
+    write_wheel(wheelhouse, "numpy-2.2.0-cp313-cp313-win_amd64.whl")
+
+    lock = attach_wheel_hashes(lock_from_packages(PACKAGES, source="test"), str(wheelhouse))
+    path = tmp_path / "requirements.lock.txt"
+    write_lockfile(path, lock)
+
+    text = path.read_text(encoding="utf-8")
+    assert "numpy==2.3.0 \\\n    --hash=" in text
+    loaded = read_lockfile(path)
+    assert loaded.fully_hashed
+    assert loaded.packages["numpy"].hashes == tuple(numpy_hashes)
+    assert loaded.packages["pyside6-essentials"].hashes == (pyside_hash,)
+    assert loaded.install_specs({"numpy": {"name": "numpy", "version": "2.3.0"}}) == ["PySide6_Essentials==6.9.0"]
+
+
+def test_partial_hashes_are_left_out_of_requirements_but_kept_in_json(tmp_path):
+    wheelhouse = tmp_path / "wheelhouse"
+    numpy_hash = write_wheel(wheelhouse, "numpy-2.3.0-cp313-cp313-win_amd64.whl")
+    lock = attach_wheel_hashes(lock_from_packages(PACKAGES), str(wheelhouse))
+
+    requirements = tmp_path / "lock.txt"
+    write_lockfile(requirements, lock)
+    assert "--hash" not in requirements.read_text(encoding="utf-8")
+    assert not read_lockfile(requirements).fully_hashed
+
+    json_path = tmp_path / "lock.json"
+    write_lockfile(json_path, lock)
+    loaded = read_lockfile(json_path)
+    assert loaded.packages["numpy"].hashes == (numpy_hash,)
+    assert loaded.packages["pyside6-essentials"].version == "6.9.0"
+
+
+def test_locally_built_wheels_are_never_hashed(tmp_path):
+    wheelhouse = tmp_path / "wheelhouse"
+    write_wheel(wheelhouse, "numpy-2.3.0-cp313-cp313-win_amd64.whl")
+    # Built from the sdist by "pip wheel": its hash is unique to this machine.
+    write_wheel(wheelhouse, "PySide6_Essentials-6.9.0-cp313-cp313-win_amd64.whl", from_index=False)
+
+    lock = attach_wheel_hashes(lock_from_packages(PACKAGES), str(wheelhouse))
+
+    assert lock.packages["numpy"].hashes
+    assert lock.packages["pyside6-essentials"].hashes == ()
+    assert not lock.fully_hashed
+    assert lock.hashes_by_spec() == {"numpy==2.3.0": lock.packages["numpy"].hashes}
+
+
+def test_index_wheels_are_recognised_from_pip_output():
+    assert index_wheel_filename("  Downloading numpy-2.3.0-cp313-cp313-win_amd64.whl (12.6 MB)") == (
+        "numpy-2.3.0-cp313-cp313-win_amd64.whl"
+    )
+    assert index_wheel_filename("  Using cached rich-13.9.0-py3-none-any.whl (242 kB)") == "rich-13.9.0-py3-none-any.whl"
+    assert index_wheel_filename(
+        "  Downloading https://files.pythonhosted.org/packages/ab/cd/attrs-25.1.0-py3-none-any.whl#sha256=00"
+    ) == "attrs-25.1.0-py3-none-any.whl"
+    assert index_wheel_filename("  Downloading pyyaml-6.0.2.tar.gz (130 kB)") == ""
+    assert index_wheel_filename("  Created wheel for pyyaml: filename=PyYAML-6.0.2-cp313-cp313-win_amd64.whl") == ""
+
+
+def test_unpinned_requirements_are_rejected(tmp_path):
+    path = tmp_path / "requirements.txt"
+    path.write_text("numpy>=2\n", encoding="utf-8")
+
+    with pytest.raises(LockfileError):
+        read_lockfile(path)
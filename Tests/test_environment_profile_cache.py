@@ -0,0 +1,61 @@
+import json
+
+from environment_profile_cache import (
+    encode_profiles,
+    read_profile_cache,
+    write_profile_cache,
+)
+
+
+def make_profiles(count=3, packages=300):
+    profiles = []
+    for index in range(count):
+        profiles.append(
+            {
+                "version": f"3.1{index}",
+                "executable": f"C:/Python31{index}/python.exe",
+                "packages": {
+                    f"package-{number}": {"name": f"Package_{number}", "version": f"1.{number}.{index}"}
+                    for number in range(packages - index)
+                },
+                "error": "",
+                "fingerprint": f"fingerprint-{index}",
+            }
+        )
+    return profiles
+
+
+def test_profiles_round_trip_through_the_compressed_cache(tmp_path):
+    profiles = make_profiles()
+    profiles[0]["packages"]["legacy_key"] = {"name": "Legacy", "version": "0.1"}
+    profiles.append(
+        {"version": "3.9", "executable": "C:/Python39/python.exe", "packages": {}, "error": "Timed out", "fingerprint": ""}
+    )
+
+    path = str(tmp_path / "profiles.json.gz")
+    assert write_profile_cache(path, profiles)
+
+    assert read_profile_cache(path) == profiles
+    inline_size = len(json.dumps(profiles, indent=4).encode("utf-8"))
+    assert (tmp_path / "profiles.json.gz").stat().st_size * 10 < inline_size
+
+
+def test_shared_package_names_are_stored_once(tmp_path):
+    encoded = encode_profiles(make_profiles(count=3, packages=50))
+
+    assert len(encoded["names"]) == 50
+    assert [len(profile["versions"]) for profile in encoded["profiles"]] == [50, 50, 50]
+    assert encoded["profiles"][2]["versions"][-2:] == [None, None]
+
+    path = str(tmp_path / "plain.json")
+    write_profile_cache(path, make_profiles(count=1, packages=5), compress=False)
+    assert json.loads((tmp_path / "plain.json").read_text(encoding="utf-8"))["format"] == 1
+    assert len(read_profile_cache(path)[0]["packages"]) == 5
+
+
+def test_unreadable_cache_loads_as_empty(tmp_path):
+    path = tmp_path / "profiles.json.gz"
+    path.write_bytes(b"\x1f\x8bnot really gzip")
+
+    assert read_profile_cache(str(path)) == []
+    assert read_profile_cache(str(tmp_path / "missing.json.gz")) == []
@@ -1,8 +1,15 @@
+import subprocess
+import sys
+import threading
+import time
+from types import SimpleNamespace
+
+import pytest
+
 from environment_sync_controller import (
     EnvironmentSyncController,
     PythonEnvironmentProfile,
 )
-from types import SimpleNamespace
 
 
 def package(name, version):
@@ -103,9 +110,54 @@ def test_union_plan_uses_largest_environment_as_baseline_and_keeps_unique_packag
     assert set(plan.union_packages) == {"numpy", "pillow", "pyside6", "pyinstaller", "rich"}
     assert plan.union_packages["numpy"]["version"] == "2.3.0"
     assert plan.union_packages["rich"]["version"] == "13.9.0"
-    assert set(plan.missing_by_version["3.13"]) == {"rich"}
-    assert set(plan.missing_by_version["3.12"]) == {"pyside6", "pyinstaller"}
-    assert set(plan.mismatched_by_version["3.12"]) == {"numpy", "pillow"}
+    assert set(plan.missing_for(profile_313)) == {"rich"}
+    assert set(plan.missing_for(profile_312)) == {"pyside6", "pyinstaller"}
+    assert set(plan.mismatched_for(profile_312)) == {"numpy", "pillow"}
+
+
+def test_union_takes_newest_version_of_packages_the_baseline_lacks():
+    controller = EnvironmentSyncController()
+    baseline = make_profile("3.13", {**package("numpy", "2.3.0"), **package("pillow", "11.1.0"), **package("rich", "1.0")})
+    profile_311 = make_profile("3.11", package("attrs", "25.10.0"))
+    profile_312 = make_profile("3.12", package("attrs", "25.9.0rc1"))
+
+    plan = controller.build_sync_plan([profile_311, profile_312, baseline])
+
+    assert plan.union_packages["attrs"]["version"] == "25.10.0"
+    assert plan.mismatched_for(profile_312) == {"attrs": {"name": "attrs", "version": "25.10.0"}}
+    assert plan.mismatched_for(profile_311) == {}
+    assert set(plan.missing_for(profile_311)) == {"numpy", "pillow", "rich"}
+
+
+def test_interpreters_on_the_same_version_keep_separate_plans():
+    controller = EnvironmentSyncController()
+    baseline = make_profile("3.13", {**package("numpy", "2.3.0"), **package("rich", "13.9.0")})
+    programs_312 = make_profile("3.12", {**package("numpy", "2.3.0"), **package("rich", "13.9.0")})
+    conda_312 = PythonEnvironmentProfile(
+        version="3.12",
+        executable="C:/miniconda3/envs/tools/python.exe",
+        packages=package("numpy", "1.26.0"),
+    )
+
+    plan = controller.build_sync_plan([programs_312, conda_312, baseline])
+
+    assert plan.missing_for(programs_312) == {}
+    assert plan.mismatched_for(programs_312) == {}
+    assert set(plan.missing_for(conda_312)) == {"rich"}
+    assert set(plan.mismatched_for(conda_312)) == {"numpy"}
+    assert controller._install_specs_for_profile(programs_312, plan) == []
+    assert controller._install_specs_for_profile(conda_312, plan) == ["numpy==2.3.0", "rich==13.9.0"]
+    assert plan.total_actions == 2
+
+
+def test_sync_plan_benchmark_runs_on_synthetic_profiles():
+    from sync_plan_benchmark import benchmark_sync_plan
+
+    result = benchmark_sync_plan(profile_count=3, package_count=500, repeat=1)
+
+    assert result["union_packages"] >= 500
+    assert result["actions"] > 0
+    assert result["best_seconds"] >= 0
 
 
 def test_install_specs_include_missing_and_mismatched_target_versions():
@@ -146,8 +198,8 @@ def test_serialized_profiles_round_trip_and_rebuild_plan():
     assert serialized[0]["executable"] == profile_311.executable
     assert serialized[0]["packages"]["numpy"]["version"] == "1.26.0"
     assert plan.baseline_version == "3.13"
-    assert set(plan.missing_by_version["3.11"]) == {"pyside6"}
-    assert set(plan.mismatched_by_version["3.11"]) == {"numpy"}
+    assert set(plan.missing_for(profile_311)) == {"pyside6"}
+    assert set(plan.mismatched_for(profile_311)) == {"numpy"}
 
 
 def test_serialized_profiles_preserve_scan_errors():
@@ -181,6 +233,8 @@ def test_sync_continues_when_one_package_fails(monkeypatch):
         },
     )
     controller.last_plan = controller.build_sync_plan([profile_311, profile_313])
+    controller.batch_installs = False
+    controller.wheelhouse_dir = ""
 
     attempted = []
 
@@ -190,16 +244,494 @@ def test_sync_continues_when_one_package_fails(monkeypatch):
             return False, "No compatible wheel"
         return True, "Installed"
 
+    rescanned = []
+
+    def fake_scan(update_ui=True, rescan=None):
+        rescanned.extend(rescan or [])
+        return controller.last_plan
+
     monkeypatch.setattr(controller, "_install_package_spec", fake_install)
-    monkeypatch.setattr(
-        controller,
-        "scan_profiles",
-        lambda update_ui=True: controller.last_plan,
-    )
+    monkeypatch.setattr(controller, "scan_profiles", fake_scan)
 
     results = controller.sync_dependencies(update_ui=False)
 
     result_311 = next(result for result in results if result.version == "3.11")
+    assert rescanned == [profile_311.executable]
     assert attempted == ["numpy==2.3.0", "PySide6==6.9.0"]
     assert result_311.installed == ["PySide6==6.9.0"]
     assert result_311.failed == {"numpy==2.3.0": "No compatible wheel"}
+
+
+def test_batched_sync_bisects_to_the_failing_specs(monkeypatch):
+    controller = EnvironmentSyncController()
+    names = ["attrs", "Babel", "certifi", "docutils", "idna", "Jinja2"]
+    baseline = {}
+    for name in names:
+        baseline.update(package(name, "1.0"))
+    profile_311 = make_profile("3.11", {})
+    controller.last_plan = controller.build_sync_plan([profile_311, make_profile("3.13", baseline)])
+
+    controller.wheelhouse_dir = ""
+    broken = {"Babel==1.0", "idna==1.0"}
+    batches = []
+
+    def fake_install_specs(_executable, specs):
+        batches.append(list(specs))
+        failing = broken.intersection(specs)
+        if failing:
+            return False, f"No matching distribution found for {sorted(failing)[0]}"
+        return True, "Installed."
+
+    monkeypatch.setattr(controller, "_install_package_specs", fake_install_specs)
+    monkeypatch.setattr(controller, "scan_profiles", lambda update_ui=True, rescan=None: controller.last_plan)
+
+    results = controller.sync_dependencies(update_ui=False)
+
+    result_311 = next(result for result in results if result.version == "3.11")
+    assert batches[0] == [f"{name}==1.0" for name in names]
+    assert len(batches) < 2 * len(names)
+    assert result_311.installed == ["attrs==1.0", "certifi==1.0", "docutils==1.0", "Jinja2==1.0"]
+    assert result_311.failed == {
+        "Babel==1.0": "No matching distribution found for Babel==1.0",
+        "idna==1.0": "No matching distribution found for idna==1.0",
+    }
+
+
+def test_sync_installs_only_the_selected_specs(monkeypatch):
+    controller = EnvironmentSyncController()
+    controller.wheelhouse_dir = ""
+    profile_311 = make_profile("3.11", {})
+    profile_312 = make_profile("3.12", {})
+    baseline = make_profile(
+        "3.13",
+        {
+            **package("numpy", "2.3.0"),
+            **package("PySide6", "6.9.0"),
+        },
+    )
+    controller.last_plan = controller.build_sync_plan([profile_311, profile_312, baseline])
+
+    batches = []
+    monkeypatch.setattr(
+        controller,
+        "_install_package_specs",
+        lambda executable, specs: batches.append((executable, list(specs))) or (True, "Installed."),
+    )
+    monkeypatch.setattr(
+        controller,
+        "_install_package_spec",
+        lambda executable, spec: batches.append((executable, [spec])) or (True, "Installed."),
+    )
+    monkeypatch.setattr(controller, "scan_profiles", lambda update_ui=True, rescan=None: controller.last_plan)
+
+    results = controller.sync_dependencies(update_ui=False, selection={controller._executable_key(profile_311.executable): ["PySide6==6.9.0"]})
+
+    messages = {result.version: result.message for result in results}
+    assert batches == [(profile_311.executable, ["PySide6==6.9.0"])]
+    assert messages["3.12"] == "Not selected."
+    assert messages["3.13"] == "Already synced."
+
+
+def test_preview_waits_for_an_async_scan_instead_of_scanning_inline(monkeypatch):
+    controller = EnvironmentSyncController(wheelhouse_dir="", sync_log_path="")
+    monkeypatch.setattr(controller, "scan_profiles", lambda **kwargs: pytest.fail("scanned on the caller's thread"))
+
+    def fake_start(action, argument=None, on_finished=None):
+        controller.is_running = True
+        controller._after_worker = on_finished
+        return True
+
+    monkeypatch.setattr(controller, "_start_async", fake_start)
+
+    assert controller.preview_sync() is None
+
+    seen = []
+    assert controller.start_scan_async(on_finished=lambda plan: seen.append((plan, controller.is_running)))
+    plan = controller.build_sync_plan([make_profile("3.11", {}), make_profile("3.13", package("idna", "3.10"))])
+    controller._on_worker_finished("scan", plan)
+    assert seen == []
+
+    controller._clear_worker_refs()
+    assert seen == [(plan, False)]
+    assert controller.preview_sync().total_actions == 1
+
+
+def wheelhouse_pip(gathered, commands, gather_ok=True):
+    lock = threading.Lock()
+
+    def fake_run(command, timeout, stream_output=False):
+        specs = [part for part in command if "==" in part]
+        with lock:
+            commands.append(command[3:4] + (["--no-index"] if "--no-index" in command else []))
+            if command[3] == "wheel":
+                if gather_ok:
+                    gathered.update(specs)
+                return SimpleNamespace(returncode=0 if gather_ok else 1, stdout="", stderr="")
+            if "--no-index" in command:
+                ok = set(specs) <= gathered
+                return SimpleNamespace(returncode=0 if ok else 1, stdout="", stderr="")
+        return SimpleNamespace(returncode=0, stdout="", stderr="")
+
+    return fake_run
+
+
+def test_sync_shares_one_wheelhouse_gather_across_interpreters(tmp_path, monkeypatch):
+    controller = EnvironmentSyncController(wheelhouse_dir=str(tmp_path / "wheelhouse"))
+    baseline = {**package("attrs", "25.1.0"), **package("numpy", "2.3.0")}
+    controller.last_plan = controller.build_sync_plan(
+        [make_profile("3.11", {}), make_profile("3.12", {}), make_profile("3.13", baseline)]
+    )
+
+    commands = []
+    monkeypatch.setattr(controller, "_run_subprocess", wheelhouse_pip(set(), commands))
+    monkeypatch.setattr(controller, "scan_profiles", lambda update_ui=True, rescan=None: controller.last_plan)
+
+    results = controller.sync_dependencies(update_ui=False)
+
+    assert [result.installed for result in results[:2]] == [["attrs==25.1.0", "numpy==2.3.0"]] * 2
+    assert commands.count(["wheel"]) == 1
+    assert ["install"] not in commands
+
+
+def test_sync_falls_back_to_index_install_when_wheelhouse_cannot_gather(tmp_path, monkeypatch):
+    controller = EnvironmentSyncController(wheelhouse_dir=str(tmp_path / "wheelhouse"))
+    controller.last_plan = controller.build_sync_plan(
+        [make_profile("3.11", {}), make_profile("3.13", package("numpy", "2.3.0"))]
+    )
+
+    commands = []
+    monkeypatch.setattr(controller, "_run_subprocess", wheelhouse_pip(set(), commands, gather_ok=False))
+    monkeypatch.setattr(controller, "scan_profiles", lambda update_ui=True, rescan=None: controller.last_plan)
+
+    results = controller.sync_dependencies(update_ui=False)
+
+    assert results[0].installed == ["numpy==2.3.0"]
+    assert commands == [["install", "--no-index"], ["wheel"], ["install"]]
+
+
+def test_gather_records_only_downloaded_wheels_as_index_artifacts(tmp_path, monkeypatch):
+    from wheelhouse import read_index_wheels
+
+    wheelhouse = tmp_path / "wheelhouse"
+    wheelhouse.mkdir()
+    (wheelhouse / "attrs-25.1.0-py3-none-any.whl").write_bytes(b"old")
+    controller = EnvironmentSyncController(wheelhouse_dir=str(wheelhouse), sync_log_path="")
+    forwarded = []
+    controller._pip_output.callback = forwarded.append
+
+    def fake_run(command, timeout, stream_output=False):
+        output = [
+            "Using cached attrs-25.1.0-py3-none-any.whl (63 kB)",
+            "Downloading numpy-2.3.0-cp313-cp313-win_amd64.whl (12.6 MB)",
+            "Downloading pyyaml-6.0.2.tar.gz (130 kB)",
+            "Created wheel for pyyaml: filename=PyYAML-6.0.2-cp313-cp313-win_amd64.whl",
+        ]
+        for line in output:
+            controller._pip_output.callback(line)
+        (wheelhouse / "numpy-2.3.0-cp313-cp313-win_amd64.whl").write_bytes(b"index")
+        (wheelhouse / "PyYAML-6.0.2-cp313-cp313-win_amd64.whl").write_bytes(b"built")
+        return SimpleNamespace(returncode=0, stdout="", stderr="")
+
+    monkeypatch.setattr(controller, "_run_subprocess", fake_run)
+
+    assert controller._gather_into_wheelhouse(make_profile("3.13", {}), ["numpy==2.3.0", "PyYAML==6.0.2"], 60)
+    # attrs was already there before this gather, so its origin is unknown.
+    assert read_index_wheels(str(wheelhouse)) == {"numpy-2.3.0-cp313-cp313-win_amd64.whl"}
+    assert len(forwarded) == 4
+    assert controller._pip_output.callback == forwarded.append
+
+
+def test_streamed_pip_output_is_logged_forwarded_and_tailed(tmp_path):
+    log_path = tmp_path / "logs" / "environment_sync.log"
+    controller = EnvironmentSyncController(wheelhouse_dir="", sync_log_path=str(log_path))
+    profile = make_profile("3.13", {})
+    messages = []
+    controller._pip_output.profile = profile
+    controller._pip_output.callback = controller._pip_progress_forwarder(profile, messages.append)
+    script = (
+        "for index in range(300): print(f'noise {index}')\n"
+        "print('Collecting numpy==2.3.0')\n"
+        "print('Collecting rich==13.9.0')\n"
+        "print('ERROR: No matching distribution found for numpy==2.3.0')\n"
+        "raise SystemExit(1)\n"
+    )
+
+    result = controller._run_subprocess([sys.executable, "-c", script], timeout=30, stream_output=True)
+
+    assert result.returncode == 1
+    assert len(result.stdout.splitlines()) == 200
+    assert messages == ["Python 3.13: Collecting numpy==2.3.0"]
+    assert controller._pip_error_summary(result.stdout) == "ERROR: No matching distribution found for numpy==2.3.0"
+    log_text = log_path.read_text(encoding="utf-8")
+    assert "[3.13] noise 0" in log_text
+    assert "[3.13] exit code 1" in log_text
+    assert controller._running_processes() == []
+    controller._close_sync_log()
+
+
+def test_streamed_subprocess_is_killed_at_its_timeout(tmp_path):
+    controller = EnvironmentSyncController(wheelhouse_dir="", sync_log_path=str(tmp_path / "sync.log"))
+
+    started = time.monotonic()
+    with pytest.raises(subprocess.TimeoutExpired):
+        controller._run_subprocess(
+            [sys.executable, "-c", "import time; print('Collecting x', flush=True); time.sleep(30)"],
+            timeout=0.5,
+            stream_output=True,
+        )
+
+    assert time.monotonic() - started < 10
+    assert controller._running_processes() == []
+
+
+def test_apply_lockfile_reads_only_targets_and_installs_differing_pins(tmp_path, monkeypatch):
+    from environment_lockfile import EnvironmentLock, LockedPackage
+
+    controller = EnvironmentSyncController(wheelhouse_dir="")
+    cached = make_profile("3.13", package("numpy", "2.2.0"))
+    cached.fingerprint = "unchanged"
+    controller.last_plan = controller.build_sync_plan([cached, make_profile("3.12", {})])
+
+    lock = EnvironmentLock(
+        packages={
+            "numpy": LockedPackage("numpy", "2.3.0", ("sha256:aa",)),
+            "rich": LockedPackage("rich", "13.9.0", ("sha256:bb",)),
+        }
+    )
+    commands = []
+
+    def fake_run(command, timeout, stream_output=False):
+        with open(command[-1], encoding="utf-8") as f:
+            commands.append((command[3:6], f.read()))
+        return SimpleNamespace(returncode=0, stdout="", stderr="")
+
+    def fake_scan_profile(executable):
+        return PythonEnvironmentProfile(
+            version="3.13",
+            executable=str(executable),
+            packages={**package("numpy", "2.3.0"), **package("rich", "13.9.0")},
+        )
+
+    monkeypatch.setattr(controller, "_environment_fingerprint", lambda _executable, _version: "unchanged")
+    monkeypatch.setattr(controller, "_run_subprocess", fake_run)
+    monkeypatch.setattr(controller, "_scan_profile", fake_scan_profile)
+    monkeypatch.setattr(controller, "detect_python_installations", pytest.fail)
+
+    results = controller.apply_lockfile(lock, executables=[cached.executable], update_ui=False)
+
+    assert results[0].installed == ["numpy==2.3.0", "rich==13.9.0"]
+    assert commands == [
+        (
+            ["install", "--disable-pip-version-check", "--require-hashes"],
+            "numpy==2.3.0 --hash=sha256:aa\nrich==13.9.0 --hash=sha256:bb\n",
+        )
+    ]
+    assert [profile.version for profile in controller.last_plan.profiles] == ["3.13", "3.12"]
+    assert controller.last_plan.profiles[0].packages["rich"]["version"] == "13.9.0"
+
+
+def test_lock_apply_previews_each_target_and_installs_only_the_selection(monkeypatch):
+    from environment_lockfile import EnvironmentLock, LockedPackage
+
+    controller = EnvironmentSyncController(wheelhouse_dir="")
+    system = make_profile("3.12", package("numpy", "2.2.0"))
+    conda = PythonEnvironmentProfile(
+        version="3.12",
+        executable="C:/Miniconda3/python.exe",
+        packages=package("numpy", "2.3.0"),
+    )
+    lock = EnvironmentLock(
+        packages={
+            "numpy": LockedPackage("numpy", "2.3.0"),
+            "rich": LockedPackage("rich", "13.9.0"),
+        }
+    )
+    commands = []
+
+    def fake_run(command, timeout, stream_output=False):
+        commands.append((command[0], [part for part in command if "==" in part]))
+        return SimpleNamespace(returncode=0, stdout="", stderr="")
+
+    monkeypatch.setattr(controller, "_profiles_for", lambda targets: [system, conda])
+    monkeypatch.setattr(controller, "detect_python_installations", lambda: [system.executable, conda.executable])
+    monkeypatch.setattr(controller, "_run_subprocess", fake_run)
+    monkeypatch.setattr(controller, "_scan_profile", lambda executable: system)
+
+    preview = controller.preview_lockfile(lock)
+    assert [[action.spec for action in profile.actions] for profile in preview.profiles] == [
+        ["numpy==2.3.0", "rich==13.9.0"],
+        ["rich==13.9.0"],
+    ]
+
+    selection = preview.selection()
+    selection[preview.profiles[0].key] = ["rich==13.9.0"]
+    del selection[preview.profiles[1].key]
+    results = controller.apply_lockfile(lock, update_ui=False, selection=selection)
+
+    assert commands == [(system.executable, ["rich==13.9.0"])]
+    assert results[0].installed == ["rich==13.9.0"]
+    assert results[1].message == "Not selected."
+
+
+def test_lockfile_export_reports_from_the_worker_result(tmp_path):
+    from environment_lockfile import EnvironmentLock, LockedPackage
+
+    statuses = []
+    app = SimpleNamespace(set_env_sync_status=statuses.append)
+    controller = EnvironmentSyncController(app=app, wheelhouse_dir="")
+    path = str(tmp_path / "requirements.lock.txt")
+    lock = EnvironmentLock(packages={"rich": LockedPackage("rich", "13.9.0")})
+
+    controller._on_worker_finished("export_lock", (path, lock))
+    controller._on_worker_failed("export_lock", "disk full")
+
+    assert statuses == [
+        f"Exported 1 pinned packages without hashes to {path}",
+        "Lockfile export failed.\ndisk full",
+    ]
+
+
+def test_scan_probes_interpreters_concurrently_and_keeps_version_order(tmp_path, monkeypatch):
+    controller = EnvironmentSyncController()
+    executables = []
+    for version in ("3.10", "3.11", "3.12", "3.13"):
+        executable = tmp_path / f"Python{version.replace('.', '')}" / "python.exe"
+        executables.append(executable)
+
+    active = []
+    peak = []
+    lock = threading.Lock()
+
+    def fake_packages(executable, timeout):
+        with lock:
+            active.append(executable)
+            peak.append(len(active))
+        time.sleep(0.2)
+        with lock:
+            active.remove(executable)
+        if executable == executables[1]:
+            raise RuntimeError("pip failed")
+        return package("numpy", "2.3.0")
+
+    monkeypatch.setattr(controller, "detect_python_installations", lambda _root=None: executables)
+    monkeypatch.setattr(controller, "_read_python_version", lambda executable: executable.parent.name)
+    monkeypatch.setattr(controller, "_read_installed_packages", fake_packages)
+    messages = []
+
+    started = time.monotonic()
+    plan = controller.scan_profiles(update_ui=False, progress_callback=messages.append)
+
+    assert time.monotonic() - started < 0.6
+    assert max(peak) > 1
+    assert [profile.version for profile in plan.profiles] == ["Python310", "Python311", "Python312", "Python313"]
+    assert plan.profiles[1].error == "pip failed"
+    assert len(messages) == 4
+    assert messages[-1].endswith("(4/4)")
+
+
+def test_scan_reports_per_interpreter_timeout(tmp_path, monkeypatch):
+    controller = EnvironmentSyncController()
+    executable = tmp_path / "Python313" / "python.exe"
+
+    def slow_packages(_executable, timeout):
+        raise subprocess.TimeoutExpired("pip", timeout)
+
+    monkeypatch.setattr(controller, "detect_python_installations", lambda _root=None: [executable])
+    monkeypatch.setattr(controller, "_read_python_version", lambda _executable: "3.13.1")
+    monkeypatch.setattr(controller, "_read_installed_packages", slow_packages)
+
+    plan = controller.scan_profiles(update_ui=False)
+
+    assert plan.profiles[0].version == "3.13.1"
+    assert plan.profiles[0].error == "Timed out after 90s."
+
+
+def test_rescan_reuses_profiles_whose_site_packages_did_not_change(tmp_path, monkeypatch):
+    controller = EnvironmentSyncController()
+    executables = []
+    for name in ("Python312", "Python313"):
+        executable = tmp_path / name / "python.exe"
+        (executable.parent / "Lib" / "site-packages").mkdir(parents=True)
+        executable.write_bytes(b"")
+        executables.append(executable)
+
+    reads = []
+
+    def fake_packages(executable, timeout):
+        reads.append(executable.parent.name)
+        return package("numpy", "2.3.0")
+
+    monkeypatch.setattr(controller, "detect_python_installations", lambda _root=None: executables)
+    monkeypatch.setattr(controller, "_read_python_version", lambda executable: executable.parent.name)
+    monkeypatch.setattr(controller, "_read_installed_packages", fake_packages)
+
+    controller.scan_profiles(update_ui=False)
+    restored = EnvironmentSyncController()
+    restored.load_serialized_profiles(controller.serialize_profiles(), update_ui=False)
+    monkeypatch.setattr(restored, "detect_python_installations", lambda _root=None: executables)
+    monkeypatch.setattr(restored, "_read_python_version", lambda executable: executable.parent.name)
+    monkeypatch.setattr(restored, "_read_installed_packages", fake_packages)
+
+    messages = []
+    restored.scan_profiles(update_ui=False, progress_callback=messages.append)
+    assert sorted(reads) == ["Python312", "Python313"]
+    assert all("unchanged" in message for message in messages)
+
+    (executables[1].parent / "Lib" / "site-packages" / "pillow-11.1.0.dist-info").mkdir()
+    restored.scan_profiles(update_ui=False)
+    assert reads[2:] == ["Python313"]
+
+    restored.scan_profiles(update_ui=False, rescan=[str(executables[0])])
+    assert reads[3:] == ["Python312"]
+
+
+def test_shutdown_terminates_every_in_flight_child():
+    controller = EnvironmentSyncController(SimpleNamespace(_is_closing=True))
+
+    class FakeProcess:
+        def __init__(self, finished=False):
+            self.finished = finished
+            self.terminated = False
+
+        def poll(self):
+            return 0 if self.finished else None
+
+        def terminate(self):
+            self.terminated = True
+
+        def wait(self, timeout):
+            return 0
+
+    processes = [FakeProcess(), FakeProcess(), FakeProcess(finished=True)]
+    controller._active_processes.update(processes)
+
+    controller.shutdown()
+
+    assert [process.terminated for process in processes] == [True, True, False]
+    assert controller._active_processes == set()
+    with pytest.raises(RuntimeError, match="stopped"):
+        controller._run_subprocess(["python", "--version"], timeout=1)
+
+
+def test_installed_packages_fall_back_to_pip_when_metadata_is_unreadable(monkeypatch):
+    controller = EnvironmentSyncController()
+    commands = []
+
+    def fake_run(command, timeout, stream_output=False):
+        commands.append(command)
+        if command[1] == "-c":
+            return subprocess.CompletedProcess(command, 1, "", "broken site")
+        return subprocess.CompletedProcess(
+            command,
+            0,
+            '[{"name": "PySide6", "version": "6.9.0"}]',
+            "",
+        )
+
+    monkeypatch.setattr(controller, "_run_subprocess", fake_run)
+
+    packages = controller._read_installed_packages("C:/Python313/python.exe")
+
+    assert packages == {"pyside6": {"name": "PySide6", "version": "6.9.0"}}
+    assert [command[1] for command in commands] == ["-c", "-m"]
+    assert commands[1][2:4] == ["pip", "list"]
@@ -0,0 +1,97 @@
+from environment_sync_controller import EnvironmentSyncController, PythonEnvironmentProfile
+from environment_sync_preview import (
+    DEFAULT_PACKAGE_INSTALL_SECONDS,
+    PIP_RUN_OVERHEAD_SECONDS,
+    SYNC_ACTION_DOWNGRADE,
+    SYNC_ACTION_INSTALL,
+    SYNC_ACTION_UPGRADE,
+    InstallHistory,
+    WheelCacheIndex,
+    build_sync_preview,
+)
+
+
+def make_profile(version, packages):
+    return PythonEnvironmentProfile(
+        version=version,
+        executable=f"C:/Python{version.replace('.', '')}/python.exe",
+        packages={name.lower(): {"name": name, "version": value} for name, value in packages.items()},
+    )
+
+
+def write_wheel(wheelhouse, filename, size):
+    wheelhouse.mkdir(exist_ok=True)
+    (wheelhouse / filename).write_bytes(b"x" * size)
+
+
+def test_preview_classifies_changes_and_prices_downloads(tmp_path):
+    wheelhouse = tmp_path / "wheelhouse"
+    write_wheel(wheelhouse, "numpy-2.3.0-cp313-cp313-win_amd64.whl", 300)
+    write_wheel(wheelhouse, "numpy-2.3.0-cp311-cp311-win_amd64.whl", 250)
+    write_wheel(wheelhouse, "PySide6_Essentials-6.9.0-cp39-abi3-win_amd64.whl", 900)
+
+    controller = EnvironmentSyncController(wheelhouse_dir="")
+    plan = controller.build_sync_plan([
+        make_profile("3.12", {"numpy": "2.4.0", "attrs": "23.1"}),
+        make_profile("3.13", {"numpy": "2.3.0", "PySide6-Essentials": "6.9.0", "attrs": "25.1", "idna": "3.10"}),
+    ])
+
+    history = InstallHistory()
+    history.record(["idna==3.10"], PIP_RUN_OVERHEAD_SECONDS + 2.0)
+    preview = build_sync_preview(plan, controller._version_key, WheelCacheIndex(str(wheelhouse)), history)
+
+    profile_312 = next(profile for profile in preview.profiles if profile.version == "3.12")
+    actions = {action.key: action for action in profile_312.actions}
+    assert actions["attrs"].kind == SYNC_ACTION_UPGRADE
+    assert actions["idna"].kind == SYNC_ACTION_INSTALL
+    assert actions["numpy"].kind == SYNC_ACTION_DOWNGRADE
+    assert actions["pyside6-essentials"].cached
+    assert actions["idna"].estimated_seconds == 2.0
+    assert actions["attrs"].estimated_seconds == DEFAULT_PACKAGE_INSTALL_SECONDS
+
+    # No numpy 2.3.0 wheel fits 3.12, so another build stands in for the size.
+    assert not actions["numpy"].cached
+    assert actions["numpy"].download_bytes == 300
+    assert profile_312.download_bytes == 300
+    assert profile_312.unknown_downloads == 2
+
+    selection = {profile_312.key: ["idna==3.10"]}
+    chosen = preview.restricted_to(selection)
+    assert chosen.total_actions == 1
+    assert chosen.estimated_seconds() == PIP_RUN_OVERHEAD_SECONDS + 2.0
+    assert preview.estimated_seconds() == profile_312.estimated_seconds
+
+
+def test_selection_tells_interpreters_on_the_same_version_apart():
+    controller = EnvironmentSyncController(wheelhouse_dir="")
+    programs_312 = make_profile("3.12", {})
+    conda_312 = PythonEnvironmentProfile(
+        version="3.12",
+        executable="C:/miniconda3/python.exe",
+        packages={},
+    )
+    plan = controller.build_sync_plan([
+        programs_312,
+        conda_312,
+        make_profile("3.13", {"idna": "3.10"}),
+    ])
+    preview = build_sync_preview(plan, controller._version_key)
+
+    selection = preview.selection()
+    assert len(selection) == 2
+    chosen = preview.restricted_to({controller._executable_key(conda_312.executable): ["idna==3.10"]})
+    assert [profile.executable for profile in chosen.profiles if profile.actions] == [conda_312.executable]
+
+
+def test_install_history_smooths_and_round_trips():
+    history = InstallHistory()
+    history.record(["numpy==2.3.0", "attrs==25.1"], PIP_RUN_OVERHEAD_SECONDS + 10.0)
+    history.record(["numpy==2.4.0"], PIP_RUN_OVERHEAD_SECONDS + 15.0)
+
+    assert history.estimate("attrs") == 5.0
+    assert 5.0 < history.estimate("numpy") < 15.0
+
+    restored = InstallHistory()
+    restored.load_serialized(history.serialize())
+    assert restored.estimate("attrs") == 5.0
+    assert restored.estimate("missing") == DEFAULT_PACKAGE_INSTALL_SECONDS
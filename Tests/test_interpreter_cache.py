@@ -0,0 +1,92 @@
+import json
+import os
+from types import SimpleNamespace
+
+import pytest
+
+import interpreter_cache
+from interpreter_cache import InterpreterCapabilityCache, InterpreterProbeError
+
+
+def make_interpreter(tmp_path):
+    python_dir = tmp_path / "Python314"
+    site_packages = python_dir / "Lib" / "site-packages"
+    site_packages.mkdir(parents=True)
+    python = python_dir / "python.exe"
+    python.write_text("", encoding="utf-8")
+    return python, site_packages
+
+
+def counting_runner(calls, returncode=0, stdout="Python 3.14.0"):
+    def run(command, timeout):
+        calls.append(command)
+        return SimpleNamespace(returncode=returncode, stdout=stdout, stderr="")
+
+    return run
+
+
+def bump_mtime(path):
+    stat = os.stat(path)
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 5_000_000_000))
+
+
+def test_python_version_is_probed_once_until_site_packages_changes(tmp_path):
+    python, site_packages = make_interpreter(tmp_path)
+    cache = InterpreterCapabilityCache()
+    calls = []
+    run = counting_runner(calls)
+
+    assert cache.python_version(python, run=run) == "3.14.0"
+    assert cache.python_version(python, run=run) == "3.14.0"
+    assert len(calls) == 1
+
+    (site_packages / "numpy-2.3.0.dist-info").mkdir()
+    bump_mtime(site_packages)
+
+    cache.python_version(python, run=run)
+    assert len(calls) == 2
+
+
+def test_missing_pyinstaller_is_cached_but_broken_python_is_not(tmp_path):
+    python, _site_packages = make_interpreter(tmp_path)
+    cache = InterpreterCapabilityCache()
+    calls = []
+    failing = counting_runner(calls, returncode=1, stdout="")
+
+    assert cache.pyinstaller_version(python, run=failing) == ""
+    assert cache.pyinstaller_version(python, run=failing) == ""
+    assert len(calls) == 1
+
+    for _ in range(2):
+        with pytest.raises(InterpreterProbeError):
+            cache.python_version(python, run=failing)
+    assert len(calls) == 3
+
+
+def test_serialized_capabilities_survive_a_restart(tmp_path):
+    python, _site_packages = make_interpreter(tmp_path)
+    first = InterpreterCapabilityCache()
+    first.python_version(python, run=counting_runner([]))
+    first.pyinstaller_version(python, run=counting_runner([], stdout="6.16.0"))
+
+    restored = InterpreterCapabilityCache()
+    restored.load_serialized(json.loads(json.dumps(first.serialize())))
+    calls = []
+
+    assert restored.python_version(python, run=counting_runner(calls)) == "3.14.0"
+    assert restored.pyinstaller_version(python, run=counting_runner(calls)) == "6.16.0"
+    assert calls == []
+
+
+def test_default_runner_uses_subprocess_run(tmp_path, monkeypatch):
+    python, _site_packages = make_interpreter(tmp_path)
+    calls = []
+    monkeypatch.setattr(
+        interpreter_cache.subprocess,
+        "run",
+        lambda command, **kwargs: calls.append((command, kwargs["timeout"]))
+        or SimpleNamespace(returncode=0, stdout="6.16.0", stderr=""),
+    )
+
+    assert InterpreterCapabilityCache().pyinstaller_version(python) == "6.16.0"
+    assert calls == [([str(python), "-m", "PyInstaller", "--version"], 60)]
@@ -0,0 +1,55 @@
+import threading
+import time
+
+from path_existence import PathExistenceChecker
+
+
+def test_hung_path_times_out_without_holding_back_the_others(tmp_path):
+    present = tmp_path / "present.py"
+    present.write_text("", encoding="utf-8")
+    missing = str(tmp_path / "missing.py")
+    dead = str(tmp_path / "offline share" / "tool.py")
+
+    release = threading.Event()
+    probes = []
+
+    def probe(path):
+        probes.append(path)
+        if path == dead:
+            release.wait(5)
+            return True
+        return present.exists() if path == str(present) else False
+
+    checker = PathExistenceChecker(timeout_seconds=0.2, probe=probe)
+    started = time.monotonic()
+    results = checker.check([str(present), missing, dead])
+
+    assert time.monotonic() - started < 1.0
+    assert results == {str(present): True, missing: False, dead: None}
+
+    # Every answer, the timeout included, is reused until the TTL runs out.
+    assert checker.check([str(present), missing, dead]) == results
+    assert sorted(probes) == sorted([str(present), missing, dead])
+
+    release.set()
+    deadline = time.monotonic() + 2
+    while checker.cached([dead]).get(dead) is not True and time.monotonic() < deadline:
+        time.sleep(0.01)
+    assert checker.cached([dead]) == {dead: True}
+
+
+def test_expired_and_invalidated_entries_are_checked_again(tmp_path):
+    target = tmp_path / "script.py"
+    checker = PathExistenceChecker(ttl_seconds=0.05)
+
+    assert checker.check([str(target)]) == {str(target): False}
+    target.write_text("", encoding="utf-8")
+    assert checker.cached([str(target)]) == {str(target): False}
+
+    time.sleep(0.06)
+    assert checker.cached([str(target)]) == {}
+    assert checker.check([str(target)]) == {str(target): True}
+
+    target.unlink()
+    checker.invalidate([str(target)])
+    assert checker.check([str(target)]) == {str(target): False}
@@ -0,0 +1,77 @@
+import os
+
+from PySide6.QtCore import QEventLoop, QTimer
+from PySide6.QtWidgets import QApplication
+
+import path_watcher
+from path_watcher import PathWatcher
+
+
+def _qapp():
+    app = QApplication.instance()
+    if app is None:
+        app = QApplication([])
+    return app
+
+
+def run_in_loop(callback, wait_ms=300):
+    loop = QEventLoop()
+    QTimer.singleShot(0, callback)
+    QTimer.singleShot(wait_ms, loop.quit)
+    loop.exec()
+
+
+def test_only_the_tracked_paths_and_their_folders_are_watched(tmp_path):
+    _qapp()
+    script = tmp_path / "project" / "main.py"
+    script.parent.mkdir()
+    script.write_text("", encoding="utf-8")
+    output = tmp_path / "dist"
+    output.mkdir()
+    icon = tmp_path / "icons" / "app.ico"
+
+    watcher = PathWatcher()
+    watcher.track([str(script), str(output), str(icon), ""])
+
+    assert watcher.watched_paths() == {
+        str(script),
+        str(script.parent),
+        str(output),
+        str(tmp_path),
+    }
+
+    watcher.track([str(output)])
+    assert watcher.watched_paths() == {str(output), str(tmp_path)}
+
+
+def test_changes_are_pushed_and_lookups_do_not_stat_in_between(tmp_path, monkeypatch):
+    _qapp()
+    script = tmp_path / "main.py"
+    script.write_text("", encoding="utf-8")
+    missing_icon = tmp_path / "app.ico"
+
+    stats = []
+    stat_kind = path_watcher._stat_kind
+    monkeypatch.setattr(path_watcher, "_stat_kind", lambda p: stats.append(p) or stat_kind(p))
+
+    watcher = PathWatcher()
+    pushes = []
+    watcher.changed.connect(lambda: pushes.append(os.path.exists(script)))
+    seen = []
+
+    def look_then_change():
+        watcher.track([str(script), str(missing_icon)])
+        for _ in range(3):
+            seen.append((watcher.is_file(str(script)), watcher.is_file(str(missing_icon))))
+        assert len(stats) == 2
+        script.unlink()
+        missing_icon.write_bytes(b"")
+
+    run_in_loop(look_then_change)
+    assert seen == [(True, False)] * 3
+    assert pushes and pushes[-1] is False
+
+    stats.clear()
+    run_in_loop(lambda: seen.append((watcher.is_file(str(script)), watcher.is_file(str(missing_icon)))), wait_ms=20)
+    assert seen[-1] == (False, True)
+    assert stats == []
@@ -0,0 +1,96 @@
+import os
+
+from project_data_index import (
+    ProjectDataIndex,
+    normalize_data_file_patterns,
+)
+
+
+def make_icons(folder, count, suffix=".png"):
+    folder.mkdir(parents=True, exist_ok=True)
+    for index in range(count):
+        (folder / f"icon_{index:02d}{suffix}").write_bytes(b"png")
+
+
+def test_fully_covered_folders_collapse_to_one_entry(tmp_path):
+    make_icons(tmp_path / "Icons" / "Green", 6)
+    make_icons(tmp_path / "Icons" / "Red", 6)
+    make_icons(tmp_path / "Mixed", 8)
+    (tmp_path / "Mixed" / "notes.txt").write_text("keep out", encoding="utf-8")
+    (tmp_path / "main.py").write_text("print('hi')\n", encoding="utf-8")
+
+    scan = ProjectDataIndex().scan(tmp_path, ("*.png",), collapse_min_files=8)
+
+    assert (str(tmp_path / "Icons"), "Icons") in scan.entries
+    assert not any(source.startswith(str(tmp_path / "Icons") + os.sep) for source, _ in scan.entries)
+    mixed = [entry for entry in scan.entries if entry[1] == "Mixed"]
+    assert len(mixed) == 8
+    assert all(source.endswith(".png") for source, _ in mixed)
+
+
+def test_rescan_only_lists_folders_whose_mtime_changed(tmp_path):
+    make_icons(tmp_path / "Icons", 2)
+    make_icons(tmp_path / "Other", 1)
+    index = ProjectDataIndex()
+
+    first = index.scan(tmp_path)
+    second = index.scan(tmp_path)
+
+    assert first.directories_scanned == 3
+    assert second.directories_scanned == 0
+    assert second.directories_reused == 3
+    assert second.entries == first.entries
+
+    new_icon = tmp_path / "Icons" / "added.png"
+    new_icon.write_bytes(b"png")
+    os.utime(tmp_path / "Icons", ns=(1, 1))
+
+    third = index.scan(tmp_path)
+
+    assert third.directories_scanned == 1
+    assert (str(new_icon), "Icons") in third.entries
+
+
+def test_include_patterns_are_configurable(tmp_path):
+    (tmp_path / "theme.qss").write_text("QWidget {}", encoding="utf-8")
+    (tmp_path / "app.ICO").write_bytes(b"ico")
+    (tmp_path / "app.png").write_bytes(b"png")
+
+    patterns = normalize_data_file_patterns("*.ico; .qss")
+    scan = ProjectDataIndex().scan(tmp_path, patterns)
+
+    assert patterns == ("*.ico", "*.qss")
+    assert [os.path.basename(source) for source, _ in scan.entries] == ["app.ICO", "theme.qss"]
+    assert normalize_data_file_patterns([]) == ("*.png",)
+
+
+def test_index_round_trips_and_skips_unchanged_folders(tmp_path):
+    make_icons(tmp_path / "project" / "Icons", 2)
+    index = ProjectDataIndex()
+    index.scan(tmp_path / "project")
+    index_path = str(tmp_path / "index.json")
+
+    assert index.save(index_path) is True
+    assert index.save(index_path) is False
+
+    restored = ProjectDataIndex()
+    restored.load(index_path)
+    scan = restored.scan(tmp_path / "project")
+
+    assert scan.directories_scanned == 0
+    assert len(scan.entries) == 2
+
+
+def test_project_container_lookup_is_reused_until_a_folder_changes(tmp_path):
+    repo_root = tmp_path / "repo"
+    package_root = repo_root / "pkg"
+    package_root.mkdir(parents=True)
+    (repo_root / "pyproject.toml").write_text("[project]\n", encoding="utf-8")
+    index = ProjectDataIndex()
+
+    assert index.find_project_container(package_root) == os.path.normpath(str(repo_root))
+
+    (package_root / "requirements.txt").write_text("", encoding="utf-8")
+    os.utime(package_root, ns=(1, 1))
+
+    assert index.find_project_container(package_root) == os.path.normpath(str(package_root))
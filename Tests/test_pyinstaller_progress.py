@@ -0,0 +1,37 @@
+from pyinstaller_progress import PyInstallerLogParser
+
+
+def make_clock(*values):
+    values = list(values)
+    return lambda: values.pop(0) if len(values) > 1 else values[0]
+
+
+def test_parser_tracks_stages_forward_only_and_records_durations():
+    parser = PyInstallerLogParser(clock=make_clock(0.0, 1.0, 4.0, 6.0))
+
+    assert parser.feed("100 INFO: checking Analysis") is True
+    assert parser.feed("200 INFO: checking PYZ") is True
+    # A late "checking Analysis" must not move the stage backwards.
+    assert parser.feed("250 INFO: checking Analysis") is False
+    assert parser.feed("300 INFO: Building EXE from EXE-00.toc") is True
+
+    assert parser.progress.stage == "EXE"
+    assert parser.progress.stage_index == 3
+    assert parser.stage_durations == {"Analysis": 3.0, "PYZ": 2.0}
+
+
+def test_parser_counts_processed_modules_and_detects_completion():
+    parser = PyInstallerLogParser()
+
+    parser.feed("100 INFO: checking Analysis")
+    parser.feed("110 INFO: Processing standard module hook 'hook-PySide6.py'")
+    parser.feed("120 INFO: Processing pre-safe-import-module hook 'hook-six.moves.py'")
+    parser.feed("130 INFO: Analyzing hidden import 'psutil'")
+    parser.feed("140 INFO: Looking for dynamic libraries")
+
+    assert parser.progress.modules_processed == 3
+    assert parser.progress.summary == "Analysis (3 modules)"
+    assert parser.progress.lines_read == 5
+
+    assert parser.feed("900 INFO: Build complete! The results are available in: dist") is True
+    assert parser.progress.stage == "Done"
@@ -0,0 +1,92 @@
+import os
+
+import python_discovery
+from python_discovery import (
+    DISCOVERY_SOURCE_CONDA,
+    DISCOVERY_SOURCE_PATH,
+    DISCOVERY_SOURCE_PROGRAMS,
+    DISCOVERY_SOURCE_REGISTRY,
+    DISCOVERY_SOURCE_VENV,
+    PythonDiscovery,
+)
+
+
+def make_executable(path):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_bytes(b"")
+    return os.path.normpath(str(path))
+
+
+def fake_home(tmp_path, monkeypatch):
+    home = tmp_path / "home"
+    home.mkdir()
+    monkeypatch.setenv("HOME", str(home))
+    monkeypatch.setenv("USERPROFILE", str(home))
+    return home
+
+
+def test_discovery_covers_every_source_and_skips_duplicates(tmp_path, monkeypatch):
+    home = fake_home(tmp_path, monkeypatch)
+    programs = tmp_path / "Programs" / "Python"
+    python_313 = make_executable(programs / "Python313" / "python.exe")
+    registered = make_executable(tmp_path / "Registered" / "python.exe")
+    on_path = make_executable(tmp_path / "tools" / ("python.exe" if os.name == "nt" else "python"))
+    conda_env = make_executable(home / "miniconda3" / "envs" / "ml" / "python.exe")
+    listed_env = make_executable(tmp_path / "elsewhere" / "analysis" / "python.exe")
+    (home / ".conda").mkdir()
+    (home / ".conda" / "environments.txt").write_text(str(tmp_path / "elsewhere" / "analysis") + "\n", encoding="utf-8")
+    project_venv = make_executable(tmp_path / "project" / ".venv" / "Scripts" / "python.exe")
+    script = tmp_path / "project" / "src" / "app.py"
+    make_executable(script)
+
+    discovery = PythonDiscovery(registry_reader=lambda: [registered, python_313])
+    found = discovery.discover(
+        programs_root=programs,
+        script_paths=[str(script)],
+        environ={"PATH": str(tmp_path / "tools")},
+    )
+
+    assert [(item.executable, item.source) for item in found] == [
+        (python_313, DISCOVERY_SOURCE_PROGRAMS),
+        (registered, DISCOVERY_SOURCE_REGISTRY),
+        (on_path, DISCOVERY_SOURCE_PATH),
+        (conda_env, DISCOVERY_SOURCE_CONDA),
+        (listed_env, DISCOVERY_SOURCE_CONDA),
+        (project_venv, DISCOVERY_SOURCE_VENV),
+    ]
+
+
+def test_unchanged_folders_are_not_walked_again(tmp_path, monkeypatch):
+    fake_home(tmp_path, monkeypatch)
+    programs = tmp_path / "Programs" / "Python"
+    make_executable(programs / "Python312" / "python.exe")
+
+    scans = []
+    child_interpreters = python_discovery._child_interpreters
+
+    def counting_child_interpreters(folder):
+        scans.append(folder)
+        return child_interpreters(folder)
+
+    monkeypatch.setattr(python_discovery, "_child_interpreters", counting_child_interpreters)
+    discovery = PythonDiscovery(registry_reader=lambda: [])
+
+    def discover(instance):
+        return [
+            os.path.basename(os.path.dirname(item.executable))
+            for item in instance.discover(sources=(DISCOVERY_SOURCE_PROGRAMS,), programs_root=programs, environ={})
+        ]
+
+    assert discover(discovery) == ["Python312"]
+    assert discover(discovery) == ["Python312"]
+    assert len(scans) == 1
+
+    restored = PythonDiscovery(registry_reader=lambda: [])
+    restored.load_serialized(discovery.serialize())
+    assert discover(restored) == ["Python312"]
+    assert len(scans) == 1
+
+    make_executable(programs / "Python313" / "python.exe")
+    os.utime(programs, ns=(0, os.stat(programs).st_mtime_ns + 1_000_000_000))
+    assert discover(restored) == ["Python312", "Python313"]
+    assert len(scans) == 2
@@ -1,13 +1,24 @@
 import json
 import os
+import time
 import recent_controller
 from types import SimpleNamespace
 
-from PySide6.QtCore import Qt
+from PySide6.QtCore import QEventLoop, QTimer, Qt
+from PySide6.QtWidgets import QApplication
+
+from path_existence import BackgroundPathCheck, PathExistenceChecker
 
 from recent_controller import Colors, RecentController, _wrap_delete_confirmation_path
 
 
+def _qapp():
+    app = QApplication.instance()
+    if app is None:
+        app = QApplication([])
+    return app
+
+
 class DummyDropdownItem:
     def __init__(self):
         self._flags = Qt.ItemIsEnabled
@@ -185,6 +196,36 @@ def test_recent_dropdown_items_are_title_case_display_only(tmp_path):
     )
 
 
+def test_recent_dropdown_fills_before_background_check_prunes_missing_entries(monkeypatch, tmp_path):
+    kept = tmp_path / "kept" / "main.py"
+    kept.parent.mkdir()
+    kept.write_text("", encoding="utf-8")
+    removed = os.path.abspath(str(tmp_path / "removed" / "main.py"))
+    kept = os.path.abspath(str(kept))
+
+    checker = PathExistenceChecker(timeout_seconds=2, probe=lambda path: time.sleep(0.05) or os.path.isfile(path))
+    monkeypatch.setattr(recent_controller, "PATH_EXISTENCE", checker)
+    app = make_app(tmp_path, {"recent_scripts": [kept, removed]})
+    controller = RecentController(app)
+    controller._path_checks = BackgroundPathCheck(checker)
+
+    shown = []
+
+    def populate():
+        controller.populate_recent_dropdown()
+        shown.append([data for _text, data in app.recent_folder_dropdown.items[1:]])
+
+    _qapp()
+    loop = QEventLoop()
+    QTimer.singleShot(0, populate)
+    QTimer.singleShot(1000, loop.quit)
+    loop.exec()
+
+    assert shown[0] == [kept, removed]
+    assert [data for _text, data in app.recent_folder_dropdown.items[1:]] == [kept]
+    assert json.loads(app.state_ctrl.state_file.read_text(encoding="utf-8"))["recent_scripts"] == [kept]
+
+
 def test_delete_confirmation_path_keeps_short_path_unchanged():
     path = r"C:\Users\davey\Desktop"
 
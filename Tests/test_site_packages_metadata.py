@@ -0,0 +1,84 @@
+import json
+from types import SimpleNamespace
+
+import pytest
+
+from site_packages_metadata import (
+    MetadataReadError,
+    environment_fingerprint,
+    read_installed_distributions,
+    read_installed_packages_from_metadata,
+)
+
+
+def write_dist_info(site_packages, name, version, folder_name=None):
+    dist_info = site_packages / (folder_name or f"{name.replace('-', '_')}-{version}.dist-info")
+    dist_info.mkdir(parents=True)
+    (dist_info / "METADATA").write_text(
+        f"Metadata-Version: 2.1\nName: {name}\nVersion: {version}\n\nName: not-a-header\n",
+        encoding="utf-8",
+    )
+
+
+def test_reader_parses_dist_info_egg_info_and_first_path_wins(tmp_path):
+    user_site = tmp_path / "user-site"
+    site_packages = tmp_path / "site-packages"
+    write_dist_info(user_site, "Pillow", "11.1.0")
+    write_dist_info(site_packages, "pillow", "10.0.0")
+    write_dist_info(site_packages, "PySide6_Essentials", "6.9.0")
+    (site_packages / "legacy.egg-info").write_text("Name: legacy.pkg\nVersion: 0.1\n", encoding="utf-8")
+    egg = tmp_path / "tool-1.0-py3.13.egg"
+    (egg / "EGG-INFO").mkdir(parents=True)
+    (egg / "EGG-INFO" / "PKG-INFO").write_text("Name: tool\nVersion: 1.0\n", encoding="utf-8")
+
+    packages = read_installed_distributions(
+        [str(user_site), str(site_packages), str(egg), str(tmp_path / "python313.zip")]
+    )
+
+    assert packages == {
+        "pillow": {"name": "Pillow", "version": "11.1.0"},
+        "pyside6-essentials": {"name": "PySide6_Essentials", "version": "6.9.0"},
+        "legacy-pkg": {"name": "legacy.pkg", "version": "0.1"},
+        "tool": {"name": "tool", "version": "1.0"},
+    }
+
+
+def test_reader_probes_sys_path_once_and_rejects_empty_layouts(tmp_path):
+    site_packages = tmp_path / "site-packages"
+    write_dist_info(site_packages, "pip", "25.0")
+    commands = []
+
+    def run(command, timeout):
+        commands.append(command)
+        return SimpleNamespace(returncode=0, stdout=json.dumps(["", str(site_packages)]), stderr="")
+
+    packages = read_installed_packages_from_metadata("python.exe", run, timeout=5)
+
+    assert packages == {"pip": {"name": "pip", "version": "25.0"}}
+    assert len(commands) == 1
+
+    with pytest.raises(MetadataReadError):
+        read_installed_packages_from_metadata(
+            "python.exe",
+            lambda command, timeout: SimpleNamespace(returncode=0, stdout="[]", stderr=""),
+            timeout=5,
+        )
+
+
+def test_environment_fingerprint_tracks_install_records_only(tmp_path):
+    executable = tmp_path / "Python313" / "python.exe"
+    site_packages = executable.parent / "Lib" / "site-packages"
+    site_packages.mkdir(parents=True)
+    executable.write_bytes(b"")
+
+    before = environment_fingerprint(executable, "3.13.1")
+    (site_packages / "numpy").mkdir()
+    (site_packages / "numpy" / "core.py").write_text("", encoding="utf-8")
+    assert environment_fingerprint(executable, "3.13.1") != before
+
+    unchanged = environment_fingerprint(executable, "3.13.1")
+    (site_packages / "numpy" / "extra.py").write_text("", encoding="utf-8")
+    assert environment_fingerprint(executable, "3.13.1") == unchanged
+
+    write_dist_info(site_packages, "numpy", "2.3.0")
+    assert environment_fingerprint(executable, "3.13.1") != unchanged
@@ -0,0 +1,81 @@
+import os
+
+import pytest
+
+from spec_writer import SpecConversionError, build_spec_command
+
+
+def make_cmd(tmp_path, *extra):
+    return [
+        "python",
+        "-m",
+        "PyInstaller",
+        "--onedir",
+        "--clean",
+        "--noconfirm",
+        "--collect-all=qt_material",
+        "--windowed",
+        "--hidden-import=pynput",
+        f"--distpath={tmp_path}",
+        f"--workpath={tmp_path / 'build' / 'App'}",
+        f"--specpath={tmp_path / 'spec' / 'App'}",
+        "--name=App",
+        f"--paths={tmp_path / 'project'}",
+        f"--add-data={tmp_path / 'project' / 'Icons'}{os.pathsep}Icons",
+        "--runtime-hook",
+        str(tmp_path / "hook.py"),
+        "--add-data",
+        f"{tmp_path / 'app.ico'}{os.pathsep}_exe_builder_tray_icon.ico",
+        "--icon",
+        str(tmp_path / "app.ico"),
+        *extra,
+        str(tmp_path / "project" / "main.py"),
+    ]
+
+
+def test_build_spec_command_writes_spec_and_short_command(tmp_path):
+    spec = build_spec_command(make_cmd(tmp_path))
+
+    spec_file = tmp_path / "spec" / "App" / "App.spec"
+    assert spec.spec_file == str(spec_file)
+    assert spec.written is True
+    assert spec.cmd == [
+        "python",
+        "-m",
+        "PyInstaller",
+        "--noconfirm",
+        "--clean",
+        f"--distpath={tmp_path}",
+        f"--workpath={tmp_path / 'build' / 'App'}",
+        str(spec_file),
+    ]
+
+    text = spec_file.read_text(encoding="utf-8")
+    compile(text, str(spec_file), "exec")
+    assert repr((str(tmp_path / "project" / "Icons"), "Icons")) in text
+    assert repr(str(tmp_path / "hook.py")) in text
+    assert f"icon={[str(tmp_path / 'app.ico')]!r}" in text
+    assert "console=False" in text
+    assert "for package in ['qt_material']:" in text
+
+
+def test_unchanged_options_leave_spec_untouched(tmp_path):
+    first = build_spec_command(make_cmd(tmp_path))
+    os.utime(first.spec_file, ns=(1, 1))
+
+    second = build_spec_command(make_cmd(tmp_path))
+    assert second.written is False
+    assert second.digest == first.digest
+    assert os.stat(first.spec_file).st_mtime_ns == 1
+
+    third = build_spec_command(make_cmd(tmp_path, "--hidden-import=psutil"))
+    assert third.written is True
+    assert third.digest != first.digest
+
+
+def test_options_without_spec_equivalent_are_rejected(tmp_path):
+    with pytest.raises(SpecConversionError):
+        build_spec_command(make_cmd(tmp_path, "--onefile"))
+
+    with pytest.raises(SpecConversionError):
+        build_spec_command(["python", "app.py"])
@@ -8,6 +8,8 @@ from datetime_build_options import (
     UK_MASS_DATETIME_BUILD_SENTINEL,
     USA_MASS_DATETIME_BUILD_SENTINEL,
 )
+from environment_profile_cache import PROFILE_CACHE_FILE_NAME, read_profile_cache
+from environment_sync_controller import EnvironmentSyncController, PythonEnvironmentProfile
 from state_controller import StateController
 
 
@@ -58,18 +60,8 @@ class DummyValidator:
         pass
 
 
-class DummyEnvironmentSyncController:
-    def __init__(self, profiles=None):
-        self.profiles = profiles if profiles is not None else []
-        self.loaded_profiles = None
-        self.update_ui = None
-
-    def serialize_profiles(self):
-        return self.profiles
-
-    def load_serialized_profiles(self, profiles, update_ui=True):
-        self.loaded_profiles = profiles
-        self.update_ui = update_ui
+def make_environment_sync_controller():
+    return EnvironmentSyncController(wheelhouse_dir="", sync_log_path="")
 
 
 class DummyDropdownItem:
@@ -160,27 +152,28 @@ def test_save_state_writes_current_values_and_preserves_recents(monkeypatch, tmp
     assert data["open_output_dir_after_build_enabled"] is False
 
 
-def test_save_state_writes_environment_sync_profiles(monkeypatch, tmp_path):
+def test_save_state_writes_environment_sync_profiles_to_their_cache_file(monkeypatch, tmp_path):
     monkeypatch.setenv("LOCALAPPDATA", str(tmp_path))
-    env_sync_profiles = [
-        {
-            "version": "3.13",
-            "executable": "C:/Python313/python.exe",
-            "packages": {"numpy": {"name": "numpy", "version": "2.3.0"}},
-            "error": "",
-        }
-    ]
-    app = make_app(
-        environment_sync_controller=DummyEnvironmentSyncController(env_sync_profiles)
-    )
+    env_sync_controller = make_environment_sync_controller()
+    app = make_app(environment_sync_controller=env_sync_controller)
 
     controller = StateController(app)
+    controller.load_state()
+    env_sync_controller.last_plan = env_sync_controller.build_sync_plan([
+        PythonEnvironmentProfile(
+            version="3.13",
+            executable="C:/Python313/python.exe",
+            packages={"numpy": {"name": "numpy", "version": "2.3.0"}},
+        )
+    ])
     controller.save_state()
 
     with open(controller._state_file_path(), "r", encoding="utf-8") as state_file:
         data = json.load(state_file)
 
-    assert data["env_sync_profiles"] == env_sync_profiles
+    assert "env_sync_profiles" not in data
+    cache_path = os.path.join(os.path.dirname(controller._state_file_path()), PROFILE_CACHE_FILE_NAME)
+    assert read_profile_cache(cache_path) == env_sync_controller.serialize_profiles()
 
 
 def test_save_state_preserves_remembered_non_desktop_output_when_output_is_desktop(monkeypatch, tmp_path):
@@ -306,7 +299,7 @@ def test_load_state_restores_open_output_directory_toggle(monkeypatch, tmp_path)
     assert app.open_output_dir_after_build.checked is True
 
 
-def test_load_state_restores_environment_sync_profiles(monkeypatch, tmp_path):
+def test_load_state_migrates_inline_environment_sync_profiles(monkeypatch, tmp_path):
     monkeypatch.setenv("LOCALAPPDATA", str(tmp_path))
     env_sync_profiles = [
         {
@@ -316,7 +309,7 @@ def test_load_state_restores_environment_sync_profiles(monkeypatch, tmp_path):
             "error": "",
         }
     ]
-    env_sync_controller = DummyEnvironmentSyncController()
+    env_sync_controller = make_environment_sync_controller()
     app = make_app(
         tooltips_checkbox=DummyCheckbox(),
         close_after_build=DummyCheckbox(),
@@ -339,8 +332,14 @@ def test_load_state_restores_environment_sync_profiles(monkeypatch, tmp_path):
 
     controller.load_state()
 
-    assert env_sync_controller.loaded_profiles == env_sync_profiles
-    assert env_sync_controller.update_ui is True
+    assert env_sync_controller.last_plan is None
+    plan = env_sync_controller.ensure_profiles_loaded(update_ui=False)
+    assert [profile.version for profile in plan.profiles] == ["3.13"]
+    assert plan.profiles[0].packages == env_sync_profiles[0]["packages"]
+
+    controller.save_state()
+    with open(state_path, "r", encoding="utf-8") as state_file:
+        assert "env_sync_profiles" not in json.load(state_file)
 
 
 def test_load_state_restores_no_datetime_appended_selection(monkeypatch, tmp_path):
@@ -0,0 +1,88 @@
+import json
+import os
+
+from PySide6.QtCore import QEventLoop, QTimer
+from PySide6.QtWidgets import QApplication
+
+import state_store
+from state_store import StateStore
+
+
+def _qapp():
+    app = QApplication.instance()
+    if app is None:
+        app = QApplication([])
+    return app
+
+
+def counting_writes(monkeypatch):
+    writes = []
+    write_state_file = state_store._write_state_file
+
+    def record(path, text):
+        writes.append(json.loads(text))
+        write_state_file(path, text)
+
+    monkeypatch.setattr(state_store, "_write_state_file", record)
+    return writes
+
+
+def test_reads_are_served_from_memory_until_the_file_changes(tmp_path, monkeypatch):
+    path = tmp_path / "state.json"
+    path.write_text(json.dumps({"recent_scripts": ["a.py"]}), encoding="utf-8")
+
+    reads = []
+    read_state_file = state_store._read_state_file
+    monkeypatch.setattr(state_store, "_read_state_file", lambda p: reads.append(p) or read_state_file(p))
+
+    store = StateStore()
+    assert store.open(str(path))["recent_scripts"] == ["a.py"]
+    store.update(str(path), {"recent_icons": ["icon.ico"]})
+    assert store.open(str(path))["recent_icons"] == ["icon.ico"]
+    assert len(reads) == 1
+
+    path.write_text(json.dumps({"recent_scripts": ["edited elsewhere.py"]}), encoding="utf-8")
+    assert store.open(str(path)) == {"recent_scripts": ["edited elsewhere.py"]}
+    assert len(reads) == 2
+
+
+def test_writes_inside_the_delay_reach_the_disk_once(tmp_path, monkeypatch):
+    _qapp()
+    path = str(tmp_path / "state.json")
+    writes = counting_writes(monkeypatch)
+    store = StateStore(write_delay_ms=20)
+
+    def burst():
+        store.update(path, {"recent_scripts": ["a.py"]})
+        store.update(path, {"recent_icons": ["icon.ico"]})
+        store.replace(path, {**store.open(path), "last_exe_name": "Builder"})
+
+    loop = QEventLoop()
+    QTimer.singleShot(0, burst)
+    QTimer.singleShot(300, loop.quit)
+    loop.exec()
+
+    assert writes == [{"recent_scripts": ["a.py"], "recent_icons": ["icon.ico"], "last_exe_name": "Builder"}]
+    assert not store.pending
+    with open(path, "r", encoding="utf-8") as f:
+        assert json.load(f) == writes[0]
+
+
+def test_failed_write_keeps_the_previous_file_and_stays_pending(tmp_path, monkeypatch):
+    path = tmp_path / "state.json"
+    path.write_text(json.dumps({"last_exe_name": "Old"}), encoding="utf-8")
+    store = StateStore()
+
+    def refuse(_source, _target):
+        raise OSError("disk full")
+
+    monkeypatch.setattr(state_store.os, "replace", refuse)
+    store.update(str(path), {"last_exe_name": "New"})
+
+    assert json.loads(path.read_text(encoding="utf-8")) == {"last_exe_name": "Old"}
+    assert os.listdir(tmp_path) == ["state.json"]
+    assert store.pending
+
+    monkeypatch.undo()
+    assert store.flush()
+    assert json.loads(path.read_text(encoding="utf-8")) == {"last_exe_name": "New"}
@@ -416,3 +416,90 @@ def test_exe_refresh_disabled_without_valid_script(monkeypatch, tmp_path):
     assert app.refresh_btn.enabled is False
     assert app.refresh_btn.text == ""
     assert app.refresh_btn.stylesheet == build_disabled_button()
+
+
+def test_back_to_back_updates_apply_once_per_event_loop_turn(monkeypatch, tmp_path):
+    from PySide6.QtCore import QEventLoop, QTimer
+    from PySide6.QtWidgets import QApplication
+
+    if QApplication.instance() is None:
+        QApplication([])
+
+    monkeypatch.setattr(validation_controller, "QCheckBox", DummyCheckbox)
+    app = make_app(tmp_path, exe_name="")
+    controller = ValidationController(app)
+
+    passes = []
+    apply_ui_state = controller._apply_ui_state
+    controller._scheduler._callback = lambda: passes.append(app.exe_name_input.text()) or apply_ui_state()
+
+    def type_name():
+        for typed in ("m", "ma", "mai", "main"):
+            app.exe_name_input.setText(typed)
+            controller.update_ui_state()
+        assert passes == []
+
+    loop = QEventLoop()
+    QTimer.singleShot(0, type_name)
+    QTimer.singleShot(50, loop.quit)
+    loop.exec()
+
+    assert passes == ["main"]
+    assert app.refresh_btn.enabled is False
+    assert app.exe_name_input.stylesheet == line_edit_style(Colors.SUCCESS)
+
+
+def test_flush_applies_a_pending_pass_straight_away(monkeypatch, tmp_path):
+    from PySide6.QtCore import QEventLoop, QTimer
+    from PySide6.QtWidgets import QApplication
+
+    if QApplication.instance() is None:
+        QApplication([])
+
+    monkeypatch.setattr(validation_controller, "QCheckBox", DummyCheckbox)
+    app = make_app(tmp_path, exe_name="")
+    controller = ValidationController(app)
+    seen = []
+
+    def type_then_flush():
+        app.exe_name_input.setText("main")
+        controller.update_ui_state()
+        seen.append(app._was_build_ready)
+        controller.flush_ui_state()
+        seen.append(app._was_build_ready)
+
+    loop = QEventLoop()
+    QTimer.singleShot(0, type_then_flush)
+    QTimer.singleShot(50, loop.quit)
+    loop.exec()
+
+    assert seen == [False, True]
+
+
+def test_deleting_the_script_revalidates_without_a_handler_call(monkeypatch, tmp_path):
+    from PySide6.QtCore import QEventLoop, QTimer
+    from PySide6.QtWidgets import QApplication
+
+    if QApplication.instance() is None:
+        QApplication([])
+
+    monkeypatch.setattr(validation_controller, "QCheckBox", DummyCheckbox)
+    app = make_app(tmp_path, exe_name="main")
+    app.build_btn = SimpleNamespace(
+        setEnabled=lambda value: setattr(app, "build_enabled", value),
+        setText=lambda value: None,
+        setStyleSheet=lambda value: None,
+        clicked=SimpleNamespace(connect=lambda slot: None, disconnect=lambda: None),
+    )
+    app.build_controller = SimpleNamespace(build_exe=lambda: None)
+    controller = ValidationController(app)
+
+    loop = QEventLoop()
+    QTimer.singleShot(0, controller.update_ui_state)
+    QTimer.singleShot(50, lambda: os.remove(app.entry_script))
+    QTimer.singleShot(400, loop.quit)
+    loop.exec()
+
+    assert app.build_enabled is False
+    assert app.script_path_input.stylesheet == line_edit_style(Colors.ERROR)
+    assert app.status_label.text == "Missing required inputs."
@@ -0,0 +1,61 @@
+from PySide6.QtCore import QEventLoop, QTimer
+from PySide6.QtWidgets import QApplication
+
+from validation_scheduler import StyleBatch, ValidationScheduler
+
+
+def _qapp():
+    app = QApplication.instance()
+    if app is None:
+        app = QApplication([])
+    return app
+
+
+def run_in_loop(callback, wait_ms=300):
+    loop = QEventLoop()
+    QTimer.singleShot(0, callback)
+    QTimer.singleShot(wait_ms, loop.quit)
+    loop.exec()
+
+
+def test_requests_in_one_turn_share_a_single_recompute():
+    _qapp()
+    runs = []
+    scheduler = ValidationScheduler(lambda: runs.append(len(runs)))
+
+    # Without a running loop every request is applied straight away.
+    scheduler.request()
+    scheduler.request()
+    assert runs == [0, 1]
+
+    def burst():
+        for _ in range(5):
+            scheduler.request()
+        assert scheduler.pending
+
+    run_in_loop(burst, wait_ms=50)
+    assert runs == [0, 1, 2]
+    assert not scheduler.pending
+
+
+def test_style_batch_applies_the_last_changed_sheet_once():
+    _qapp()
+    from PySide6.QtWidgets import QPushButton
+
+    button = QPushButton()
+    button.setStyleSheet("color: red;")
+    applied = []
+    set_style_sheet = button.setStyleSheet
+    button.setStyleSheet = lambda sheet: applied.append(sheet) or set_style_sheet(sheet)
+
+    batch = StyleBatch()
+    batch.set(button, "color: blue;")
+    batch.set(button, "color: red;")
+    batch.apply()
+    assert applied == []
+
+    batch.set(button, "")
+    batch.set(button, "color: green;")
+    batch.apply()
+    assert applied == ["color: green;"]
+    assert button.styleSheet() == "color: green;"
@@ -2,6 +2,19 @@ import os
 import psutil
 import send2trash
 
+def kill_process_tree(process):
+    if process is None or process.poll() is not None:
+        return
+
+    try:
+        parent = psutil.Process(process.pid)
+        for child in parent.children(recursive=True):
+            child.kill()
+        parent.kill()
+    except Exception as e:
+        print("Kill process error:", e)
+
+
 class BuildCancellation:
     def __init__(self, app, ui):
         """
@@ -22,14 +35,8 @@ class BuildCancellation:
     def cancel_build(self):
 
         # Kill PyInstaller and children
-        if self.app.build_process and self.app.build_process.poll() is None:
-            try:
-                parent = psutil.Process(self.app.build_process.pid)
-                for child in parent.children(recursive=True):
-                    child.kill()
-                parent.kill()
-            except Exception as e:
-                print("Kill process error:", e)
+        for process in self._running_build_processes():
+            kill_process_tree(process)
 
         # Trash known build outputs
         for path in self.app.current_build_paths:
@@ -66,6 +73,17 @@ class BuildCancellation:
             self.app.validation_controller.validation_status_message()
         
 
+    def _running_build_processes(self):
+        processes = []
+        controller = getattr(self.app, "build_controller", None)
+        if controller is not None and hasattr(controller, "running_build_processes"):
+            processes.extend(controller.running_build_processes())
+
+        if self.app.build_process and self.app.build_process not in processes:
+            processes.append(self.app.build_process)
+
+        return processes
+
     def abort_build(self, message):
         try:
             with open(self.app.debug_log_path, "a", encoding="utf-8") as f:
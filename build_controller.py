@@ -1,4 +1,5 @@
-import datetime,os,sys,subprocess,time,warnings
+import datetime,os,sys,subprocess,threading,time,warnings
+from collections import deque
 from PySide6.QtGui import QFont
 from bundle_validation import validate_bundle_inputs
 from datetime_build_options import (
@@ -17,10 +18,51 @@ from PySide6.QtCore import QObject, Signal,QTimer
 from PySide6.QtCore import QThread
 from pathlib import Path
 import shutil
+from types import SimpleNamespace
+from build_fingerprint import (
+    IncrementalBuildDecision,
+    clear_build_fingerprint,
+    compute_build_fingerprint,
+    decide_incremental_build,
+    read_build_fingerprint,
+    write_build_fingerprint,
+)
+from build_jobs import (
+    BUILD_JOB_CANCELLED,
+    BUILD_JOB_STAMPED,
+    BUILD_JOB_STOPPED,
+    BUILD_JOB_SUCCEEDED,
+    BUILD_STAGE_PREBUILD,
+    BUILD_STAGE_PYINSTALLER,
+    BuildJob,
+    PrebuildRequest,
+    PrebuildResult,
+    VariantStamp,
+    mass_build_concurrency,
+)
 from build_icon_contract import (
     clear_output_folder_icon_metadata,
     resolve_build_icon_contract,
 )
+from build_report import (
+    BuildReport,
+    PhaseClock,
+    ProcessTreeSampler,
+    append_build_report,
+    build_report_path,
+    measure_output,
+)
+from build_history import BUILD_HISTORY, BUILD_HISTORY_PREBUILD_STAGE
+from spec_writer import SPEC_FILE_SUFFIX, SpecConversionError, build_spec_command
+from build_variants import VariantStampError, stamp_build_variant
+from event_loop import event_loop_running
+from interpreter_cache import INTERPRETER_CAPABILITIES
+from project_data_index import (
+    DEFAULT_DATA_FILE_PATTERNS,
+    PROJECT_DATA_INDEX,
+    normalize_data_file_patterns,
+)
+from pyinstaller_progress import PyInstallerLogParser
 from styles import Colors, status_text_style
 
 CREATE_NO_WINDOW = 0x08000000
@@ -41,6 +83,15 @@ MASS_DATETIME_BUILD_SENTINELS = {
     USA_MASS_DATETIME_BUILD_SENTINEL,
 }
 
+# Only the end of PyInstaller's output is kept in memory; the full stream goes
+# straight to the debug log.
+BUILD_OUTPUT_TAIL_LINES = 200
+BUILD_PROGRESS_INTERVAL_SECONDS = 0.25
+ETA_TICK_INTERVAL_MS = 500
+# Rough cost of stamping one Build All variant from the template build.
+STAMP_SECONDS_PER_VARIANT = 1.0
+
+
 def _write_debug_log_banner(file, title):
     file.write(f"=== {title} ===\n\n")
 
@@ -52,15 +103,12 @@ def _write_debug_log_section(file, title, lines):
     file.write("\n")
 
 
-def _write_debug_log_stderr(file, stderr):
-    file.write("  STDERR:\n")
-    for line in (stderr or "<empty>").splitlines():
-        file.write(f"    {line}\n")
-    file.write("\n")
-
-
 class BuildController(QObject):
-    build_complete_signal = Signal(int, str, str)
+    build_complete_signal = Signal(int, str, str, object)
+    prebuild_progress_signal = Signal(object, str)
+    prebuild_complete_signal = Signal(object, object)
+    build_progress_signal = Signal(object, object)
+    stamp_complete_signal = Signal(object, object)
 
     def __init__(self, app):
         super().__init__()
@@ -75,10 +123,23 @@ class BuildController(QObject):
         self._mass_datetime_debug_log_prefix = "EXE_BUILDER_BUILD_ALL_DEBUG"
         self._mass_datetime_log_title = "DATE/TIME"
         self._mass_datetime_output_group = []
+        self._mass_datetime_concurrency = 1
+        self._mass_datetime_completed = 0
+        self._mass_datetime_results = []
+        self._mass_datetime_stamping = False
+        self._stamp_cancel_event = None
+        self._stamp_worker = None
+        self._build_jobs = []
+        self._retained_threads = set()
+        self._eta_timer = None
         self.build_thread = None
         self.worker = None
 
         self.build_complete_signal.connect(self._on_build_complete_ui)
+        self.prebuild_progress_signal.connect(self._on_prebuild_progress)
+        self.prebuild_complete_signal.connect(self._on_prebuild_finished)
+        self.build_progress_signal.connect(self._on_build_progress)
+        self.stamp_complete_signal.connect(self._on_variant_stamping_finished)
 
     # ============================================================
     # MASS DATE/TIME BUILD QUEUE
@@ -184,19 +245,207 @@ class BuildController(QObject):
         self._mass_datetime_debug_log_path = ""
         self._mass_datetime_debug_log_prefix = debug_log_prefix
         self._mass_datetime_log_title = log_title
+        self._mass_datetime_concurrency = self._mass_build_concurrency(self._mass_datetime_total)
+        self._mass_datetime_stamping = (
+            getattr(app, "mass_build_stamp_variants_enabled", False)
+            and self._mass_datetime_total > 1
+        )
+        if self._mass_datetime_stamping:
+            # The first variant is the template every other variant is copied from.
+            self._mass_datetime_concurrency = 1
+        self._mass_datetime_completed = 0
+        self._mass_datetime_results = []
         self._reset_mass_datetime_output_group()
         self._mass_datetime_active = True
         app.mass_datetime_build_selected = True
 
         self._run_next_mass_datetime_build()
 
+    def _mass_build_concurrency(self, job_count):
+        return mass_build_concurrency(job_count)
+
     def _run_next_mass_datetime_build(self):
-        if not self._mass_datetime_queue:
+        # Each variant has its own --name, so its work/spec/dist folders never
+        # overlap and several PyInstaller processes can run side by side.
+        while (
+            self._mass_datetime_active
+            and self._mass_datetime_queue
+            and len(self._running_build_jobs()) < self._mass_datetime_concurrency
+        ):
+            label, datetime_format = self._mass_datetime_queue.pop(0)
+            self._apply_datetime_build_option(label, datetime_format)
+            self._start_build()
+
+    def _stamp_mass_datetime_variants(self, template_job):
+        # Variant names come from the UI, so they are worked out here; the
+        # hard-linking and copying runs in a worker and reports back through
+        # stamp_complete_signal.
+        app = self.app
+        self._mass_datetime_stamping = False
+
+        template_dir = template_job.output_paths[0]
+        script = app.script_path_input.text().strip()
+        script = os.path.normpath(script) if script else ""
+        exe_name = app.exe_name_input.text().strip()
+
+        variants = []
+        for label, datetime_format in self._mass_datetime_queue:
+            self._apply_datetime_build_option(label, datetime_format)
+            variant_name = self._final_exe_name(script, exe_name)
+            variants.append(
+                VariantStamp(
+                    label=label,
+                    datetime_format=datetime_format,
+                    job=BuildJob(
+                        label=label,
+                        final_exe_name=variant_name,
+                        build_path="",
+                        output_paths=[os.path.join(os.path.dirname(template_dir), variant_name)],
+                        debug_log_path=template_job.debug_log_path,
+                    ),
+                )
+            )
+        self._mass_datetime_queue = []
+
+        cancel_event = threading.Event()
+        self._stamp_cancel_event = cancel_event
+        app.set_status(f"Stamping {len(variants)} variants...")
+
+        if not event_loop_running():
+            self._on_variant_stamping_finished(
+                template_job,
+                self._run_variant_stamping(template_job, variants, cancel_event),
+            )
+            return
+
+        thread = QThread()
+        worker = VariantStampWorker(self, template_job, variants, cancel_event)
+        self._stamp_worker = worker
+        self._retain_thread(thread)
+
+        worker.moveToThread(thread)
+        thread.started.connect(worker.run)
+        worker.finished.connect(
+            lambda stamps, job=template_job: self.stamp_complete_signal.emit(job, stamps)
+        )
+
+        worker.finished.connect(thread.quit)
+        worker.finished.connect(worker.deleteLater)
+        thread.finished.connect(thread.deleteLater)
+
+        thread.start()
+
+    def _run_variant_stamping(self, template_job, variants, cancel_event):
+        # Runs off the GUI thread; touches only the file system.
+        template_dir = template_job.output_paths[0]
+        for variant in variants:
+            if cancel_event.is_set():
+                break
+
+            try:
+                clear_output_folder_icon_metadata(variant.job.output_paths[0])
+            except Exception:
+                pass
+
+            try:
+                variant.stamped = stamp_build_variant(
+                    template_dir,
+                    template_job.final_exe_name,
+                    variant.job.final_exe_name,
+                )
+            except VariantStampError as e:
+                variant.error = str(e)
+        return variants
+
+    def _on_variant_stamping_finished(self, template_job, variants):
+        app = self.app
+        cancel_event, self._stamp_cancel_event = self._stamp_cancel_event, None
+        self._stamp_worker = None
+        if getattr(app, "_is_closing", False):
+            return
+        if cancel_event is None or cancel_event.is_set() or not self._mass_datetime_active:
+            self._finish_cancelled_build()
+            return
+
+        template_dir = template_job.output_paths[0]
+        rebuild_queue = []
+        for variant in variants:
+            if variant.stamped is None:
+                # _apply_datetime_build_option runs again when it is rebuilt.
+                self._mass_datetime_index -= 1
+                rebuild_queue.append((variant.label, variant.datetime_format))
+                self._write_stamp_log(variant.label, [f"FALLBACK=rebuild ({variant.error})"])
+                continue
+
+            variant_job = variant.job
+            variant_job.status = BUILD_JOB_STAMPED
+            variant_job.finish(0)
+            self._mass_datetime_completed += 1
+            self._record_mass_datetime_result(variant_job)
+            self._remember_mass_datetime_output_group(variant_job)
+            self._write_stamp_log(
+                variant.label,
+                [
+                    f"SOURCE={template_dir}",
+                    f"TARGET={variant.stamped.target_dir}",
+                    f"HARDLINKED_FILES={variant.stamped.linked_files}",
+                    f"COPIED_FILES={variant.stamped.copied_files}",
+                ],
+            )
+
+        self._mass_datetime_queue = rebuild_queue
+        if rebuild_queue:
+            self._mass_datetime_concurrency = self._mass_build_concurrency(len(rebuild_queue))
+
+        self._finish_build_completion(0, template_job)
+
+    def _write_stamp_log(self, label, lines):
+        debug_log_path = self._mass_datetime_debug_log_path
+        if not debug_log_path:
             return
 
-        label, datetime_format = self._mass_datetime_queue.pop(0)
-        self._apply_datetime_build_option(label, datetime_format)
-        self.build_exe(None)
+        try:
+            with open(debug_log_path, "a", encoding="utf-8") as f:
+                _write_debug_log_section(f, "Stamped Variant", [f"OUTPUT={label}", *lines])
+        except OSError:
+            pass
+
+    def _mass_datetime_progress_text(self):
+        running = len(self._running_build_jobs())
+        text = (
+            f"Mass build {self._mass_datetime_completed}/"
+            f"{self._mass_datetime_total} complete"
+        )
+        if running:
+            text += f", {running} running"
+        return text
+
+    def _record_mass_datetime_result(self, job):
+        if job is None:
+            return
+        self._mass_datetime_results.append(
+            (job.label or job.final_exe_name, job.status, int(job.elapsed_seconds))
+        )
+
+    def _write_mass_datetime_summary(self):
+        if not self._mass_datetime_results or not self._mass_datetime_debug_log_path:
+            return
+
+        try:
+            with open(self._mass_datetime_debug_log_path, "a", encoding="utf-8") as f:
+                _write_debug_log_section(
+                    f,
+                    "Mass Build Summary",
+                    [
+                        f"CONCURRENCY={self._mass_datetime_concurrency}",
+                        *(
+                            f"{label}: {status} ({seconds}s)"
+                            for label, status, seconds in self._mass_datetime_results
+                        ),
+                    ],
+                )
+        except OSError:
+            pass
 
     def _restore_mass_datetime_state(self):
         app = self.app
@@ -222,9 +471,13 @@ class BuildController(QObject):
     def _reset_mass_datetime_output_group(self):
         self._mass_datetime_output_group = []
 
-    def _remember_mass_datetime_output_group(self):
-        paths = list(getattr(self.app, "current_build_paths", []) or [])
-        debug_log_path = getattr(self.app, "debug_log_path", "")
+    def _remember_mass_datetime_output_group(self, job=None):
+        if job is not None:
+            paths = list(job.output_paths)
+            debug_log_path = job.debug_log_path
+        else:
+            paths = list(getattr(self.app, "current_build_paths", []) or [])
+            debug_log_path = getattr(self.app, "debug_log_path", "")
         if debug_log_path:
             paths.append(debug_log_path)
 
@@ -247,6 +500,11 @@ class BuildController(QObject):
             self.app.current_build_paths = list(self._mass_datetime_output_group)
 
     def _finish_mass_datetime_build(self, clear_output_group=True):
+        self._write_mass_datetime_summary()
+        self._mass_datetime_results = []
+        self._mass_datetime_completed = 0
+        self._mass_datetime_concurrency = 1
+        self._mass_datetime_stamping = False
         self._mass_datetime_queue = []
         self._mass_datetime_total = 0
         self._mass_datetime_index = 0
@@ -266,6 +524,9 @@ class BuildController(QObject):
     def _abort_current_build(self, message):
         app = self.app
         app.build_cancellation.abort_build(message)
+
+        if self._mass_datetime_active:
+            self._stop_running_build_jobs()
         self.stop_eta()
         app.building = False
         app.build_process = None
@@ -308,8 +569,13 @@ class BuildController(QObject):
         if self._mass_datetime_active:
             self._finish_mass_datetime_build()
 
-        thread = getattr(self, "build_thread", None)
-        if thread is not None:
+        for job in self._build_jobs:
+            job.cancel_event.set()
+
+        threads = [job.thread for job in self._build_jobs]
+        threads.extend(self._retained_threads)
+        threads.append(getattr(self, "build_thread", None))
+        for thread in dict.fromkeys(thread for thread in threads if thread is not None):
             try:
                 is_running = thread.isRunning() if hasattr(thread, "isRunning") else True
                 if is_running:
@@ -321,9 +587,69 @@ class BuildController(QObject):
 
         app.building = False
         app.build_process = None
+        self._build_jobs = []
+        self._retained_threads.clear()
         self.build_thread = None
         self.worker = None
 
+    # ============================================================
+    # BUILD JOBS
+    # ============================================================
+
+    def _running_build_jobs(self):
+        return [job for job in self._build_jobs if job.is_running]
+
+    def _build_in_progress(self):
+        return bool(
+            self.app.build_process
+            or self._running_build_jobs()
+            or self._stamp_cancel_event is not None
+        )
+
+    def _prebuilding_build_jobs(self):
+        return [job for job in self._running_build_jobs() if job.stage == BUILD_STAGE_PREBUILD]
+
+    def running_build_processes(self):
+        return [job.process for job in self._running_build_jobs() if job.process is not None]
+
+    def _running_build_process(self):
+        processes = self.running_build_processes()
+        return processes[0] if processes else None
+
+    def _running_build_paths(self):
+        paths = []
+        for job in self._running_build_jobs():
+            for path in job.output_paths:
+                if path not in paths:
+                    paths.append(path)
+        return paths
+
+    def _mark_running_build_jobs(self, status):
+        jobs = self._running_build_jobs()
+        for job in jobs:
+            job.status = status
+        return jobs
+
+    def _stop_running_build_jobs(self):
+        from build_cancellation import kill_process_tree
+
+        for job in self._mark_running_build_jobs(BUILD_JOB_STOPPED):
+            job.cancel_event.set()
+            kill_process_tree(job.process)
+
+    def _take_finished_build_job(self, ret, job):
+        if job is None:
+            # Direct callers without a job finish the oldest running build.
+            job = next(iter(self._running_build_jobs()), None)
+
+        if job is None:
+            return None
+
+        job.finish(ret)
+        if job in self._build_jobs:
+            self._build_jobs.remove(job)
+        return job
+
     # ============================================================
     # ETA LOOP
     # ============================================================
@@ -331,29 +657,94 @@ class BuildController(QObject):
         self.app._eta_running = True
         self._tick_eta()
 
+        # One fixed-rate timer drives the label for the whole build, however
+        # many variants are running.
+        if self._eta_timer is None:
+            self._eta_timer = QTimer(self)
+            self._eta_timer.setInterval(ETA_TICK_INTERVAL_MS)
+            self._eta_timer.timeout.connect(self._tick_eta)
+        if not self._eta_timer.isActive():
+            self._eta_timer.start()
+
     def stop_eta(self):
         self.app._eta_running = False
+        if self._eta_timer is not None:
+            self._eta_timer.stop()
+
+    def _job_remaining_seconds(self, job):
+        entry = BUILD_HISTORY.lookup(job.project_root, job.python, job.build_mode)
+
+        if job.stage == BUILD_STAGE_PREBUILD:
+            stage = BUILD_HISTORY_PREBUILD_STAGE
+            seconds_in_stage = job.elapsed_seconds
+        elif job.pyinstaller_progress is not None:
+            stage = job.pyinstaller_progress.stage
+            seconds_in_stage = time.monotonic() - job.pyinstaller_progress.stage_started_at
+        else:
+            stage = ""
+            seconds_in_stage = time.monotonic() - job.stage_started_at
+
+        return BUILD_HISTORY.estimate_remaining(
+            entry,
+            stage,
+            seconds_in_stage,
+            job.elapsed_seconds,
+            self.app.last_build_seconds,
+        )
 
-    def _tick_eta(self):
+    def _estimate_remaining_seconds(self, elapsed):
         app = self.app
+        running = self._running_build_jobs()
+        if not running:
+            return max(app.last_build_seconds - elapsed, 0)
 
-        if not getattr(app, "_eta_running", False):
-            return
+        remaining = max(self._job_remaining_seconds(job) for job in running)
+
+        queued = len(self._mass_datetime_queue) if self._mass_datetime_active else 0
+        if queued and self._mass_datetime_stamping:
+            # The queued variants are stamped from this build, not rebuilt.
+            remaining += queued * STAMP_SECONDS_PER_VARIANT
+        elif queued:
+            job = running[0]
+            entry = BUILD_HISTORY.lookup(job.project_root, job.python, job.build_mode)
+            per_build = entry.total_seconds if entry is not None else app.last_build_seconds
+            waves = -(-queued // max(self._mass_datetime_concurrency, 1))
+            remaining += waves * per_build
+
+        return int(round(remaining))
 
-        if not getattr(app, "building", False):
+    def _tick_eta(self):
+        app = self.app
+
+        if not getattr(app, "_eta_running", False) or not getattr(app, "building", False):
+            if self._eta_timer is not None:
+                self._eta_timer.stop()
             return
 
         elapsed = int(time.time() - app.build_start_time)
-        est_total = app.last_build_seconds
-        remaining = max(est_total - elapsed, 0)
+        remaining = self._estimate_remaining_seconds(elapsed)
 
         app.status_label.setFont(QFont("Rubik UI", 13, QFont.Bold))
-         # 🔑 USE CENTRAL METHOD (keeps alignment + padding)
-        self.app.set_status(
-            f"Building... {elapsed}s elapsed\napprox {remaining}s remaining"
-        )
 
-        QTimer.singleShot(300, self._tick_eta)
+        preparing = [job for job in self._prebuilding_build_jobs() if job.stage_message]
+        building = [
+            job for job in self._running_build_jobs() if job.pyinstaller_progress is not None
+        ]
+        if preparing and len(preparing) == len(self._running_build_jobs()):
+            self.app.set_status(f"{preparing[-1].stage_message}\n{elapsed}s elapsed")
+        elif building:
+            progress = building[0].pyinstaller_progress
+            self.app.set_status(
+                f"Building: {progress.summary}... {elapsed}s elapsed\n"
+                f"approx {remaining}s remaining"
+            )
+        elif self._stamp_cancel_event is not None:
+            self.app.set_status(f"Stamping variants... {elapsed}s elapsed")
+        else:
+             # 🔑 USE CENTRAL METHOD (keeps alignment + padding)
+            self.app.set_status(
+                f"Building... {elapsed}s elapsed\napprox {remaining}s remaining"
+            )
 
     def _get_python_version_suffix(self):
         python_path = getattr(self.app, "python_interpreter_path", "")
@@ -399,6 +790,33 @@ class BuildController(QObject):
 
         return parts
 
+    def _final_exe_name(self, script, exe_name):
+        timestamp = self._get_datetime_timestamp_suffix()
+
+        script_path = Path(script)
+        script_name = script_path.stem.lower()
+
+        parts = [exe_name]
+
+        # 🔑 prevent overwrite for common entry files
+        if script_name in {"main", "app", "run"}:
+            parent_name = script_path.parent.name
+            if parent_name:
+                parts.append(parent_name)
+
+        # date/time
+        datetime_region = self._get_datetime_region_identifier()
+        if datetime_region:
+            parts.append(datetime_region)
+        if timestamp:
+            parts.append(timestamp)
+
+        # python version
+        if getattr(self.app, "append_py_version", False):
+            parts.append(self._get_python_version_suffix())
+
+        return "_".join(parts)
+
     def _build_debug_log_name(self, script):
         parts = ["EXE_BUILDER_DEBUG"]
         parts.extend(self._build_name_parts(script))
@@ -451,7 +869,7 @@ class BuildController(QObject):
 
         return search_paths
 
-    def _get_project_png_data_args(self, project_root):
+    def _get_project_data_args(self, project_root, patterns=DEFAULT_DATA_FILE_PATTERNS):
         if not project_root or not os.path.isdir(project_root):
             return []
 
@@ -466,61 +884,23 @@ class BuildController(QObject):
 
         data_args = []
         seen = set()
-        skipped_dirnames = {
-            ".git",
-            ".mypy_cache",
-            ".pytest_cache",
-            ".ruff_cache",
-            "__pycache__",
-            "build",
-            "dist",
-            "env",
-            "spec",
-            "venv",
-            ".venv",
-        }
 
         for data_root in scan_roots:
-            for folder, dirnames, filenames in os.walk(data_root):
-                dirnames[:] = sorted(
-                    dirname
-                    for dirname in dirnames
-                    if dirname.lower() not in skipped_dirnames
-                )
-                for filename in sorted(filenames):
-                    if not filename.lower().endswith(".png"):
-                        continue
+            # Only folders whose mtime changed since the last build are listed
+            # again; fully matching folders come back as a single entry.
+            scan = PROJECT_DATA_INDEX.scan(data_root, patterns)
+            for source_path, destination in scan.entries:
+                key = (os.path.normcase(source_path), os.path.normcase(destination))
+                if key in seen:
+                    continue
 
-                    source_path = os.path.normpath(os.path.join(folder, filename))
-                    destination = os.path.relpath(folder, data_root)
-                    if destination == ".":
-                        destination = "."
-                    else:
-                        destination = os.path.normpath(destination)
-
-                    key = (os.path.normcase(source_path), os.path.normcase(destination))
-                    if key in seen:
-                        continue
-
-                    seen.add(key)
-                    data_args.append(f"--add-data={source_path}{os.pathsep}{destination}")
+                seen.add(key)
+                data_args.append(f"--add-data={source_path}{os.pathsep}{destination}")
 
         return data_args
 
     def _find_nearest_project_container(self, project_root):
-        markers = (".git", "pyproject.toml", "setup.py", "setup.cfg", "requirements.txt")
-        current = Path(project_root).resolve()
-
-        for _ in range(3):
-            if any((current / marker).exists() for marker in markers):
-                return os.path.normpath(str(current))
-
-            parent = current.parent
-            if parent == current:
-                break
-            current = parent
-
-        return ""
+        return PROJECT_DATA_INDEX.find_project_container(project_root)
 
     def _get_desktop_path(self):
         return os.path.normpath(os.path.join(os.path.expanduser("~"), "Desktop"))
@@ -1155,6 +1535,12 @@ class BuildController(QObject):
     def build_exe(self, app=None):
         app = self.app
 
+        # Validation passes are coalesced; settle a pending one so a click on
+        # a button that is about to be disabled can't start a build.
+        app.validation_controller.flush_ui_state()
+        if not self._build_in_progress() and not getattr(app, "_was_build_ready", True):
+            return
+
         datetime_dropdown_data = self._datetime_dropdown_data()
 
         if (
@@ -1183,12 +1569,28 @@ class BuildController(QObject):
         )
 
 
-        if app.build_process:
+        if self._build_in_progress():
+            if self._stamp_cancel_event is not None:
+                self._stamp_cancel_event.set()
             self._cancel_mass_datetime_build()
+            for job in self._mark_running_build_jobs(BUILD_JOB_CANCELLED):
+                job.cancel_event.set()
             app.build_cancellation.cancel_build()
             return
 
-      
+        self._start_build()
+
+    def _start_build(self):
+        app = self.app
+        app.building = True
+        app._eta_running = True
+
+        if not hasattr(app, "build_cancellation"):
+            import build_cancellation
+            app.build_cancellation = build_cancellation.BuildCancellation(
+                app=app, ui=app
+            )
+
         # ==================================================
         # READ UI VALUES
         # ==================================================
@@ -1214,15 +1616,38 @@ class BuildController(QObject):
         app.output_path = outdir
         self._initialize_debug_log(script, outdir)
 
-        # ==================================================
-        # Bundle validation
-        # ==================================================
-
-        ok, error = validate_bundle_inputs(app)
+        exe_name = app.exe_name_input.text().strip()
+        python = app.python_interpreter_path
 
-        if not ok:
-            self._abort_current_build(error)
-            return
+        # The date/time options are applied to the app between mass-build
+        # variants, so the final name is resolved before any work is handed off.
+        final_exe_name = ""
+        if exe_name and outdir:
+            app.last_build_counter += 1
+            final_exe_name = self._final_exe_name(script, exe_name)
+
+        request = PrebuildRequest(
+            script=script,
+            outdir=outdir,
+            icon=icon,
+            entry_point=entry_point,
+            project_root=project_root,
+            exe_name=exe_name,
+            python=python,
+            final_exe_name=final_exe_name,
+            data_file_patterns=normalize_data_file_patterns(
+                getattr(app, "data_file_patterns", DEFAULT_DATA_FILE_PATTERNS)
+            ),
+            use_spec_file=getattr(app, "spec_file_builds_enabled", True),
+            parallel_build=self._mass_datetime_active and self._mass_datetime_concurrency > 1,
+            validation_inputs=SimpleNamespace(
+                entry_script=entry_point,
+                python_interpreter_path=python or "",
+                output_path=outdir,
+                exe_name=getattr(app, "exe_name", ""),
+                icon_path=icon,
+            ),
+        )
 
         # ==================================================
         # ENTER BUILD MODE
@@ -1236,63 +1661,151 @@ class BuildController(QObject):
         
         app.build_start_time = time.time()
         self.start_eta()
-        
+
+        job = BuildJob(
+            label=self._mass_datetime_current_label if self._mass_datetime_active else "",
+            final_exe_name=final_exe_name,
+            build_path=os.path.join(outdir, "build", final_exe_name) if final_exe_name else "",
+            output_paths=[
+                os.path.join(outdir, final_exe_name),
+                os.path.join(outdir, "build"),
+                os.path.join(outdir, "spec"),
+            ] if final_exe_name else [],
+            debug_log_path=getattr(app, "debug_log_path", ""),
+            project_root=project_root or "",
+            python=python or "",
+            use_spec_file=request.use_spec_file,
+        )
+        self._build_jobs.append(job)
+        app.current_build_paths = self._running_build_paths()
+
+        self._start_prebuild(job, request)
+
+    # ============================================================
+    # PRE-BUILD STAGE
+    # ============================================================
+
+    def _start_prebuild(self, job, request):
+        if not event_loop_running():
+            # Nothing would deliver the worker's queued signals; run inline.
+            result = self._run_prebuild_stage(
+                request,
+                job,
+                lambda message: self._on_prebuild_progress(job, message),
+            )
+            self._on_prebuild_finished(job, result)
+            return
+
+        thread = QThread()
+        worker = PrebuildWorker(self, request, job)
+        job.thread = thread
+        job.worker = worker
+        self._retain_thread(thread)
+
+        worker.moveToThread(thread)
+        thread.started.connect(worker.run)
+        worker.progress.connect(
+            lambda message, job=job: self.prebuild_progress_signal.emit(job, message)
+        )
+        worker.finished.connect(
+            lambda result, job=job: self.prebuild_complete_signal.emit(job, result)
+        )
+
+        worker.finished.connect(thread.quit)
+        worker.finished.connect(worker.deleteLater)
+        thread.finished.connect(thread.deleteLater)
+
+        thread.start()
+
+    def _retain_thread(self, thread):
+        # Dropping the last Python reference to a running QThread aborts the
+        # process, so keep it until Qt reports that it has stopped.
+        self._retained_threads.add(thread)
+        thread.finished.connect(lambda thread=thread: self._retained_threads.discard(thread))
+
+    def _run_prebuild_stage(self, request, job, report_progress):
+        def cancelled():
+            return job.cancel_event.is_set()
+
+        phase_clock = PhaseClock()
+
+        # ==================================================
+        # Bundle validation
+        # ==================================================
+
+        report_progress("Validating build inputs...")
+        ok, error = validate_bundle_inputs(request.validation_inputs)
+
+        if not ok:
+            return PrebuildResult(error=error)
+
         # ==================================================
         # Final validation
         # ==================================================
 
+        entry_point = request.entry_point
+        project_root = request.project_root
+        outdir = request.outdir
+
         if not entry_point or not os.path.isfile(entry_point):
-            self._abort_current_build("Invalid or missing entry script.")
-            return
+            return PrebuildResult(error="Invalid or missing entry script.")
 
         if not project_root or not os.path.isdir(project_root):
-            self._abort_current_build("Invalid project folder.")
-            return
+            return PrebuildResult(error="Invalid project folder.")
 
-        exe_name = app.exe_name_input.text().strip()
-        if not exe_name:
-            self._abort_current_build("Please enter an EXE name.")
-            return
+        if not request.exe_name:
+            return PrebuildResult(error="Please enter an EXE name.")
 
         # ==================================================
         # Resolve PyInstaller (ALWAYS via Python interpreter)
         # ==================================================
 
-        python = app.python_interpreter_path
+        python = request.python
         if not python or not os.path.isfile(python):
-            self._abort_current_build(
-                "Python interpreter not found.\n"
-                "Please select a Python interpreter before building."
+            return PrebuildResult(
+                error=(
+                    "Python interpreter not found.\n"
+                    "Please select a Python interpreter before building."
+                )
             )
-            return  
-
-        result = subprocess.run(
-            [python, "-m", "PyInstaller", "--version"],
-            stdout=subprocess.PIPE,
-            stderr=subprocess.PIPE,
-            text=True,
-            creationflags=CREATE_NO_WINDOW
+
+        if cancelled():
+            return PrebuildResult(cancelled=True)
+
+        phase_clock.lap("validation")
+
+        # Cached per interpreter; only re-probed when the interpreter or its
+        # site-packages change.
+        report_progress("Checking PyInstaller...")
+        cached_capabilities = INTERPRETER_CAPABILITIES.cached(python)
+        probe_cached = (
+            cached_capabilities is not None
+            and cached_capabilities.pyinstaller_version is not None
         )
+        try:
+            pyinstaller_version = INTERPRETER_CAPABILITIES.pyinstaller_version(python)
+        except Exception:
+            pyinstaller_version = ""
 
-        if result.returncode != 0:
-            self._abort_current_build(
-                "PyInstaller is not available in the selected Python interpreter.\n\n"
-                "Install it with:\n\npip install pyinstaller"
+        if not pyinstaller_version:
+            return PrebuildResult(
+                error=(
+                    "PyInstaller is not available in the selected Python interpreter.\n\n"
+                    "Install it with:\n\npip install pyinstaller"
+                )
             )
-            return
 
         cmd_prefix = [python, "-m", "PyInstaller"]
+        phase_clock.lap("probe")
 
-        app.status_label.setText("Using PyInstaller (python -m)")
-        app.repaint()
+        report_progress("Using PyInstaller (python -m)")
         
         # --------------------------------------------------
         # OUTPUT FOLDER SAFETY CHECK (exists + writable)
         # --------------------------------------------------
 
         if not outdir or not os.path.isdir(outdir):
-            self._abort_current_build("Output folder does not exist.")
-            return
+            return PrebuildResult(error="Output folder does not exist.")
 
         # 🔑 Test write access (handles protected folders)
         try:
@@ -1301,73 +1814,29 @@ class BuildController(QObject):
                 f.write("test")
             os.remove(test_file)
         except Exception:
-            app.validation_controller.set_build_error(
-                f"ERROR — Cannot write to this folder\n{outdir}\n"
-                "This location is read-only. Choose another."
+            return PrebuildResult(
+                error=(
+                    f"ERROR — Cannot write to this folder\n{outdir}\n"
+                    "This location is read-only. Choose another."
+                ),
+                write_error=True,
             )
 
-            self.stop_eta()
-            app.building = False
-            app.build_process = None
-            if self._mass_datetime_active:
-                self._finish_mass_datetime_build()
+        if cancelled():
+            return PrebuildResult(cancelled=True)
 
-            app.validation_controller.update_ui_state()
-            return
+        phase_clock.lap("output_check")
         
         # ==================================================
         # Build paths
         # ==================================================
 
-        app.last_build_counter += 1
-        timestamp = self._get_datetime_timestamp_suffix()
-        
-
-        script_path = Path(script)
-        script_name = script_path.stem.lower()
-
-        parts = [exe_name]
-
-        # 🔑 prevent overwrite for common entry files
-        if script_name in {"main", "app", "run"}:
-            parent_name = script_path.parent.name
-            if parent_name:
-                parts.append(parent_name)
-
-        # date/time
-        datetime_region = self._get_datetime_region_identifier()
-        if datetime_region:
-            parts.append(datetime_region)
-        if timestamp:
-            parts.append(timestamp)
-
-        # python version
-        if getattr(app, "append_py_version", False):
-            parts.append(self._get_python_version_suffix())
-
-        final_exe_name = "_".join(parts)
+        final_exe_name = request.final_exe_name
 
         build_path = os.path.join(outdir, "build", final_exe_name)
         spec_path = os.path.join(outdir, "spec", final_exe_name)
         target_dir = os.path.join(outdir, final_exe_name)
 
-        for stale_path in (target_dir, build_path, spec_path):
-            if os.path.isdir(stale_path):
-                if os.path.normcase(os.path.abspath(stale_path)) == os.path.normcase(os.path.abspath(target_dir)):
-                    try:
-                        clear_output_folder_icon_metadata(stale_path)
-                    except Exception:
-                        pass
-                shutil.rmtree(stale_path, ignore_errors=True)
-            elif os.path.exists(stale_path):
-                try:
-                    os.remove(stale_path)
-                except OSError:
-                    pass
-
-        os.makedirs(build_path, exist_ok=True)
-        os.makedirs(spec_path, exist_ok=True)
-
         cmd = [
             *cmd_prefix,
             "--onedir",
@@ -1397,9 +1866,10 @@ class BuildController(QObject):
         if project_root:
             cmd.append(f"--add-data={project_root}{os.pathsep}.")
 
-        cmd.extend(self._get_project_png_data_args(project_root))
+        report_progress("Scanning project data files...")
+        cmd.extend(self._get_project_data_args(project_root, request.data_file_patterns))
 
-        icon_contract = resolve_build_icon_contract(icon)
+        icon_contract = resolve_build_icon_contract(request.icon)
 
         data_file = os.path.join(project_root, "screen_mover_state.json")
         if os.path.isfile(data_file):
@@ -1408,12 +1878,148 @@ class BuildController(QObject):
         cmd.extend(icon_contract.pyinstaller_args)
 
         cmd.append(entry_point)
+        phase_clock.lap("data_scan")
 
-        app.current_build_paths = [
-            target_dir,
-            os.path.join(outdir, "build"),
-            os.path.join(outdir, "spec"),
-        ]
+        # ==================================================
+        # Incremental build cache
+        # ==================================================
+
+        build_fingerprint = compute_build_fingerprint(
+            cmd,
+            python,
+            entry_point,
+            project_root,
+            icon_contract.icon_path,
+        )
+        build_decision = self._decide_incremental_build(build_path, build_fingerprint)
+        phase_clock.lap("fingerprint")
+
+        if cancelled():
+            return PrebuildResult(cancelled=True)
+
+        stale_paths = [target_dir]
+        if build_decision.reuse_workpath:
+            cmd.remove("--clean")
+        elif request.use_spec_file:
+            # The generated spec is only rewritten when its content changes,
+            # so it survives clean builds; everything else in spec/ goes.
+            stale_paths.append(build_path)
+            spec_file_name = os.path.normcase(final_exe_name + SPEC_FILE_SUFFIX)
+            if os.path.isdir(spec_path):
+                stale_paths.extend(
+                    os.path.join(spec_path, entry)
+                    for entry in os.listdir(spec_path)
+                    if os.path.normcase(entry) != spec_file_name
+                )
+        else:
+            stale_paths.extend((build_path, spec_path))
+
+        if request.parallel_build and "--clean" in cmd:
+            # --clean also empties PyInstaller's shared cache folder while
+            # sibling variants are reading it; this variant's own workpath is
+            # already cleared with the stale paths below.
+            cmd.remove("--clean")
+
+        report_progress("Clearing previous output...")
+        for stale_path in stale_paths:
+            if os.path.isdir(stale_path):
+                if os.path.normcase(os.path.abspath(stale_path)) == os.path.normcase(os.path.abspath(target_dir)):
+                    try:
+                        clear_output_folder_icon_metadata(stale_path)
+                    except Exception:
+                        pass
+                shutil.rmtree(stale_path, ignore_errors=True)
+            elif os.path.exists(stale_path):
+                try:
+                    os.remove(stale_path)
+                except OSError:
+                    pass
+
+        os.makedirs(build_path, exist_ok=True)
+        os.makedirs(spec_path, exist_ok=True)
+
+        # The fingerprint is only valid once PyInstaller finishes successfully.
+        clear_build_fingerprint(build_path)
+        phase_clock.lap("cleanup")
+
+        if cancelled():
+            return PrebuildResult(cancelled=True)
+
+        return PrebuildResult(
+            cmd=cmd,
+            build_fingerprint=build_fingerprint,
+            build_decision=build_decision,
+            phase_seconds=phase_clock.phases,
+            probe_cached=probe_cached,
+        )
+
+    def _on_prebuild_progress(self, job, message):
+        if not job.is_running:
+            return
+
+        job.stage_message = message
+        self.app.status_label.setText(message)
+
+    def _on_prebuild_finished(self, job, result):
+        app = self.app
+
+        if result.cancelled or job.cancel_event.is_set() or not job.is_running:
+            if job in self._build_jobs:
+                self._build_jobs.remove(job)
+            if job.status == BUILD_JOB_CANCELLED and not self._running_build_jobs():
+                self._finish_cancelled_build()
+            return
+
+        if result.error:
+            if job in self._build_jobs:
+                self._build_jobs.remove(job)
+
+            if result.write_error:
+                app.validation_controller.set_build_error(result.error)
+
+                if self._mass_datetime_active:
+                    self._stop_running_build_jobs()
+                self.stop_eta()
+                app.building = False
+                app.build_process = None
+                if self._mass_datetime_active:
+                    self._finish_mass_datetime_build()
+
+                app.validation_controller.update_ui_state()
+                return
+
+            self._abort_current_build(result.error)
+            return
+
+        self._write_build_cache_log(result.build_decision)
+        job.build_fingerprint = result.build_fingerprint
+        job.build_mode = getattr(result.build_decision, "mode", "")
+        job.phase_seconds.update(result.phase_seconds)
+        job.cache_info = {
+            "workpath": "hit" if getattr(result.build_decision, "reuse_workpath", False) else "miss",
+            "workpath_reason": getattr(result.build_decision, "reason", ""),
+            "interpreter_probe": "hit" if result.probe_cached else "miss",
+        }
+        job.stage_seconds[BUILD_HISTORY_PREBUILD_STAGE] = job.elapsed_seconds
+        job.stage = BUILD_STAGE_PYINSTALLER
+        job.stage_started_at = time.monotonic()
+        job.stage_message = ""
+        self._launch_build_worker(job, result.cmd)
+
+    def _finish_cancelled_build(self):
+        app = self.app
+        if getattr(app, "_is_closing", False):
+            return
+
+        self.stop_eta()
+        app.building = False
+        app.build_process = None
+        app.set_status("Build cancelled.")
+        app.validation_controller.update_build_button()
+        app.validation_controller.update_ui_state()
+
+    def _launch_build_worker(self, job, cmd):
+        app = self.app
 
         # ==================================================
         # Run PyInstaller (threaded)
@@ -1425,11 +2031,20 @@ class BuildController(QObject):
 
         self.build_thread = QThread()
         self.worker = BuildWorker(app, cmd)
+        self.worker.build_job = job
+        job.thread = self.build_thread
+        job.worker = self.worker
+        self._retain_thread(self.build_thread)
 
         self.worker.moveToThread(self.build_thread)
 
         self.build_thread.started.connect(self.worker.run)
-        self.worker.finished.connect(self.on_build_complete)
+        self.worker.progress.connect(
+            lambda progress, job=job: self.build_progress_signal.emit(job, progress)
+        )
+        self.worker.finished.connect(
+            lambda ret, out, err, totals, job=job: self.on_build_complete(ret, out, err, job, totals)
+        )
 
         # cleanup
         self.worker.finished.connect(self.build_thread.quit)
@@ -1438,34 +2053,205 @@ class BuildController(QObject):
 
         self.build_thread.start()
 
-    def on_build_complete(self, ret, out, err):
+    def _decide_incremental_build(self, build_path, build_fingerprint):
+        if not getattr(self.app, "incremental_build_enabled", True):
+            return IncrementalBuildDecision(False, "incremental builds disabled")
+
+        return decide_incremental_build(
+            read_build_fingerprint(build_path),
+            build_fingerprint,
+        )
+
+    def _write_build_cache_log(self, build_decision):
+        debug_log_path = getattr(self.app, "debug_log_path", "")
+        if not debug_log_path:
+            return
+
+        try:
+            with open(debug_log_path, "a", encoding="utf-8") as f:
+                _write_debug_log_section(
+                    f,
+                    "Build Cache",
+                    [
+                        f"MODE={build_decision.mode}",
+                        f"REASON={build_decision.reason}",
+                    ],
+                )
+        except OSError:
+            pass
+
+    def _commit_build_fingerprint(self, ret, job):
+        if ret != 0 or job is None:
+            return
+
+        write_build_fingerprint(job.build_path, job.build_fingerprint)
+
+    def _record_build_history(self, ret, job):
+        if ret != 0 or job is None or not job.project_root:
+            return
+
+        if job.pyinstaller_progress is not None:
+            job.stage_seconds.update(job.pyinstaller_progress.stage_durations)
+
+        BUILD_HISTORY.record(
+            job.project_root,
+            job.python,
+            job.build_mode,
+            job.stage_seconds,
+            job.elapsed_seconds,
+        )
+
+        debug_log_path = job.debug_log_path or getattr(self.app, "debug_log_path", "")
+        if not debug_log_path:
+            return
+
+        try:
+            with open(debug_log_path, "a", encoding="utf-8") as f:
+                _write_debug_log_section(
+                    f,
+                    "Stage Timings",
+                    [
+                        *([f"OUTPUT={job.label}"] if job.label else []),
+                        f"MODE: {job.build_mode or 'unknown'}",
+                        *(
+                            f"{stage}: {seconds:.1f}s"
+                            for stage, seconds in job.stage_seconds.items()
+                        ),
+                        f"TOTAL: {job.elapsed_seconds:.1f}s",
+                    ],
+                )
+        except Exception:
+            pass
+
+    def _write_build_report(self, ret, job, presentation_seconds=None):
+        if job is None:
+            return
+
+        phases = dict(job.phase_seconds)
+        if job.stage == BUILD_STAGE_PYINSTALLER:
+            phases.setdefault("pyinstaller", time.monotonic() - job.stage_started_at)
+        if presentation_seconds is not None:
+            phases["presentation"] = presentation_seconds
+
+        stages = {}
+        if job.pyinstaller_progress is not None:
+            stages = dict(job.pyinstaller_progress.stage_durations)
+
+        output_bytes, output_files = job.output_totals
+        usage = job.resource_usage
+
+        append_build_report(
+            build_report_path(job.debug_log_path or getattr(self.app, "debug_log_path", "")),
+            BuildReport(
+                kind="build",
+                label=job.label,
+                exe_name=job.final_exe_name,
+                project_root=job.project_root,
+                python=job.python,
+                return_code=ret,
+                status=job.status,
+                started_at=time.strftime("%Y-%m-%dT%H:%M:%S", time.localtime(job.start_time)),
+                wall_seconds=job.elapsed_seconds,
+                phases=phases,
+                pyinstaller_stages=stages,
+                resources={
+                    "peak_rss_bytes": getattr(usage, "peak_rss_bytes", 0),
+                    "cpu_seconds": getattr(usage, "cpu_seconds", 0.0),
+                },
+                output={"bytes": output_bytes, "files": output_files},
+                cache=dict(job.cache_info),
+            ),
+        )
+
+    def _write_mass_build_report(self, job, results, concurrency, presentation_seconds):
+        succeeded = [
+            status for _label, status, _seconds in results
+            if status in {BUILD_JOB_SUCCEEDED, BUILD_JOB_STAMPED}
+        ]
+        append_build_report(
+            build_report_path(
+                (job.debug_log_path if job is not None else "")
+                or getattr(self.app, "debug_log_path", "")
+            ),
+            BuildReport(
+                kind="build_all",
+                status=BUILD_JOB_SUCCEEDED,
+                wall_seconds=time.time() - getattr(self.app, "build_start_time", time.time()),
+                phases={"presentation": presentation_seconds},
+                output={"variants": len(results), "succeeded": len(succeeded)},
+                cache={"concurrency": concurrency},
+            ),
+        )
+
+    def _on_build_progress(self, job, progress):
+        if job is not None and job.is_running:
+            job.pyinstaller_progress = progress
+
+    def on_build_complete(self, ret, out, err, job=None, output_totals=None):
         # 🔑 ONLY emit — NO UI CODE HERE
-        self.build_complete_signal.emit(ret, out, err)
+        if job is not None and output_totals is not None:
+            job.output_totals = output_totals
+        self.build_complete_signal.emit(ret, out, err, job)
 
-    def _on_build_complete_ui(self, ret, out, err):
+    def _on_build_complete_ui(self, ret, out, err, job=None):
         app = self.app
+        job = self._take_finished_build_job(ret, job)
         if getattr(app, "_is_closing", False):
             self.stop_eta()
             app.building = False
             app.build_process = None
             return
 
+        if job is not None and job.status == BUILD_JOB_STOPPED:
+            # A sibling variant failed and this one was stopped on purpose.
+            return
+
+        if job is not None and job.status == BUILD_JOB_CANCELLED:
+            self._finish_cancelled_build()
+            return
+
+        self._commit_build_fingerprint(ret, job)
+        self._record_build_history(ret, job)
+
         mass_active = self._mass_datetime_active
-        mass_completed_successfully = False
+        if mass_active:
+            self._record_mass_datetime_result(job)
+        if mass_active or ret != 0:
+            # Single successful builds are reported after presentation so the
+            # report includes it.
+            self._write_build_report(ret, job)
 
         if ret == 0:
-            app.last_build_seconds = int(time.time() - app.build_start_time)
+            if job is not None:
+                app.last_build_seconds = int(job.elapsed_seconds)
+            else:
+                app.last_build_seconds = int(time.time() - app.build_start_time)
             if mass_active:
-                self._remember_mass_datetime_output_group()
+                self._mass_datetime_completed += 1
+                self._remember_mass_datetime_output_group(job)
+                if self._mass_datetime_stamping and job is not None:
+                    self._stamp_mass_datetime_variants(job)
+                    return
 
-            if mass_active and self._mass_datetime_queue:
-                self.stop_eta()
-                app.building = False
-                app.build_process = None
+        self._finish_build_completion(ret, job)
+
+    def _finish_build_completion(self, ret, job):
+        app = self.app
+        mass_active = self._mass_datetime_active
+        mass_completed_successfully = False
+        if ret == 0:
+            if mass_active and (self._mass_datetime_queue or self._running_build_jobs()):
+                app.build_process = self._running_build_process()
+                if not self._running_build_jobs():
+                    self.stop_eta()
+                    app.building = False
+                app.set_status(self._mass_datetime_progress_text())
                 QTimer.singleShot(0, self._run_next_mass_datetime_build)
                 return
 
             if mass_active:
+                mass_results = list(self._mass_datetime_results)
+                mass_concurrency = self._mass_datetime_concurrency
                 self._finish_mass_datetime_build(clear_output_group=False)
                 self._apply_mass_datetime_output_group()
                 self._reset_mass_datetime_output_group()
@@ -1478,7 +2264,8 @@ class BuildController(QObject):
 
         else:
             if mass_active:
-                failed_label = self._mass_datetime_current_label
+                failed_label = (job.label if job is not None else "") or self._mass_datetime_current_label
+                self._stop_running_build_jobs()
                 self._finish_mass_datetime_build()
                 msg = f"Mass build failed on {failed_label}. See debug log."
             else:
@@ -1495,10 +2282,19 @@ class BuildController(QObject):
         app.validation_controller.update_ui_state()
 
         if ret == 0:
+            presentation_started = time.perf_counter()
             if mass_completed_successfully:
                 self._present_successful_mass_datetime_outputs()
             else:
                 self._present_successful_build_outputs()
+            presentation_seconds = time.perf_counter() - presentation_started
+
+            if mass_completed_successfully:
+                self._write_mass_build_report(
+                    job, mass_results, mass_concurrency, presentation_seconds
+                )
+            else:
+                self._write_build_report(ret, job, presentation_seconds)
             app.state_ctrl.save_state()
             self._run_success_post_build_action()
         
@@ -1510,73 +2306,184 @@ class BuildController(QObject):
         app._status_lock = False
         app.validation_controller.update_ui_state()
 
-    # ============================================================
-    # ETA time estimator
-    # ============================================================
-    def update_eta_loop(self):
-        if not getattr(self.app, "_eta_running", False):
-            return
 
-        if not getattr(self.app, "building", False):
-            return
+class PrebuildWorker(QObject):
+    progress = Signal(str)
+    finished = Signal(object)
 
-        elapsed = int(time.time() - self.app.build_start_time)
-        est_total = self.app.last_build_seconds
-        remaining = max(est_total - elapsed, 0)
+    def __init__(self, controller, request, job):
+        super().__init__()
+        self.controller = controller
+        self.request = request
+        self.job = job
 
-        self.app.status_label.setFont(QFont("Rubik UI", 13, QFont.Bold))
+    def run(self):
+        try:
+            result = self.controller._run_prebuild_stage(
+                self.request,
+                self.job,
+                self.progress.emit,
+            )
+        except Exception as e:
+            result = PrebuildResult(error=f"Build preparation failed:\n{e}")
+
+        self.finished.emit(result)
 
-        # 🔑 USE CENTRAL METHOD (keeps alignment + padding)
-        self.app.set_status(
-            f"Building... {elapsed}s elapsed\napprox {remaining}s remaining"
-        )
 
-        self.app.status_label.setFixedSize(200,100)
+class VariantStampWorker(QObject):
+    finished = Signal(object)
+
+    def __init__(self, controller, template_job, variants, cancel_event):
+        super().__init__()
+        self.controller = controller
+        self.template_job = template_job
+        self.variants = variants
+        self.cancel_event = cancel_event
+
+    def run(self):
+        try:
+            variants = self.controller._run_variant_stamping(
+                self.template_job,
+                self.variants,
+                self.cancel_event,
+            )
+        except Exception as e:
+            for variant in self.variants:
+                if variant.stamped is None:
+                    variant.error = f"Stamping failed: {e}"
+            variants = self.variants
 
-        QTimer.singleShot(1, self.update_eta_loop)
+        self.finished.emit(variants)
 
 
 class BuildWorker(QObject):
-    finished = Signal(int, str, str)  # ret, stdout, stderr
+    finished = Signal(int, str, str, object)  # ret, stdout, output tail, (output bytes, files)
+    progress = Signal(object)  # PyInstallerProgress
 
     def __init__(self, app, cmd):
         super().__init__()
         self.app = app
         self.cmd = cmd
+        self.build_job = None
+
+    def _output_log_lines(self):
+        label = getattr(self.build_job, "label", "")
+        return [f"OUTPUT={label}"] if label else []
+
+    def _output_line_prefix(self):
+        # Parallel Build All variants share one debug log; tag their lines.
+        label = getattr(self.build_job, "label", "")
+        return f"[{label}] " if label else ""
+
+    def _stream_output(self, proc, log_file):
+        parser = PyInstallerLogParser()
+        tail = deque(maxlen=BUILD_OUTPUT_TAIL_LINES)
+        prefix = self._output_line_prefix()
+        last_emit = 0.0
+
+        log_file.write("--- PyInstaller Output ---\n")
+        for raw_line in proc.stdout:
+            line = raw_line.rstrip("\r\n")
+            log_file.write(f"    {prefix}{line}\n")
+            tail.append(line)
+
+            stage_changed = parser.feed(line)
+            now = time.monotonic()
+            if stage_changed or now - last_emit >= BUILD_PROGRESS_INTERVAL_SECONDS:
+                last_emit = now
+                self.progress.emit(parser.progress)
+
+        log_file.write("\n")
+        parser.finish()
+        self.progress.emit(parser.progress)
+        return "\n".join(tail)
+
+    def _resolve_command(self):
+        if not getattr(self.build_job, "use_spec_file", False):
+            return self.cmd, []
+
+        try:
+            spec = build_spec_command(self.cmd)
+        except (SpecConversionError, OSError) as e:
+            # Fall back to the plain command line rather than failing the build.
+            return self.cmd, [f"SPEC: not used ({e})"]
+
+        state = "written" if spec.written else "unchanged"
+        self.build_job.cache_info["spec_file"] = state
+        return spec.cmd, [f"SPEC: {spec.spec_file} ({state}, sha256 {spec.digest[:12]})"]
+
+    def _cancelled(self):
+        cancel_event = getattr(self.build_job, "cancel_event", None)
+        return cancel_event is not None and cancel_event.is_set()
 
     def run(self):
+        debug_log_path = getattr(self.build_job, "debug_log_path", "") or self.app.debug_log_path
+        totals = (0, 0)
+        if self._cancelled():
+            # Cancelled between the pre-build stage and this thread starting.
+            self.finished.emit(-1, "", "Build cancelled.", totals)
+            return
+
         try:
-            with open(self.app.debug_log_path, "a", encoding="utf-8") as f:
+            cmd, spec_lines = self._resolve_command()
+
+            # Line buffered so the log can be tailed while PyInstaller runs.
+            with open(debug_log_path, "a", encoding="utf-8", buffering=1) as f:
                 _write_debug_log_section(
                     f,
                     "PyInstaller Command",
                     [
+                        *self._output_log_lines(),
                         "ENTERED run_build",
-                        "CMD: " + " ".join(self.cmd),
+                        *spec_lines,
+                        "CMD: " + " ".join(cmd),
                     ],
                 )
 
-            proc = subprocess.Popen(
-                self.cmd,
-                stdout=subprocess.PIPE,
-                stderr=subprocess.PIPE,
-                text=True,
-                creationflags=CREATE_NO_WINDOW
-            )
-
-            self.app.build_process = proc
+                proc = subprocess.Popen(
+                    cmd,
+                    stdout=subprocess.PIPE,
+                    stderr=subprocess.STDOUT,
+                    text=True,
+                    errors="replace",
+                    bufsize=1,
+                    creationflags=CREATE_NO_WINDOW
+                )
 
-            out, err = proc.communicate()
-            ret = proc.returncode
+                self.app.build_process = proc
+                if self.build_job is not None:
+                    self.build_job.process = proc
+                if self._cancelled():
+                    # The cancel landed before the process was visible to it.
+                    from build_cancellation import kill_process_tree
+                    kill_process_tree(proc)
+
+                # Peak memory and CPU time of PyInstaller and its isolated
+                # child interpreters, for the build report.
+                sampler = ProcessTreeSampler(getattr(proc, "pid", None))
+                sampler.start()
+                try:
+                    err = self._stream_output(proc, f)
+                    ret = proc.wait()
+                finally:
+                    sampler.stop()
+                out = ""
+
+                if self.build_job is not None:
+                    self.build_job.resource_usage = sampler.usage
+                    # Measured here so the report never walks the output
+                    # tree on the GUI thread.
+                    output_paths = getattr(self.build_job, "output_paths", None)
+                    totals = measure_output(output_paths[0] if output_paths else "")
 
-            with open(self.app.debug_log_path, "a", encoding="utf-8") as f:
                 f.write("--- Build Result ---\n")
-                f.write(f"  RETURN CODE: {ret}\n")
-                _write_debug_log_stderr(f, err)
+                for line in self._output_log_lines():
+                    f.write(f"  {line}\n")
+                f.write(f"  RETURN CODE: {ret}\n\n")
 
         except Exception as e:
             ret = -1
             out = ""
             err = str(e)
 
-        self.finished.emit(ret, out, err)
+        self.finished.emit(ret, out, err, totals)
@@ -0,0 +1,180 @@
+import hashlib
+import json
+import os
+from dataclasses import dataclass
+
+from interpreter_cache import interpreter_signature
+
+
+FINGERPRINT_FILE_NAME = ".exe_builder_fingerprint.json"
+FINGERPRINT_FORMAT_VERSION = 1
+
+SKIPPED_PROJECT_DIRNAMES = {
+    ".git",
+    ".mypy_cache",
+    ".pytest_cache",
+    ".ruff_cache",
+    "__pycache__",
+    "build",
+    "dist",
+    "env",
+    "spec",
+    "venv",
+    ".venv",
+}
+
+# Flags that only control how PyInstaller treats its work directories. They do
+# not change the build output, so they must not invalidate the cache.
+_WORKPATH_ONLY_FLAGS = {"--clean"}
+
+
+@dataclass(frozen=True)
+class BuildFingerprint:
+    # Interpreter + command line + icon: a change here invalidates PyInstaller's
+    # cached Analysis/PYZ stages, so the next build must start clean.
+    cache_key: str
+    # Entry script + project tree contents: PyInstaller re-runs only the stages
+    # whose inputs changed, so the work directory stays reusable.
+    inputs_digest: str
+
+    def to_dict(self):
+        return {
+            "format": FINGERPRINT_FORMAT_VERSION,
+            "cache_key": self.cache_key,
+            "inputs_digest": self.inputs_digest,
+        }
+
+
+@dataclass(frozen=True)
+class IncrementalBuildDecision:
+    reuse_workpath: bool
+    reason: str
+
+    @property
+    def mode(self):
+        return "incremental" if self.reuse_workpath else "clean"
+
+
+def compute_build_fingerprint(cmd, python, entry_point, project_root, icon_path=""):
+    cache_key = _digest(
+        {
+            # Installing or removing packages touches site-packages, which can
+            # change what PyInstaller's cached module graph resolves to.
+            "interpreter": interpreter_signature(python),
+            "command": [part for part in cmd if part not in _WORKPATH_ONLY_FLAGS],
+            "icon": _file_signature(icon_path),
+        }
+    )
+    inputs_digest = _digest(
+        {
+            "entry_script": _file_signature(entry_point),
+            "project_tree": _project_tree_signature(project_root),
+        }
+    )
+    return BuildFingerprint(cache_key=cache_key, inputs_digest=inputs_digest)
+
+
+def decide_incremental_build(previous, current):
+    if previous is None:
+        return IncrementalBuildDecision(False, "no cached build for this output")
+
+    if previous.cache_key != current.cache_key:
+        return IncrementalBuildDecision(False, "interpreter, icon or build options changed")
+
+    if previous.inputs_digest != current.inputs_digest:
+        return IncrementalBuildDecision(True, "project files changed")
+
+    return IncrementalBuildDecision(True, "inputs unchanged")
+
+
+def fingerprint_file_path(workpath):
+    return os.path.join(workpath, FINGERPRINT_FILE_NAME)
+
+
+def read_build_fingerprint(workpath):
+    if not workpath:
+        return None
+
+    try:
+        with open(fingerprint_file_path(workpath), "r", encoding="utf-8") as f:
+            data = json.load(f)
+    except (OSError, ValueError):
+        return None
+
+    if not isinstance(data, dict) or data.get("format") != FINGERPRINT_FORMAT_VERSION:
+        return None
+
+    cache_key = data.get("cache_key")
+    inputs_digest = data.get("inputs_digest")
+    if not isinstance(cache_key, str) or not isinstance(inputs_digest, str):
+        return None
+
+    return BuildFingerprint(cache_key=cache_key, inputs_digest=inputs_digest)
+
+
+def write_build_fingerprint(workpath, fingerprint):
+    if not workpath or fingerprint is None or not os.path.isdir(workpath):
+        return False
+
+    try:
+        with open(fingerprint_file_path(workpath), "w", encoding="utf-8") as f:
+            json.dump(fingerprint.to_dict(), f, indent=4)
+        return True
+    except OSError:
+        return False
+
+
+def clear_build_fingerprint(workpath):
+    if not workpath:
+        return False
+
+    try:
+        os.remove(fingerprint_file_path(workpath))
+        return True
+    except OSError:
+        return False
+
+
+def _digest(payload):
+    encoded = json.dumps(payload, sort_keys=True, separators=(",", ":")).encode("utf-8")
+    return hashlib.sha256(encoded).hexdigest()
+
+
+def _file_signature(path):
+    if not path:
+        return None
+
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return [os.path.normcase(os.path.normpath(path)), None, None]
+
+    return [os.path.normcase(os.path.normpath(path)), stat.st_size, stat.st_mtime_ns]
+
+
+def _project_tree_signature(project_root):
+    if not project_root or not os.path.isdir(project_root):
+        return []
+
+    entries = []
+    for folder, dirnames, filenames in os.walk(project_root):
+        dirnames[:] = sorted(
+            dirname
+            for dirname in dirnames
+            if dirname.lower() not in SKIPPED_PROJECT_DIRNAMES
+        )
+        relative_folder = os.path.relpath(folder, project_root)
+        for filename in sorted(filenames):
+            try:
+                stat = os.stat(os.path.join(folder, filename))
+            except OSError:
+                continue
+            entries.append(
+                [
+                    os.path.normcase(os.path.join(relative_folder, filename)),
+                    stat.st_size,
+                    stat.st_mtime_ns,
+                ]
+            )
+
+    return entries
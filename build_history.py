@@ -0,0 +1,171 @@
+import os
+import threading
+import time
+from dataclasses import dataclass, field
+
+from pyinstaller_progress import PYINSTALLER_DONE_STAGE, PYINSTALLER_STAGES
+
+
+BUILD_HISTORY_PREBUILD_STAGE = "prebuild"
+BUILD_HISTORY_STAGES = (BUILD_HISTORY_PREBUILD_STAGE, *PYINSTALLER_STAGES)
+MAX_BUILD_HISTORY_ENTRIES = 64
+# Weight of the newest sample in the moving average. High enough that a
+# dependency upgrade shows up after a couple of builds, low enough that one
+# slow build (antivirus scan, cold disk cache) does not swing the estimate.
+BUILD_HISTORY_SMOOTHING = 0.4
+
+
+def _normalized(path):
+    return os.path.normcase(os.path.normpath(str(path))) if path else ""
+
+
+@dataclass
+class BuildHistoryEntry:
+    project: str
+    interpreter: str
+    mode: str
+    stage_seconds: dict = field(default_factory=dict)
+    total_seconds: float = 0.0
+    samples: int = 0
+    updated_at: float = 0.0
+
+    @property
+    def key(self):
+        return (self.project, self.interpreter, self.mode)
+
+    def to_dict(self):
+        return {
+            "project": self.project,
+            "interpreter": self.interpreter,
+            "mode": self.mode,
+            "stage_seconds": self.stage_seconds,
+            "total_seconds": self.total_seconds,
+            "samples": self.samples,
+            "updated_at": self.updated_at,
+        }
+
+
+def _smooth(previous, sample):
+    if previous is None:
+        return sample
+    return previous + BUILD_HISTORY_SMOOTHING * (sample - previous)
+
+
+class BuildHistory:
+    def __init__(self):
+        self._entries = {}
+        self._lock = threading.Lock()
+
+    def lookup(self, project_root, python, mode=""):
+        project = _normalized(project_root)
+        interpreter = _normalized(python)
+
+        with self._lock:
+            entry = self._entries.get((project, interpreter, mode))
+            if entry is not None:
+                return entry
+
+            # The build mode is only known once pre-build has compared
+            # fingerprints; until then, and for a project built with another
+            # interpreter, the most recent related build is the best guess.
+            for matches in (
+                lambda e: e.project == project and e.interpreter == interpreter,
+                lambda e: e.project == project,
+            ):
+                candidates = [e for e in self._entries.values() if matches(e)]
+                if candidates:
+                    return max(candidates, key=lambda e: e.updated_at)
+        return None
+
+    def record(self, project_root, python, mode, stage_seconds, total_seconds, now=None):
+        key = (_normalized(project_root), _normalized(python), mode)
+        stage_seconds = {
+            stage: float(seconds)
+            for stage, seconds in stage_seconds.items()
+            if stage in BUILD_HISTORY_STAGES and seconds >= 0
+        }
+
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                entry = BuildHistoryEntry(*key)
+                self._entries[key] = entry
+
+            for stage, seconds in stage_seconds.items():
+                entry.stage_seconds[stage] = _smooth(entry.stage_seconds.get(stage), seconds)
+            entry.total_seconds = _smooth(entry.total_seconds if entry.samples else None, total_seconds)
+            entry.samples += 1
+            entry.updated_at = time.time() if now is None else now
+
+            self._prune()
+            return entry
+
+    def _prune(self):
+        if len(self._entries) <= MAX_BUILD_HISTORY_ENTRIES:
+            return
+
+        oldest = sorted(self._entries.values(), key=lambda e: e.updated_at)
+        for entry in oldest[: len(self._entries) - MAX_BUILD_HISTORY_ENTRIES]:
+            self._entries.pop(entry.key, None)
+
+    def estimate_remaining(self, entry, stage, seconds_in_stage, elapsed, fallback_total):
+        if stage == PYINSTALLER_DONE_STAGE:
+            return 0.0
+
+        if entry is None or not entry.stage_seconds:
+            return max(float(fallback_total) - elapsed, 0.0)
+
+        if stage not in BUILD_HISTORY_STAGES:
+            # PyInstaller has started but not logged its first stage yet.
+            stage = PYINSTALLER_STAGES[0]
+
+        index = BUILD_HISTORY_STAGES.index(stage)
+        current = max(entry.stage_seconds.get(stage, 0.0) - seconds_in_stage, 0.0)
+        later = sum(entry.stage_seconds.get(name, 0.0) for name in BUILD_HISTORY_STAGES[index + 1:])
+        return current + later
+
+    def serialize(self):
+        with self._lock:
+            return [entry.to_dict() for entry in self._entries.values()]
+
+    def load_serialized(self, serialized_entries):
+        if not isinstance(serialized_entries, list):
+            return
+
+        with self._lock:
+            for item in serialized_entries:
+                if not isinstance(item, dict):
+                    continue
+
+                project = str(item.get("project", "")).strip()
+                stage_seconds = item.get("stage_seconds")
+                if not project or not isinstance(stage_seconds, dict):
+                    continue
+
+                try:
+                    entry = BuildHistoryEntry(
+                        project=project,
+                        interpreter=str(item.get("interpreter", "")),
+                        mode=str(item.get("mode", "")),
+                        stage_seconds={
+                            str(stage): float(seconds)
+                            for stage, seconds in stage_seconds.items()
+                            if stage in BUILD_HISTORY_STAGES
+                        },
+                        total_seconds=float(item.get("total_seconds", 0.0)),
+                        samples=int(item.get("samples", 0)),
+                        updated_at=float(item.get("updated_at", 0.0)),
+                    )
+                except (TypeError, ValueError):
+                    continue
+
+                self._entries[entry.key] = entry
+
+            self._prune()
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+
+BUILD_HISTORY = BuildHistory()
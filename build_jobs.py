@@ -0,0 +1,137 @@
+import os
+import threading
+import time
+from dataclasses import dataclass, field
+
+import psutil
+
+from project_data_index import DEFAULT_DATA_FILE_PATTERNS
+
+
+MAX_PARALLEL_MASS_BUILDS = 4
+# A PyInstaller onedir build of a Qt app peaks around 1 GiB of RSS during
+# Analysis; leave headroom so parallel variants do not push the machine into swap.
+MASS_BUILD_MEMORY_PER_JOB = 1536 * 1024 * 1024
+
+BUILD_JOB_RUNNING = "running"
+BUILD_JOB_SUCCEEDED = "succeeded"
+BUILD_JOB_FAILED = "failed"
+BUILD_JOB_CANCELLED = "cancelled"
+BUILD_JOB_STOPPED = "stopped"
+BUILD_JOB_STAMPED = "stamped"
+
+BUILD_STAGE_PREBUILD = "prebuild"
+BUILD_STAGE_PYINSTALLER = "pyinstaller"
+
+
+@dataclass
+class BuildJob:
+    label: str
+    final_exe_name: str
+    build_path: str
+    output_paths: list
+    debug_log_path: str = ""
+    project_root: str = ""
+    python: str = ""
+    build_mode: str = ""
+    use_spec_file: bool = False
+    build_fingerprint: object = None
+    worker: object = None
+    thread: object = None
+    process: object = None
+    status: str = BUILD_JOB_RUNNING
+    stage: str = BUILD_STAGE_PREBUILD
+    stage_message: str = ""
+    pyinstaller_progress: object = None
+    stage_started_at: float = field(default_factory=time.monotonic)
+    stage_seconds: dict = field(default_factory=dict)
+    phase_seconds: dict = field(default_factory=dict)
+    cache_info: dict = field(default_factory=dict)
+    resource_usage: object = None
+    output_totals: tuple = (0, 0)
+    cancel_event: threading.Event = field(default_factory=threading.Event)
+    start_time: float = field(default_factory=time.time)
+    end_time: float = 0.0
+
+    @property
+    def is_running(self):
+        return self.status == BUILD_JOB_RUNNING
+
+    @property
+    def elapsed_seconds(self):
+        end_time = self.end_time or time.time()
+        return max(end_time - self.start_time, 0.0)
+
+    def finish(self, ret):
+        self.end_time = time.time()
+        if self.status == BUILD_JOB_RUNNING:
+            self.status = BUILD_JOB_SUCCEEDED if ret == 0 else BUILD_JOB_FAILED
+
+
+@dataclass
+class PrebuildRequest:
+    # Snapshot of the UI taken on the GUI thread; the pre-build worker never
+    # touches widgets.
+    script: str
+    outdir: str
+    icon: str
+    entry_point: str
+    project_root: str
+    exe_name: str
+    python: str
+    final_exe_name: str
+    validation_inputs: object
+    data_file_patterns: tuple = DEFAULT_DATA_FILE_PATTERNS
+    use_spec_file: bool = False
+    parallel_build: bool = False
+
+
+@dataclass
+class PrebuildResult:
+    cmd: list = field(default_factory=list)
+    build_fingerprint: object = None
+    build_decision: object = None
+    phase_seconds: dict = field(default_factory=dict)
+    probe_cached: bool = False
+    error: str = ""
+    write_error: bool = False
+    cancelled: bool = False
+
+
+@dataclass
+class VariantStamp:
+    # One Build All variant produced from the template build's output.
+    label: str
+    datetime_format: str
+    job: BuildJob
+    stamped: object = None
+    error: str = ""
+
+
+def available_memory_bytes():
+    try:
+        return psutil.virtual_memory().available
+    except Exception:
+        return None
+
+
+def mass_build_concurrency(job_count, cpu_count=None, available_memory=None):
+    if job_count <= 1:
+        return 1
+
+    if cpu_count is None:
+        cpu_count = os.cpu_count() or 1
+    if available_memory is None:
+        available_memory = available_memory_bytes()
+
+    # PyInstaller's Analysis stage is single threaded, but each build also
+    # spawns isolated child interpreters. Half the logical cores keeps the GUI
+    # and those helpers responsive.
+    by_cpu = max(1, cpu_count // 2)
+    by_memory = (
+        max(1, available_memory // MASS_BUILD_MEMORY_PER_JOB)
+        if available_memory
+        else 1
+    )
+
+    return max(1, min(job_count, by_cpu, by_memory, MAX_PARALLEL_MASS_BUILDS))
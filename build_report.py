@@ -0,0 +1,175 @@
+import json
+import os
+import threading
+import time
+from dataclasses import asdict, dataclass, field
+
+import psutil
+
+
+BUILD_REPORT_SUFFIX = ".report.jsonl"
+BUILD_REPORT_VERSION = 1
+PROCESS_SAMPLE_INTERVAL_SECONDS = 0.5
+
+
+class PhaseClock:
+    """Lap timer for linear code: each lap() charges the time since the
+    previous lap to the named phase."""
+
+    def __init__(self, clock=time.perf_counter):
+        self._clock = clock
+        self._last = clock()
+        self.phases = {}
+
+    def lap(self, name):
+        now = self._clock()
+        self.phases[name] = self.phases.get(name, 0.0) + (now - self._last)
+        self._last = now
+        return self.phases[name]
+
+
+@dataclass(frozen=True)
+class ResourceUsage:
+    peak_rss_bytes: int = 0
+    cpu_seconds: float = 0.0
+    samples: int = 0
+
+
+class ProcessTreeSampler:
+    def __init__(self, pid, interval=PROCESS_SAMPLE_INTERVAL_SECONDS):
+        self.pid = pid
+        self.interval = interval
+        self._stop = threading.Event()
+        self._thread = None
+        self._lock = threading.Lock()
+        self._peak_rss = 0
+        self._samples = 0
+        # Keyed on (pid, create_time) so the CPU time of helper processes that
+        # already exited is still counted, and reused PIDs are not merged.
+        self._cpu_by_process = {}
+
+    def start(self):
+        if self.pid is None:
+            return
+
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout=self.interval * 4)
+
+    def _run(self):
+        while not self._stop.is_set():
+            self.sample()
+            self._stop.wait(self.interval)
+
+    def sample(self):
+        try:
+            root = psutil.Process(self.pid)
+            processes = [root, *root.children(recursive=True)]
+        except psutil.Error:
+            return
+
+        rss = 0
+        cpu = {}
+        for process in processes:
+            try:
+                with process.oneshot():
+                    rss += process.memory_info().rss
+                    times = process.cpu_times()
+                    cpu[(process.pid, process.create_time())] = times.user + times.system
+            except psutil.Error:
+                continue
+
+        with self._lock:
+            self._peak_rss = max(self._peak_rss, rss)
+            self._cpu_by_process.update(cpu)
+            self._samples += 1
+
+    @property
+    def usage(self):
+        with self._lock:
+            return ResourceUsage(
+                peak_rss_bytes=self._peak_rss,
+                cpu_seconds=round(sum(self._cpu_by_process.values()), 3),
+                samples=self._samples,
+            )
+
+
+def measure_output(path):
+    total_bytes = 0
+    file_count = 0
+    if not path or not os.path.isdir(path):
+        return total_bytes, file_count
+
+    for folder, _dirnames, filenames in os.walk(path):
+        for filename in filenames:
+            try:
+                total_bytes += os.path.getsize(os.path.join(folder, filename))
+            except OSError:
+                continue
+            file_count += 1
+    return total_bytes, file_count
+
+
+@dataclass
+class BuildReport:
+    kind: str
+    label: str = ""
+    exe_name: str = ""
+    project_root: str = ""
+    python: str = ""
+    return_code: int = 0
+    status: str = ""
+    started_at: str = ""
+    wall_seconds: float = 0.0
+    phases: dict = field(default_factory=dict)
+    pyinstaller_stages: dict = field(default_factory=dict)
+    resources: dict = field(default_factory=dict)
+    output: dict = field(default_factory=dict)
+    cache: dict = field(default_factory=dict)
+    version: int = BUILD_REPORT_VERSION
+
+    def to_dict(self):
+        data = asdict(self)
+        for key in ("phases", "pyinstaller_stages"):
+            data[key] = {name: round(seconds, 3) for name, seconds in data[key].items()}
+        data["wall_seconds"] = round(self.wall_seconds, 3)
+        return data
+
+
+def build_report_path(debug_log_path):
+    if not debug_log_path:
+        return ""
+    return os.path.splitext(debug_log_path)[0] + BUILD_REPORT_SUFFIX
+
+
+def append_build_report(path, report):
+    if not path:
+        return False
+
+    try:
+        with open(path, "a", encoding="utf-8") as f:
+            f.write(json.dumps(report.to_dict(), sort_keys=True) + "\n")
+    except OSError:
+        return False
+    return True
+
+
+def read_build_reports(path):
+    reports = []
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            for line in f:
+                line = line.strip()
+                if not line:
+                    continue
+                try:
+                    reports.append(json.loads(line))
+                except ValueError:
+                    continue
+    except OSError:
+        pass
+    return reports
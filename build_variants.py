@@ -0,0 +1,112 @@
+import os
+import shutil
+from dataclasses import dataclass
+
+from build_icon_contract import DESKTOP_INI_NAME, FOLDER_ICON_PREFIX
+
+
+PYINSTALLER_CONTENTS_DIR_NAME = "_internal"
+STAMP_STAGING_SUFFIX = ".stamping"
+
+
+class VariantStampError(Exception):
+    pass
+
+
+@dataclass(frozen=True)
+class StampedVariant:
+    target_dir: str
+    linked_files: int
+    copied_files: int
+
+
+def stamp_build_variant(template_dir, template_name, variant_name):
+    template_dir = os.path.normpath(template_dir)
+    target_dir = os.path.join(os.path.dirname(template_dir), variant_name)
+
+    if os.path.normcase(target_dir) == os.path.normcase(template_dir):
+        raise VariantStampError("Variant name matches the template build.")
+
+    _ensure_stampable_layout(template_dir, template_name)
+
+    staging_dir = target_dir + STAMP_STAGING_SUFFIX
+    _remove_path(staging_dir)
+
+    counts = [0, 0]
+    try:
+        os.makedirs(staging_dir)
+        for entry in sorted(os.listdir(template_dir)):
+            if _is_folder_icon_metadata(entry):
+                continue
+
+            source = os.path.join(template_dir, entry)
+            if os.path.isdir(source):
+                _link_tree(source, os.path.join(staging_dir, entry), counts)
+                continue
+
+            destination_name = entry
+            if entry.lower().startswith(template_name.lower()):
+                # The EXE (and any manifest beside it) carries the build name.
+                destination_name = variant_name + entry[len(template_name):]
+
+            # Top-level files are copied so per-variant edits such as code
+            # signing never leak into the other variants.
+            shutil.copy2(source, os.path.join(staging_dir, destination_name))
+            counts[1] += 1
+
+        _remove_path(target_dir)
+        os.replace(staging_dir, target_dir)
+    except OSError as e:
+        _remove_path(staging_dir)
+        raise VariantStampError(f"Could not stamp {variant_name}: {e}") from e
+
+    return StampedVariant(target_dir=target_dir, linked_files=counts[0], copied_files=counts[1])
+
+
+def _ensure_stampable_layout(template_dir, template_name):
+    exe_path = os.path.join(template_dir, f"{template_name}.exe")
+    contents_dir = os.path.join(template_dir, PYINSTALLER_CONTENTS_DIR_NAME)
+
+    if not os.path.isfile(exe_path) or not os.path.isdir(contents_dir):
+        raise VariantStampError("Template build does not have a recognised onedir layout.")
+
+    # Anything inside the contents folder that is named after the build
+    # cannot be renamed without breaking the bootloader's lookups.
+    lowered_name = template_name.lower()
+    for _folder, dirnames, filenames in os.walk(contents_dir):
+        for name in (*dirnames, *filenames):
+            if name.lower().startswith(lowered_name):
+                raise VariantStampError(f"Build name is embedded in {name}.")
+
+
+def _link_tree(source_dir, destination_dir, counts):
+    for folder, _dirnames, filenames in os.walk(source_dir):
+        relative = os.path.relpath(folder, source_dir)
+        target_folder = os.path.normpath(os.path.join(destination_dir, relative))
+        os.makedirs(target_folder, exist_ok=True)
+
+        for filename in filenames:
+            source = os.path.join(folder, filename)
+            destination = os.path.join(target_folder, filename)
+            try:
+                os.link(source, destination)
+                counts[0] += 1
+            except OSError:
+                # Hardlinks need the same NTFS volume; fall back to a copy.
+                shutil.copy2(source, destination)
+                counts[1] += 1
+
+
+def _is_folder_icon_metadata(name):
+    lowered = name.lower()
+    return lowered == DESKTOP_INI_NAME or lowered.startswith(FOLDER_ICON_PREFIX)
+
+
+def _remove_path(path):
+    if os.path.isdir(path):
+        shutil.rmtree(path, ignore_errors=True)
+    elif os.path.exists(path):
+        try:
+            os.remove(path)
+        except OSError:
+            pass
@@ -1,9 +1,9 @@
 
 import os
-import subprocess
+
+from interpreter_cache import INTERPRETER_CAPABILITIES, InterpreterProbeError
 
 INVALID_EXE_CHARS = set('<>:"/\\|?*')
-CREATE_NO_WINDOW = 0x08000000
 
 def validate_bundle_inputs(app):
     """
@@ -41,19 +41,12 @@ def validate_bundle_inputs(app):
         return False, "Python interpreter path is invalid."
 
     try:
-        result = subprocess.run(
-            [python, "--version"],
-            stdout=subprocess.PIPE,
-            stderr=subprocess.PIPE,
-            timeout=5,
-            creationflags=CREATE_NO_WINDOW
-        )
+        INTERPRETER_CAPABILITIES.python_version(python, timeout=5)
+    except InterpreterProbeError:
+        return False, "Python interpreter failed to run."
     except Exception:
         return False, "Python interpreter could not be executed."
 
-    if result.returncode != 0:
-        return False, "Python interpreter failed to run."
-
     # ---------------------------------------------------------
     # 3. Output directory
     # ---------------------------------------------------------
@@ -0,0 +1,229 @@
+import hashlib
+import json
+import os
+import re
+import time
+from dataclasses import dataclass, field
+
+from site_packages_metadata import normalize_package_name
+from wheelhouse import read_index_wheels
+
+
+LOCKFILE_FORMAT_VERSION = 1
+LOCKFILE_JSON_SUFFIX = ".json"
+LOCKFILE_HEADER = "# Generated by Win-11-Python-EXE-Builder Environment Sync."
+
+_REQUIREMENT_PATTERN = re.compile(r"^([A-Za-z0-9][A-Za-z0-9._-]*)\s*===?\s*([^\s;\\]+)")
+_HASH_PATTERN = re.compile(r"--hash[=\s]+(\w+:[0-9a-fA-F]+)")
+
+
+class LockfileError(ValueError):
+    pass
+
+
+@dataclass(frozen=True)
+class LockedPackage:
+    name: str
+    version: str
+    hashes: tuple = ()
+
+    @property
+    def spec(self):
+        return f"{self.name}=={self.version}"
+
+
+@dataclass
+class EnvironmentLock:
+    packages: dict = field(default_factory=dict)
+    source: str = ""
+    created_at: str = ""
+
+    @property
+    def fully_hashed(self):
+        return bool(self.packages) and all(package.hashes for package in self.packages.values())
+
+    def install_targets(self, installed_packages):
+        # Pins the interpreter does not already satisfy.
+        targets = {}
+        for key, package in self.packages.items():
+            current = installed_packages.get(key)
+            if current is None or current.get("version") != package.version:
+                targets[key] = package
+        return targets
+
+    def install_specs(self, installed_packages):
+        # In name order like the sync plan's specs.
+        targets = self.install_targets(installed_packages)
+        return [package.spec for package in sorted(targets.values(), key=lambda item: item.name.lower())]
+
+    def hashes_by_spec(self):
+        return {package.spec: package.hashes for package in self.packages.values() if package.hashes}
+
+
+def lock_from_packages(packages, source=""):
+    locked = {}
+    for key, package in packages.items():
+        name = str(package.get("name", key)).strip()
+        version = str(package.get("version", "")).strip()
+        if name and version:
+            locked[normalize_package_name(name)] = LockedPackage(name=name, version=version)
+
+    return EnvironmentLock(
+        packages=locked,
+        source=source,
+        created_at=time.strftime("%Y-%m-%d %H:%M:%S"),
+    )
+
+
+def _wheel_distribution(filename):
+    # name-version(-build)?-python-abi-platform.whl
+    parts = filename[:-4].split("-")
+    if len(parts) < 5:
+        return "", ""
+    return normalize_package_name(parts[0]), parts[1]
+
+
+def attach_wheel_hashes(lock, wheelhouse):
+    # Hashes come from the wheels already gathered for this package set, so
+    # every platform tag present is accepted on the machine applying the lock.
+    # Wheels built here from an sdist are skipped: their hash matches nothing
+    # the index serves, so the package stays unhashed and the lock is not
+    # fully hashed.
+    if not wheelhouse or not os.path.isdir(wheelhouse):
+        return lock
+
+    index_wheels = read_index_wheels(wheelhouse)
+    hashes = {}
+    for entry in sorted(os.scandir(wheelhouse), key=lambda item: item.name):
+        if not entry.name.lower().endswith(".whl") or entry.name not in index_wheels:
+            continue
+        key, version = _wheel_distribution(entry.name)
+        package = lock.packages.get(key)
+        if package is None or package.version != version:
+            continue
+
+        digest = hashlib.sha256()
+        with open(entry.path, "rb") as f:
+            for chunk in iter(lambda: f.read(1024 * 1024), b""):
+                digest.update(chunk)
+        hashes.setdefault(key, []).append(f"sha256:{digest.hexdigest()}")
+
+    for key, package_hashes in hashes.items():
+        package = lock.packages[key]
+        lock.packages[key] = LockedPackage(package.name, package.version, tuple(package_hashes))
+    return lock
+
+
+def render_requirements(lock):
+    lines = [LOCKFILE_HEADER]
+    if lock.source:
+        lines.append(f"# Source: {lock.source}")
+    if lock.created_at:
+        lines.append(f"# Created: {lock.created_at}")
+
+    # pip switches to hash-checking for the whole file as soon as one line
+    # has a hash, so hashes are written for every package or for none.
+    with_hashes = lock.fully_hashed
+    if lock.packages and not with_hashes:
+        lines.append("# Hashes omitted: not every pinned package has an index-downloaded wheel in the wheelhouse.")
+
+    for package in sorted(lock.packages.values(), key=lambda item: item.name.lower()):
+        if with_hashes:
+            hash_lines = " \\\n".join(f"    --hash={value}" for value in package.hashes)
+            lines.append(f"{package.spec} \\\n{hash_lines}")
+        else:
+            lines.append(package.spec)
+
+    return "\n".join(lines) + "\n"
+
+
+def render_json(lock):
+    return json.dumps(
+        {
+            "format": LOCKFILE_FORMAT_VERSION,
+            "source": lock.source,
+            "created_at": lock.created_at,
+            "packages": [
+                {"name": package.name, "version": package.version, "hashes": list(package.hashes)}
+                for package in sorted(lock.packages.values(), key=lambda item: item.name.lower())
+            ],
+        },
+        indent=2,
+    )
+
+
+def write_lockfile(path, lock):
+    text = render_json(lock) if str(path).lower().endswith(LOCKFILE_JSON_SUFFIX) else render_requirements(lock)
+    temp_path = str(path) + ".tmp"
+    with open(temp_path, "w", encoding="utf-8", newline="\n") as f:
+        f.write(text)
+    os.replace(temp_path, path)
+
+
+def _parse_json(text):
+    try:
+        data = json.loads(text)
+    except ValueError as exc:
+        raise LockfileError(f"Unreadable lockfile: {exc}") from exc
+
+    if not isinstance(data, dict) or data.get("format") != LOCKFILE_FORMAT_VERSION:
+        raise LockfileError("Unsupported lockfile format.")
+
+    packages = {}
+    for item in data.get("packages", []):
+        try:
+            package = LockedPackage(
+                name=str(item["name"]).strip(),
+                version=str(item["version"]).strip(),
+                hashes=tuple(str(value) for value in item.get("hashes", [])),
+            )
+        except (KeyError, TypeError, AttributeError):
+            continue
+        if package.name and package.version:
+            packages[normalize_package_name(package.name)] = package
+
+    return EnvironmentLock(
+        packages=packages,
+        source=str(data.get("source", "")),
+        created_at=str(data.get("created_at", "")),
+    )
+
+
+def _parse_requirements(text):
+    packages = {}
+    # Backslash continuations carry the --hash options of the line above.
+    logical_lines = text.replace("\\\r\n", " ").replace("\\\n", " ").splitlines()
+    for line in logical_lines:
+        line = line.split(" #", 1)[0].strip()
+        if not line or line.startswith("#") or line.startswith("-"):
+            continue
+
+        match = _REQUIREMENT_PATTERN.match(line)
+        if match is None:
+            raise LockfileError(f"Only pinned name==version requirements can be applied: {line}")
+
+        name, version = match.groups()
+        packages[normalize_package_name(name)] = LockedPackage(
+            name=name,
+            version=version,
+            hashes=tuple(_HASH_PATTERN.findall(line)),
+        )
+
+    return EnvironmentLock(packages=packages)
+
+
+def read_lockfile(path):
+    try:
+        with open(path, "r", encoding="utf-8-sig") as f:
+            text = f.read()
+    except OSError as exc:
+        raise LockfileError(f"Cannot read lockfile: {exc}") from exc
+
+    if str(path).lower().endswith(LOCKFILE_JSON_SUFFIX):
+        lock = _parse_json(text)
+    else:
+        lock = _parse_requirements(text)
+
+    if not lock.packages:
+        raise LockfileError("The lockfile does not pin any packages.")
+    return lock
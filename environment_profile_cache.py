@@ -0,0 +1,124 @@
+import gzip
+import json
+import os
+import zlib
+
+from site_packages_metadata import normalize_package_name
+
+
+PROFILE_CACHE_FILE_NAME = "env_sync_profiles.json.gz"
+PROFILE_CACHE_FORMAT_VERSION = 1
+PROFILE_CACHE_COMPRESS_LEVEL = 6
+_GZIP_MAGIC = b"\x1f\x8b"
+
+
+def encode_profiles(serialized_profiles):
+    # Interpreters mostly share the same packages, so every name is stored
+    # once and each profile keeps one version slot per name (null = absent).
+    # A name is stored as [key, name] only when its key is not the usual
+    # normalised form.
+    entries = []
+    index_by_entry = {}
+    for profile in serialized_profiles:
+        for key, package in profile.get("packages", {}).items():
+            name = str(package.get("name", key))
+            entry = name if key == normalize_package_name(name) else (str(key), name)
+            if entry not in index_by_entry:
+                index_by_entry[entry] = len(entries)
+                entries.append(entry)
+
+    profiles = []
+    for profile in serialized_profiles:
+        versions = [None] * len(entries)
+        for key, package in profile.get("packages", {}).items():
+            name = str(package.get("name", key))
+            entry = name if key == normalize_package_name(name) else (str(key), name)
+            versions[index_by_entry[entry]] = str(package.get("version", ""))
+
+        profiles.append(
+            {
+                "version": str(profile.get("version", "")),
+                "executable": str(profile.get("executable", "")),
+                "error": str(profile.get("error", "") or ""),
+                "fingerprint": str(profile.get("fingerprint", "") or ""),
+                "versions": versions,
+            }
+        )
+
+    return {
+        "format": PROFILE_CACHE_FORMAT_VERSION,
+        "names": [list(entry) if isinstance(entry, tuple) else entry for entry in entries],
+        "profiles": profiles,
+    }
+
+
+def decode_profiles(data):
+    # Returns profiles in the serialize_profiles() shape; anything unreadable
+    # yields an empty list and the next scan rebuilds it.
+    if not isinstance(data, dict) or data.get("format") != PROFILE_CACHE_FORMAT_VERSION:
+        return []
+
+    names = data.get("names")
+    profiles = data.get("profiles")
+    if not isinstance(names, list) or not isinstance(profiles, list):
+        return []
+
+    entries = []
+    for entry in names:
+        if isinstance(entry, list) and len(entry) == 2:
+            entries.append((str(entry[0]), str(entry[1])))
+        else:
+            name = str(entry)
+            entries.append((normalize_package_name(name), name))
+
+    decoded = []
+    for profile in profiles:
+        if not isinstance(profile, dict):
+            continue
+        versions = profile.get("versions")
+        if not isinstance(versions, list):
+            versions = []
+
+        packages = {}
+        for (key, name), version in zip(entries, versions):
+            if version is not None:
+                packages[key] = {"name": name, "version": str(version)}
+
+        decoded.append(
+            {
+                "version": str(profile.get("version", "")),
+                "executable": str(profile.get("executable", "")),
+                "packages": packages,
+                "error": str(profile.get("error", "") or ""),
+                "fingerprint": str(profile.get("fingerprint", "") or ""),
+            }
+        )
+
+    return decoded
+
+
+def read_profile_cache(path):
+    try:
+        with open(path, "rb") as f:
+            raw = f.read()
+        if raw.startswith(_GZIP_MAGIC):
+            raw = gzip.decompress(raw)
+        data = json.loads(raw.decode("utf-8"))
+    except (OSError, EOFError, ValueError, zlib.error):
+        return []
+    return decode_profiles(data)
+
+
+def write_profile_cache(path, serialized_profiles, compress=True):
+    raw = json.dumps(encode_profiles(serialized_profiles), separators=(",", ":")).encode("utf-8")
+    if compress:
+        raw = gzip.compress(raw, compresslevel=PROFILE_CACHE_COMPRESS_LEVEL, mtime=0)
+
+    temp_path = path + ".tmp"
+    try:
+        with open(temp_path, "wb") as f:
+            f.write(raw)
+        os.replace(temp_path, path)
+    except OSError:
+        return False
+    return True
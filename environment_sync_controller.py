@@ -1,15 +1,115 @@
+import heapq
 import json
+import logging
 import os
 import re
 import subprocess
+import tempfile
+import threading
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from dataclasses import dataclass, field
+from functools import lru_cache
+from logging.handlers import RotatingFileHandler
 from pathlib import Path
 
 from PySide6.QtCore import QObject, QThread, Signal
 
+from environment_lockfile import attach_wheel_hashes, lock_from_packages, write_lockfile
+from environment_profile_cache import read_profile_cache, write_profile_cache
+from environment_sync_preview import (
+    INSTALL_HISTORY,
+    SyncPreview,
+    WheelCacheIndex,
+    build_lock_preview,
+    build_sync_preview,
+)
+from interpreter_cache import INTERPRETER_CAPABILITIES, InterpreterProbeError
+from python_discovery import (
+    DISCOVERY_SOURCE_CONDA,
+    DISCOVERY_SOURCE_PATH,
+    DISCOVERY_SOURCE_PROGRAMS,
+    DISCOVERY_SOURCE_REGISTRY,
+    PYTHON_DISCOVERY,
+    default_programs_root,
+    interpreter_key,
+)
+from site_packages_metadata import (
+    MetadataReadError,
+    environment_fingerprint,
+    normalize_package_name,
+    read_installed_packages_from_metadata,
+)
+from wheelhouse import (
+    default_wheelhouse_dir,
+    index_wheel_filename,
+    record_index_wheels,
+    wheelhouse_gather_command,
+    wheelhouse_install_command,
+    wheelhouse_wheels,
+)
+
 
 CREATE_NO_WINDOW = 0x08000000 if os.name == "nt" else 0
 
+# Project venvs are left out: topping one up with the union of every other
+# environment would undo whatever the project pinned.
+ENVIRONMENT_SYNC_SOURCES = (
+    DISCOVERY_SOURCE_PROGRAMS,
+    DISCOVERY_SOURCE_REGISTRY,
+    DISCOVERY_SOURCE_PATH,
+    DISCOVERY_SOURCE_CONDA,
+)
+
+MAX_PARALLEL_ENVIRONMENT_SCANS = 4
+# Installs are heavier than scans (downloads, builds, disk writes); the cap
+# is user-adjustable through the env_sync_max_parallel setting.
+MAX_PARALLEL_ENVIRONMENT_SYNCS = 2
+PYTHON_VERSION_PROBE_TIMEOUT = 15
+PIP_LIST_TIMEOUT = 90
+# Upper bound for everything probed from one interpreter, so one hung install
+# cannot hold up the whole scan.
+ENVIRONMENT_SCAN_TIMEOUT = 120
+# Distinct version strings across every profile; data-science stacks reuse
+# the same few thousand, so the cache stays warm between plans.
+VERSION_KEY_CACHE_SIZE = 65536
+PIP_INSTALL_TIMEOUT = 600
+# A batch resolves once but downloads and builds every spec, so its timeout
+# grows with the batch, up to a ceiling.
+PIP_BATCH_INSTALL_TIMEOUT = 3600
+
+SYNC_LOG_FILE_NAME = "environment_sync.log"
+SYNC_LOG_MAX_BYTES = 2 * 1024 * 1024
+SYNC_LOG_BACKUP_COUNT = 3
+# Only the end of pip's output is kept in memory; the failure reason is
+# always in the last lines, and the full run is in the sync log.
+SYNC_OUTPUT_TAIL_LINES = 200
+SYNC_PROGRESS_INTERVAL_SECONDS = 0.25
+_PIP_PROGRESS_PATTERN = re.compile(
+    r"\s*(Collecting|Downloading|Using cached|Processing|Building wheel|Created wheel"
+    r"|Installing collected packages|Successfully installed|Successfully built|Saved)\b"
+)
+
+
+def default_sync_log_path():
+    return os.path.join(
+        os.getenv("LOCALAPPDATA") or os.path.expanduser("~"),
+        "EXEBuilder",
+        SYNC_LOG_FILE_NAME,
+    )
+
+
+_VERSION_PART_PATTERN = re.compile(r"\d+|[a-zA-Z]+")
+
+
+@lru_cache(maxsize=VERSION_KEY_CACHE_SIZE)
+def parse_version_key(value):
+    return tuple(
+        (1, int(part)) if part.isdigit() else (0, part.lower())
+        for part in _VERSION_PART_PATTERN.findall(str(value))
+    )
+
 
 @dataclass
 class PythonEnvironmentProfile:
@@ -17,6 +117,7 @@ class PythonEnvironmentProfile:
     executable: str
     packages: dict = field(default_factory=dict)
     error: str = ""
+    fingerprint: str = ""
 
 
 @dataclass
@@ -24,15 +125,22 @@ class EnvironmentSyncPlan:
     profiles: list
     baseline_version: str = ""
     union_packages: dict = field(default_factory=dict)
-    missing_by_version: dict = field(default_factory=dict)
-    mismatched_by_version: dict = field(default_factory=dict)
+    # Keyed by interpreter_key(profile.executable); the version is only shown.
+    missing_by_executable: dict = field(default_factory=dict)
+    mismatched_by_executable: dict = field(default_factory=dict)
 
     @property
     def total_actions(self):
-        missing = sum(len(items) for items in self.missing_by_version.values())
-        mismatched = sum(len(items) for items in self.mismatched_by_version.values())
+        missing = sum(len(items) for items in self.missing_by_executable.values())
+        mismatched = sum(len(items) for items in self.mismatched_by_executable.values())
         return missing + mismatched
 
+    def missing_for(self, profile):
+        return self.missing_by_executable.get(interpreter_key(profile.executable), {})
+
+    def mismatched_for(self, profile):
+        return self.mismatched_by_executable.get(interpreter_key(profile.executable), {})
+
 
 @dataclass
 class PythonEnvironmentSyncResult:
@@ -46,25 +154,49 @@ class PythonEnvironmentSyncResult:
         return not self.failed
 
 
+_WORKER_ACTION_TITLES = {
+    "preview_lock": "Lockfile check",
+    "apply_lock": "Lockfile apply",
+    "export_lock": "Lockfile export",
+}
+
+
 class EnvironmentSyncWorker(QObject):
     finished = Signal(str, object)
     failed = Signal(str, str)
     progress = Signal(str)
 
-    def __init__(self, controller, action):
+    def __init__(self, controller, action, argument=None):
         super().__init__()
         self.controller = controller
         self.action = action
+        self.argument = argument
 
     def run(self):
         try:
             if self.action == "scan":
-                payload = self.controller.scan_profiles(update_ui=False)
+                payload = self.controller.scan_profiles(
+                    update_ui=False,
+                    progress_callback=self.progress.emit,
+                )
             elif self.action == "sync":
                 payload = self.controller.sync_dependencies(
                     update_ui=False,
                     progress_callback=self.progress.emit,
+                    selection=self.argument,
                 )
+            elif self.action == "preview_lock":
+                payload = self.controller.preview_lockfile(self.argument)
+            elif self.action == "apply_lock":
+                lock, selection = self.argument
+                payload = self.controller.apply_lockfile(
+                    lock,
+                    update_ui=False,
+                    progress_callback=self.progress.emit,
+                    selection=selection,
+                )
+            elif self.action == "export_lock":
+                payload = (self.argument, self.controller.export_lockfile(self.argument))
             else:
                 raise ValueError(f"Unknown environment sync action: {self.action}")
 
@@ -74,31 +206,61 @@ class EnvironmentSyncWorker(QObject):
 
 
 class EnvironmentSyncController(QObject):
-    def __init__(self, app=None):
+    def __init__(self, app=None, wheelhouse_dir=None, sync_log_path=None):
         super().__init__()
         self.app = app
         self.last_plan = None
         self._thread = None
         self._worker = None
-        self._current_process = None
+        self._active_processes = set()
+        self._process_lock = threading.Lock()
         self._shutting_down = False
         self.is_running = False
-
-    def start_scan_async(self):
-        return self._start_async("scan")
-
-    def start_sync_async(self):
-        return self._start_async("sync")
-
-    def _start_async(self, action):
+        self.batch_installs = True
+        # An empty value turns the shared wheelhouse off and installs straight
+        # from the index.
+        self.wheelhouse_dir = default_wheelhouse_dir() if wheelhouse_dir is None else wheelhouse_dir
+        self._wheelhouse_lock = threading.Lock()
+        self._wheelhouse_generation = 0
+        self.sync_log_path = default_sync_log_path() if sync_log_path is None else sync_log_path
+        self._sync_log = None
+        self._sync_log_lock = threading.Lock()
+        # Set per install thread by _sync_profile; receives each pip line.
+        self._pip_output = threading.local()
+        self.profile_cache_path = ""
+        self._profile_cache_pending = False
+        self._profile_cache_lock = threading.Lock()
+        self._saved_profiles = None
+        self._after_worker = None
+        self._worker_continuation = None
+
+    def start_scan_async(self, on_finished=None):
+        return self._start_async("scan", on_finished=on_finished)
+
+    def start_sync_async(self, selection=None):
+        return self._start_async("sync", selection)
+
+    def start_lock_preview_async(self, lock, on_finished):
+        return self._start_async("preview_lock", lock, on_finished)
+
+    def start_apply_lock_async(self, lock, selection=None):
+        return self._start_async("apply_lock", (lock, selection))
+
+    def start_export_lock_async(self, path):
+        return self._start_async("export_lock", path)
+
+    def _start_async(self, action, argument=None, on_finished=None):
+        # on_finished(payload) runs on the GUI thread once the worker has
+        # finished and the controller is idle again.
         if self.is_running or self._shutting_down:
             return False
 
         self.is_running = True
+        self._after_worker = on_finished
         self._set_busy_ui(True)
 
         self._thread = QThread()
-        self._worker = EnvironmentSyncWorker(self, action)
+        self._worker = EnvironmentSyncWorker(self, action, argument)
         self._worker.moveToThread(self._thread)
 
         self._thread.started.connect(self._worker.run)
@@ -118,8 +280,10 @@ class EnvironmentSyncController(QObject):
     def shutdown(self, timeout_ms=5000):
         self._shutting_down = True
 
-        process = getattr(self, "_current_process", None)
-        if process is not None and process.poll() is None:
+        # Scans run one child per interpreter at once; stop every one of them.
+        for process in self._running_processes():
+            if process.poll() is not None:
+                continue
             try:
                 process.terminate()
                 process.wait(timeout=2)
@@ -142,53 +306,154 @@ class EnvironmentSyncController(QObject):
 
         self._thread = None
         self._worker = None
-        self._current_process = None
+        with self._process_lock:
+            self._active_processes.clear()
+        self._close_sync_log()
         self.is_running = False
         if not self._app_is_closing():
             self._set_busy_ui(False)
 
+    def _running_processes(self):
+        with self._process_lock:
+            return list(self._active_processes)
+
     def default_python_root(self):
-        return Path.home() / "AppData" / "Local" / "Programs" / "Python"
+        return default_programs_root()
 
     def detect_python_installations(self, root=None):
-        root_path = Path(root) if root else self.default_python_root()
-        if not root_path.is_dir():
-            return []
+        interpreters = PYTHON_DISCOVERY.discover(
+            sources=ENVIRONMENT_SYNC_SOURCES,
+            programs_root=root or self.default_python_root(),
+        )
 
-        executables = []
-        for child in root_path.iterdir():
-            if not child.is_dir():
-                continue
+        # Installs under the Programs root are named by version and listed in
+        # version order; the rest follow in discovery order.
+        programs = [
+            Path(interpreter.executable)
+            for interpreter in interpreters
+            if interpreter.source == DISCOVERY_SOURCE_PROGRAMS
+        ]
+        others = [
+            Path(interpreter.executable)
+            for interpreter in interpreters
+            if interpreter.source != DISCOVERY_SOURCE_PROGRAMS
+        ]
+        return sorted(programs, key=lambda path: self._version_key(path.parent.name)) + others
 
-            executable = child / "python.exe"
-            if executable.is_file():
-                executables.append(executable)
+    def _scan_concurrency(self, interpreter_count):
+        return max(1, min(interpreter_count, MAX_PARALLEL_ENVIRONMENT_SCANS))
 
-        return sorted(executables, key=lambda path: self._version_key(path.parent.name))
+    def _sync_concurrency(self, profile_count):
+        try:
+            limit = int(getattr(self.app, "env_sync_max_parallel", MAX_PARALLEL_ENVIRONMENT_SYNCS))
+        except (TypeError, ValueError):
+            limit = MAX_PARALLEL_ENVIRONMENT_SYNCS
+        return max(1, min(profile_count, limit))
+
+    def _scan_profile(self, executable):
+        deadline = time.monotonic() + ENVIRONMENT_SCAN_TIMEOUT
+        version = executable.parent.name
+        try:
+            version = self._read_python_version(executable)
+            # Taken before reading so a change made mid-read shows up as a
+            # changed fingerprint next time rather than being cached over.
+            fingerprint = self._environment_fingerprint(executable, version)
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                raise subprocess.TimeoutExpired(str(executable), ENVIRONMENT_SCAN_TIMEOUT)
+
+            packages = self._read_installed_packages(
+                executable,
+                timeout=min(PIP_LIST_TIMEOUT, remaining),
+            )
+            return PythonEnvironmentProfile(
+                version=version,
+                executable=str(executable),
+                packages=packages,
+                fingerprint=fingerprint,
+            )
+        except subprocess.TimeoutExpired as exc:
+            return PythonEnvironmentProfile(
+                version=version,
+                executable=str(executable),
+                error=f"Timed out after {int(exc.timeout)}s.",
+            )
+        except Exception as exc:
+            return PythonEnvironmentProfile(
+                version=version,
+                executable=str(executable),
+                error=str(exc),
+            )
 
-    def scan_profiles(self, root=None, update_ui=True):
-        profiles = []
+    def _environment_fingerprint(self, executable, version):
+        try:
+            return environment_fingerprint(executable, version)
+        except (OSError, ValueError):
+            return ""
 
-        for executable in self.detect_python_installations(root):
-            version = executable.parent.name
-            try:
-                version = self._read_python_version(executable)
-                packages = self._read_installed_packages(executable)
-                profiles.append(
-                    PythonEnvironmentProfile(
-                        version=version,
-                        executable=str(executable),
-                        packages=packages,
-                    )
-                )
-            except Exception as exc:
-                profiles.append(
-                    PythonEnvironmentProfile(
-                        version=version,
-                        executable=str(executable),
-                        error=str(exc),
-                    )
-                )
+    def _executable_key(self, executable):
+        return interpreter_key(executable)
+
+    def _cached_profiles(self):
+        self.ensure_profiles_loaded(update_ui=False)
+        plan = self.last_plan
+        if not plan:
+            return {}
+
+        # Failed scans are always retried; they carry no fingerprint.
+        return {
+            self._executable_key(profile.executable): profile
+            for profile in plan.profiles
+            if profile.fingerprint and not profile.error
+        }
+
+    def _scan_or_reuse_profile(self, executable, cached_profile):
+        if cached_profile is not None:
+            fingerprint = self._environment_fingerprint(executable, cached_profile.version)
+            if fingerprint and fingerprint == cached_profile.fingerprint:
+                return cached_profile, True
+
+        return self._scan_profile(executable), False
+
+    def scan_profiles(self, root=None, update_ui=True, progress_callback=None, rescan=None, force=False):
+        executables = self.detect_python_installations(root)
+        profiles = [None] * len(executables)
+
+        # Only interpreters whose fingerprint changed are read again; "rescan"
+        # forces the listed executables and "force" every one of them.
+        cached_profiles = {} if force else self._cached_profiles()
+        for executable in rescan or ():
+            cached_profiles.pop(self._executable_key(executable), None)
+
+        if executables:
+            with ThreadPoolExecutor(
+                max_workers=self._scan_concurrency(len(executables)),
+                thread_name_prefix="env-scan",
+            ) as pool:
+                futures = {
+                    pool.submit(
+                        self._scan_or_reuse_profile,
+                        executable,
+                        cached_profiles.get(self._executable_key(executable)),
+                    ): index
+                    for index, executable in enumerate(executables)
+                }
+                for completed, future in enumerate(as_completed(futures), start=1):
+                    profile, reused = future.result()
+                    # Keep detection order (sorted by version) regardless of
+                    # which interpreter answers first.
+                    profiles[futures[future]] = profile
+                    if progress_callback:
+                        if reused:
+                            state = f"unchanged, {len(profile.packages)} packages"
+                        elif profile.error:
+                            state = "scan failed"
+                        else:
+                            state = f"{len(profile.packages)} packages"
+                        progress_callback(
+                            f"Scanned Python {profile.version}: {state} "
+                            f"({completed}/{len(executables)})"
+                        )
 
         self.last_plan = self.build_sync_plan(profiles)
         if update_ui:
@@ -215,6 +480,7 @@ class EnvironmentSyncController(QObject):
                     "executable": str(profile.executable),
                     "packages": packages,
                     "error": str(profile.error or ""),
+                    "fingerprint": str(profile.fingerprint or ""),
                 }
             )
 
@@ -253,6 +519,7 @@ class EnvironmentSyncController(QObject):
                     executable=str(item.get("executable", "")),
                     packages=packages,
                     error=str(item.get("error", "") or ""),
+                    fingerprint=str(item.get("fingerprint", "") or ""),
                 )
             )
 
@@ -262,7 +529,56 @@ class EnvironmentSyncController(QObject):
 
         return self.last_plan
 
-    def sync_dependencies(self, update_ui=True, progress_callback=None):
+    def attach_profile_cache(self, path, legacy_profiles=None):
+        # Profiles saved by older versions inside the state file move to the
+        # cache file once. Nothing is read here: the cache is loaded the first
+        # time the panel or a sync action needs it.
+        self.profile_cache_path = str(path or "")
+        if legacy_profiles and self.profile_cache_path and not os.path.isfile(self.profile_cache_path):
+            write_profile_cache(self.profile_cache_path, legacy_profiles)
+        self._profile_cache_pending = bool(self.profile_cache_path)
+        self._saved_profiles = None
+
+    def ensure_profiles_loaded(self, update_ui=True):
+        with self._profile_cache_lock:
+            if not self._profile_cache_pending:
+                return self.last_plan
+            self._profile_cache_pending = False
+            profiles = read_profile_cache(self.profile_cache_path)
+            self._saved_profiles = profiles
+
+        # A scan that finished first is newer than anything on disk.
+        if profiles and self.last_plan is None:
+            self.load_serialized_profiles(profiles, update_ui=update_ui)
+        return self.last_plan
+
+    def save_profile_cache(self):
+        # An unread cache is still current unless a scan has replaced it.
+        if not self.profile_cache_path or (self._profile_cache_pending and self.last_plan is None):
+            return False
+
+        profiles = self.serialize_profiles()
+        if profiles == self._saved_profiles:
+            return False
+        if not write_profile_cache(self.profile_cache_path, profiles):
+            return False
+        self._saved_profiles = profiles
+        return True
+
+    def preview_sync(self):
+        # Returns None until profiles have been scanned; the scan itself is
+        # left to start_scan_async so the GUI thread never waits on pip.
+        self.ensure_profiles_loaded(update_ui=False)
+        if self.last_plan is None:
+            return None
+        if not self.last_plan.profiles:
+            return SyncPreview()
+        return build_sync_preview(self.last_plan, self._version_key, WheelCacheIndex(self.wheelhouse_dir))
+
+    def sync_dependencies(self, update_ui=True, progress_callback=None, selection=None):
+        # selection maps interpreter_key(executable) to the specs picked in
+        # the preview; None syncs the whole plan.
+        self.ensure_profiles_loaded(update_ui=False)
         if self.last_plan is None:
             self.scan_profiles(update_ui=False)
 
@@ -270,49 +586,227 @@ class EnvironmentSyncController(QObject):
         if not plan or not plan.profiles:
             return []
 
-        results = []
-        for profile in plan.profiles:
+        results = [None] * len(plan.profiles)
+        pending = []
+        for index, profile in enumerate(plan.profiles):
             if profile.error:
-                results.append(
-                    PythonEnvironmentSyncResult(
-                        version=profile.version,
-                        failed={"profile": profile.error},
-                        message=profile.error,
-                    )
+                results[index] = PythonEnvironmentSyncResult(
+                    version=profile.version,
+                    failed={"profile": profile.error},
+                    message=profile.error,
                 )
                 continue
 
             specs = self._install_specs_for_profile(profile, plan)
-            if not specs:
-                results.append(
-                    PythonEnvironmentSyncResult(
+            if specs and selection is not None:
+                selected = set(selection.get(self._executable_key(profile.executable), ()))
+                specs = [spec for spec in specs if spec in selected]
+                if not specs:
+                    results[index] = PythonEnvironmentSyncResult(
                         version=profile.version,
-                        message="Already synced.",
+                        message="Not selected.",
                     )
+                    continue
+
+            if not specs:
+                results[index] = PythonEnvironmentSyncResult(
+                    version=profile.version,
+                    message="Already synced.",
                 )
                 continue
 
-            sync_result = PythonEnvironmentSyncResult(version=profile.version)
-            for spec in specs:
-                if progress_callback:
-                    progress_callback(f"Python {profile.version}: installing {spec}")
+            pending.append((index, profile, specs))
 
-                ok, message = self._install_package_spec(profile.executable, spec)
-                if ok:
-                    sync_result.installed.append(spec)
-                else:
-                    sync_result.failed[spec] = message
+        for index, sync_result in self._run_profile_syncs(pending, progress_callback).items():
+            results[index] = sync_result
 
-            installed_count = len(sync_result.installed)
-            failed_count = len(sync_result.failed)
-            sync_result.message = (
-                f"Installed {installed_count}; failed {failed_count}."
+        # Interpreters pip never ran against keep their cached profile unless
+        # something else changed them in the meantime.
+        self.scan_profiles(
+            update_ui=update_ui,
+            rescan=[profile.executable for _, profile, _ in pending],
+        )
+        return results
+
+    def _run_profile_syncs(self, pending, progress_callback=None, hashes=None):
+        results = {}
+        if not pending:
+            return results
+
+        with ThreadPoolExecutor(
+            max_workers=self._sync_concurrency(len(pending)),
+            thread_name_prefix="env-sync",
+        ) as pool:
+            futures = {
+                pool.submit(self._sync_profile, profile, specs, progress_callback, hashes): index
+                for index, profile, specs in pending
+            }
+            for future in as_completed(futures):
+                results[futures[future]] = future.result()
+        return results
+
+    def export_lockfile(self, path, executable=None):
+        self.ensure_profiles_loaded(update_ui=False)
+        plan = self.last_plan
+        if not plan or not plan.profiles:
+            raise ValueError("Scan Python profiles before exporting a lockfile.")
+
+        if executable:
+            key = self._executable_key(executable)
+            profile = next(
+                (item for item in plan.profiles if self._executable_key(item.executable) == key),
+                None,
             )
-            results.append(sync_result)
+            if profile is None or profile.error:
+                raise ValueError(f"No scanned profile for {executable}.")
+            lock = lock_from_packages(profile.packages, source=f"Python {profile.version} ({profile.executable})")
+        else:
+            if not plan.union_packages:
+                raise ValueError("The sync plan has no packages to export.")
+            lock = lock_from_packages(plan.union_packages, source=f"Sync plan (baseline {plan.baseline_version})")
+
+        attach_wheel_hashes(lock, self.wheelhouse_dir)
+        write_lockfile(path, lock)
+        return lock
+
+    def _profiles_for(self, executables):
+        cached_profiles = self._cached_profiles()
+        profiles = [None] * len(executables)
+        if not executables:
+            return profiles
+
+        with ThreadPoolExecutor(
+            max_workers=self._scan_concurrency(len(executables)),
+            thread_name_prefix="env-scan",
+        ) as pool:
+            futures = {
+                pool.submit(
+                    self._scan_or_reuse_profile,
+                    executable,
+                    cached_profiles.get(self._executable_key(executable)),
+                ): index
+                for index, executable in enumerate(executables)
+            }
+            for future in as_completed(futures):
+                profiles[futures[future]] = future.result()[0]
+        return profiles
+
+    def _merge_profiles(self, updated_profiles, update_ui=True):
+        updated = {self._executable_key(profile.executable): profile for profile in updated_profiles}
+        current = list(self.last_plan.profiles) if self.last_plan else []
+        merged = [updated.pop(self._executable_key(profile.executable), profile) for profile in current]
+        merged.extend(updated.values())
+
+        self.last_plan = self.build_sync_plan(merged)
+        if update_ui:
+            self.update_ui_from_plan(self.last_plan)
+        return self.last_plan
+
+    def _lock_targets(self, executables=None):
+        if executables:
+            return [Path(executable) for executable in executables]
+        return self.detect_python_installations()
+
+    def preview_lockfile(self, lock, executables=None):
+        # What apply_lockfile would change in each target, for the preview
+        # dialog; reads the targets the same way apply does.
+        profiles = self._profiles_for(self._lock_targets(executables))
+        return build_lock_preview(lock, profiles, self._version_key, WheelCacheIndex(self.wheelhouse_dir))
+
+    def apply_lockfile(self, lock, executables=None, update_ui=True, progress_callback=None, selection=None):
+        # Only the target interpreters are read, and those whose fingerprint
+        # is unchanged come straight from the cached profiles; the rest of
+        # the machine is never scanned. selection, as returned by the preview
+        # dialog, limits which interpreters and pins are installed.
+        profiles = self._profiles_for(self._lock_targets(executables))
+
+        results = [None] * len(profiles)
+        pending = []
+        for index, profile in enumerate(profiles):
+            selected = None
+            if selection is not None:
+                selected = set(selection.get(self._executable_key(profile.executable), ()))
+                if not selected:
+                    results[index] = PythonEnvironmentSyncResult(
+                        version=profile.version,
+                        message="Not selected.",
+                    )
+                    continue
+
+            if profile.error:
+                results[index] = PythonEnvironmentSyncResult(
+                    version=profile.version,
+                    failed={"profile": profile.error},
+                    message=profile.error,
+                )
+                continue
+
+            specs = lock.install_specs(profile.packages)
+            if selected is not None:
+                specs = [spec for spec in specs if spec in selected]
+            if not specs:
+                results[index] = PythonEnvironmentSyncResult(
+                    version=profile.version,
+                    message="Already matches the lockfile.",
+                )
+                continue
 
-        self.scan_profiles(update_ui=update_ui)
+            pending.append((index, profile, specs))
+
+        hashes = lock.hashes_by_spec() if lock.fully_hashed else None
+        for index, sync_result in self._run_profile_syncs(pending, progress_callback, hashes).items():
+            results[index] = sync_result
+
+        installed_into = {index for index, _, _ in pending}
+        self._merge_profiles(
+            [
+                self._scan_profile(Path(profile.executable)) if index in installed_into else profile
+                for index, profile in enumerate(profiles)
+            ],
+            update_ui=update_ui,
+        )
         return results
 
+    def _sync_profile(self, profile, specs, progress_callback=None, hashes=None):
+        sync_result = PythonEnvironmentSyncResult(version=profile.version)
+
+        self._pip_output.profile = profile
+        self._pip_output.callback = self._pip_progress_forwarder(profile, progress_callback)
+        self._pip_output.hashes = hashes
+        started = time.monotonic()
+        try:
+            # Hash-checked installs go through a requirements file; the
+            # wheelhouse shortcut would bypass the check.
+            if not hashes and self.wheelhouse_dir and self._install_from_wheelhouse(profile, specs, progress_callback):
+                sync_result.installed.extend(specs)
+            elif self.batch_installs:
+                self._install_specs_batched(profile, specs, sync_result, progress_callback)
+            else:
+                for spec in specs:
+                    if progress_callback:
+                        progress_callback(f"Python {profile.version}: installing {spec}")
+
+                    ok, message = self._install_package_spec(profile.executable, spec)
+                    if ok:
+                        sync_result.installed.append(spec)
+                    else:
+                        sync_result.failed[spec] = message
+        finally:
+            self._pip_output.profile = None
+            self._pip_output.callback = None
+            self._pip_output.hashes = None
+
+        # Feeds the time estimates shown in the sync preview.
+        if sync_result.installed and not sync_result.failed:
+            INSTALL_HISTORY.record(sync_result.installed, time.monotonic() - started)
+
+        installed_count = len(sync_result.installed)
+        failed_count = len(sync_result.failed)
+        sync_result.message = (
+            f"Installed {installed_count}; failed {failed_count}."
+        )
+        return sync_result
+
     def build_sync_plan(self, profiles):
         healthy_profiles = [profile for profile in profiles if not profile.error]
         if not healthy_profiles:
@@ -326,49 +820,46 @@ class EnvironmentSyncController(QObject):
             ),
         )
 
-        occurrences = {}
+        # Packages the baseline lacks take the newest version seen anywhere,
+        # with the newer interpreter winning a tie.
+        union_packages = dict(baseline.packages)
+        baseline_keys = baseline.packages.keys()
+        best_ranks = {}
         for profile in healthy_profiles:
-            for key, package in profile.packages.items():
-                occurrences.setdefault(key, []).append((profile, package))
-
-        union_packages = {}
-        for key, package_occurrences in occurrences.items():
-            baseline_package = baseline.packages.get(key)
-            if baseline_package:
-                union_packages[key] = baseline_package
+            if profile is baseline:
                 continue
 
-            _, selected_package = max(
-                package_occurrences,
-                key=lambda item: (
-                    self._version_key(item[1]["version"]),
-                    self._version_key(item[0].version),
-                ),
-            )
-            union_packages[key] = selected_package
-
-        missing_by_version = {}
-        mismatched_by_version = {}
+            profile_rank = self._version_key(profile.version)
+            for key in profile.packages.keys() - baseline_keys:
+                package = profile.packages[key]
+                rank = (self._version_key(package["version"]), profile_rank)
+                if key not in best_ranks or rank > best_ranks[key]:
+                    best_ranks[key] = rank
+                    union_packages[key] = package
+
+        # (key, version) pairs turn both checks into set differences done in
+        # C: a pair the profile lacks is either a missing key or a mismatch.
+        union_keys = union_packages.keys()
+        union_versions = {key: package["version"] for key, package in union_packages.items()}
+        missing_by_executable = {}
+        mismatched_by_executable = {}
         for profile in healthy_profiles:
-            missing = {}
-            mismatched = {}
-
-            for key, target_package in union_packages.items():
-                current_package = profile.packages.get(key)
-                if current_package is None:
-                    missing[key] = target_package
-                elif current_package["version"] != target_package["version"]:
-                    mismatched[key] = target_package
-
-            missing_by_version[profile.version] = missing
-            mismatched_by_version[profile.version] = mismatched
+            profile_versions = {key: package["version"] for key, package in profile.packages.items()}
+            missing_keys = union_keys - profile_versions.keys()
+            differing = union_versions.items() - profile_versions.items()
+
+            profile_key = interpreter_key(profile.executable)
+            missing_by_executable[profile_key] = {key: union_packages[key] for key in missing_keys}
+            mismatched_by_executable[profile_key] = {
+                key: union_packages[key] for key, _ in differing if key not in missing_keys
+            }
 
         return EnvironmentSyncPlan(
             profiles=profiles,
             baseline_version=baseline.version,
             union_packages=union_packages,
-            missing_by_version=missing_by_version,
-            mismatched_by_version=mismatched_by_version,
+            missing_by_executable=missing_by_executable,
+            mismatched_by_executable=mismatched_by_executable,
         )
 
     def update_ui_from_plan(self, plan):
@@ -387,7 +878,7 @@ class EnvironmentSyncController(QObject):
 
         if not plan.profiles:
             app.set_env_sync_status(
-                "No Python installs found under AppData\\Local\\Programs\\Python."
+                "No Python installs found (AppData\\Local\\Programs\\Python, py launcher, PATH or conda)."
             )
             app.env_sync_match_btn.setEnabled(False)
             return
@@ -406,31 +897,35 @@ class EnvironmentSyncController(QObject):
             if profile.error:
                 status = "Scan failed"
             else:
-                missing_count = len(plan.missing_by_version.get(profile.version, {}))
-                mismatch_count = len(plan.mismatched_by_version.get(profile.version, {}))
+                missing = plan.missing_for(profile)
+                mismatched = plan.mismatched_for(profile)
+                missing_count = len(missing)
+                mismatch_count = len(mismatched)
                 if missing_count == 0 and mismatch_count == 0:
                     status = "Synced"
                 elif missing_count and mismatch_count:
                     status = (
                         f"Missing {missing_count}: "
-                        f"{self._package_preview(plan.missing_by_version[profile.version])} | "
+                        f"{self._package_preview(missing)} | "
                         f"Mismatch {mismatch_count}: "
-                        f"{self._package_preview(plan.mismatched_by_version[profile.version])}"
+                        f"{self._package_preview(mismatched)}"
                     )
                 elif missing_count:
                     status = (
                         f"Missing {missing_count}: "
-                        f"{self._package_preview(plan.missing_by_version[profile.version])}"
+                        f"{self._package_preview(missing)}"
                     )
                 else:
                     status = (
                         f"Mismatch {mismatch_count}: "
-                        f"{self._package_preview(plan.mismatched_by_version[profile.version])}"
+                        f"{self._package_preview(mismatched)}"
                     )
 
             app.add_env_sync_status_row(profile.version, str(installed_count), status)
 
         app.env_sync_match_btn.setEnabled(plan.total_actions > 0)
+        if hasattr(app, "env_sync_export_btn"):
+            app.env_sync_export_btn.setEnabled(bool(plan.union_packages))
 
     def _on_worker_progress(self, message):
         if self._app_is_closing():
@@ -442,6 +937,10 @@ class EnvironmentSyncController(QObject):
         if self._app_is_closing():
             return
 
+        if self._after_worker is not None:
+            self._worker_continuation = (self._after_worker, payload)
+            self._after_worker = None
+
         if action == "scan":
             plan = payload
             self.last_plan = plan
@@ -450,6 +949,15 @@ class EnvironmentSyncController(QObject):
                 self.app.state_ctrl.save_state()
             return
 
+        if action == "preview_lock":
+            return
+
+        if action == "export_lock":
+            path, lock = payload
+            hashed = "with hashes" if lock.fully_hashed else "without hashes"
+            self.app.set_env_sync_status(f"Exported {len(lock.packages)} pinned packages {hashed} to {path}")
+            return
+
         results = payload
         failed_count = sum(len(result.failed) for result in results)
         installed_count = sum(len(result.installed) for result in results)
@@ -457,29 +965,38 @@ class EnvironmentSyncController(QObject):
         if self.last_plan is not None:
             self.update_ui_from_plan(self.last_plan)
 
+        title = "Lockfile apply" if action == "apply_lock" else "Dependency sync"
         if failed_count:
             failure_preview = self._sync_failure_preview(results)
 
             self.app.set_env_sync_status(
-                f"Dependency sync finished.\n"
+                f"{title} finished.\n"
                 f"Installed {installed_count}; failed {failed_count}: {failure_preview}"
             )
         else:
             self.app.set_env_sync_status(
-                f"Dependency sync complete.\nInstalled {installed_count} packages."
+                f"{title} complete.\nInstalled {installed_count} packages."
             )
 
     def _on_worker_failed(self, action, message):
+        self._after_worker = None
         if self._app_is_closing():
             return
-        self.app.set_env_sync_status(f"Environment {action} failed.\n{message}")
+        title = _WORKER_ACTION_TITLES.get(action, f"Environment {action}")
+        self.app.set_env_sync_status(f"{title} failed.\n{message}")
 
     def _clear_worker_refs(self):
         self._thread = None
         self._worker = None
         self.is_running = False
-        if not self._app_is_closing():
-            self._set_busy_ui(False)
+        if self._app_is_closing():
+            return
+        self._set_busy_ui(False)
+
+        continuation, self._worker_continuation = self._worker_continuation, None
+        if continuation is not None:
+            callback, payload = continuation
+            callback(payload)
 
     def _app_is_closing(self):
         return bool(getattr(self.app, "_is_closing", False))
@@ -496,46 +1013,245 @@ class EnvironmentSyncController(QObject):
             can_sync = bool(self.last_plan and self.last_plan.total_actions > 0)
             app.env_sync_match_btn.setEnabled(not busy and can_sync)
 
+        if hasattr(app, "env_sync_export_btn"):
+            can_export = bool(self.last_plan and self.last_plan.union_packages)
+            app.env_sync_export_btn.setEnabled(not busy and can_export)
+
+        if hasattr(app, "env_sync_apply_btn"):
+            app.env_sync_apply_btn.setEnabled(not busy)
+
     def _install_specs_for_profile(self, profile, plan):
         packages = {}
-        packages.update(plan.missing_by_version.get(profile.version, {}))
-        packages.update(plan.mismatched_by_version.get(profile.version, {}))
+        packages.update(plan.missing_for(profile))
+        packages.update(plan.mismatched_for(profile))
 
         specs = []
         for package in sorted(packages.values(), key=lambda item: item["name"].lower()):
             specs.append(f"{package['name']}=={package['version']}")
         return specs
 
+    def _install_specs_batched(self, profile, specs, sync_result, progress_callback=None):
+        # One pip run resolves the whole set at once. When it fails, halve the
+        # list until every failure is pinned to a single spec; the halves that
+        # succeed still install in one run each.
+        pending = [list(specs)]
+        while pending:
+            batch = pending.pop(0)
+            if len(batch) == 1:
+                if progress_callback:
+                    progress_callback(f"Python {profile.version}: installing {batch[0]}")
+                ok, message = self._install_package_spec(profile.executable, batch[0])
+                if ok:
+                    sync_result.installed.append(batch[0])
+                else:
+                    sync_result.failed[batch[0]] = message
+                continue
+
+            if progress_callback:
+                progress_callback(f"Python {profile.version}: installing {len(batch)} packages")
+            ok, _message = self._install_package_specs(profile.executable, batch)
+            if ok:
+                sync_result.installed.extend(batch)
+                continue
+
+            middle = len(batch) // 2
+            pending[:0] = [batch[:middle], batch[middle:]]
+
+    def _install_from_wheelhouse(self, profile, specs, progress_callback=None):
+        install_command = wheelhouse_install_command(profile.executable, specs, self.wheelhouse_dir)
+        timeout = self._pip_timeout(len(specs))
+
+        while True:
+            generation = self._wheelhouse_generation
+            # Offline first: once an earlier sync gathered every wheel, no
+            # index is contacted at all.
+            if self._run_pip_succeeds(install_command, timeout):
+                return True
+
+            with self._wheelhouse_lock:
+                # Another interpreter gathered while this one was trying;
+                # its wheels may be all that was missing.
+                if generation != self._wheelhouse_generation:
+                    continue
+
+                if progress_callback:
+                    progress_callback(f"Python {profile.version}: gathering {len(specs)} packages into the wheelhouse")
+                gathered = self._gather_into_wheelhouse(profile, specs, timeout)
+                self._wheelhouse_generation += 1
+
+            if not gathered:
+                return False
+
+            if progress_callback:
+                progress_callback(f"Python {profile.version}: installing {len(specs)} packages from the wheelhouse")
+            return self._run_pip_succeeds(install_command, timeout)
+
+    def _gather_into_wheelhouse(self, profile, specs, timeout):
+        # Wheels that pip says it downloaded, and that are new in the folder,
+        # are recorded as index artifacts; lockfile hashes are only taken
+        # from those.
+        before = wheelhouse_wheels(self.wheelhouse_dir)
+        downloaded = set()
+        forward = getattr(self._pip_output, "callback", None)
+
+        def capture(line):
+            filename = index_wheel_filename(line)
+            if filename:
+                downloaded.add(filename)
+            if forward is not None:
+                forward(line)
+
+        self._pip_output.callback = capture
+        try:
+            gathered = self._run_pip_succeeds(
+                wheelhouse_gather_command(profile.executable, specs, self.wheelhouse_dir),
+                timeout,
+            )
+        finally:
+            self._pip_output.callback = forward
+
+        new_wheels = wheelhouse_wheels(self.wheelhouse_dir) - before
+        record_index_wheels(self.wheelhouse_dir, new_wheels & downloaded)
+        return gathered
+
+    def _pip_progress_forwarder(self, profile, progress_callback):
+        if progress_callback is None:
+            return None
+
+        last_forwarded = [0.0]
+
+        def forward(line):
+            # Download and build lines, at most a few per second, so a fast
+            # pip cannot flood the GUI thread with queued signals.
+            if not _PIP_PROGRESS_PATTERN.match(line):
+                return
+            now = time.monotonic()
+            if now - last_forwarded[0] < SYNC_PROGRESS_INTERVAL_SECONDS:
+                return
+            last_forwarded[0] = now
+            progress_callback(f"Python {profile.version}: {self._short_error(line, limit=160)}")
+
+        return forward
+
+    def _sync_logger(self):
+        with self._sync_log_lock:
+            if self._sync_log is None:
+                logger = logging.Logger("environment_sync")
+                try:
+                    os.makedirs(os.path.dirname(self.sync_log_path), exist_ok=True)
+                    handler = RotatingFileHandler(
+                        self.sync_log_path,
+                        maxBytes=SYNC_LOG_MAX_BYTES,
+                        backupCount=SYNC_LOG_BACKUP_COUNT,
+                        encoding="utf-8",
+                    )
+                except OSError:
+                    handler = logging.NullHandler()
+                handler.setFormatter(logging.Formatter("%(asctime)s %(message)s"))
+                logger.addHandler(handler)
+                self._sync_log = logger
+            return self._sync_log
+
+    def _close_sync_log(self):
+        with self._sync_log_lock:
+            if self._sync_log is not None:
+                for handler in list(self._sync_log.handlers):
+                    handler.close()
+                    self._sync_log.removeHandler(handler)
+                self._sync_log = None
+
+    def _run_pip_succeeds(self, command, timeout):
+        try:
+            return self._run_subprocess(command, timeout=timeout, stream_output=True).returncode == 0
+        except (OSError, subprocess.TimeoutExpired):
+            return False
+
+    def _pip_timeout(self, spec_count):
+        return min(PIP_INSTALL_TIMEOUT * spec_count, PIP_BATCH_INSTALL_TIMEOUT)
+
     def _install_package_spec(self, executable, spec):
+        return self._install_package_specs(executable, [spec])
+
+    def _install_package_specs(self, executable, specs):
+        hashes = getattr(self._pip_output, "hashes", None) or {}
+        if specs and all(spec in hashes for spec in specs):
+            return self._install_hashed_specs(executable, specs, hashes)
+
         command = [
             executable,
             "-m",
             "pip",
             "install",
             "--disable-pip-version-check",
-            spec,
+            *specs,
         ]
-        result = self._run_subprocess(command, timeout=600)
+        return self._run_pip_install(command, len(specs))
+
+    def _install_hashed_specs(self, executable, specs, hashes):
+        # --hash is only accepted inside a requirements file.
+        with tempfile.TemporaryDirectory(prefix="exe-builder-lock-") as temp_dir:
+            requirements = os.path.join(temp_dir, "requirements.txt")
+            with open(requirements, "w", encoding="utf-8") as f:
+                for spec in specs:
+                    hash_options = " ".join(f"--hash={value}" for value in hashes[spec])
+                    f.write(f"{spec} {hash_options}\n")
+
+            command = [
+                executable,
+                "-m",
+                "pip",
+                "install",
+                "--disable-pip-version-check",
+                "--require-hashes",
+                "-r",
+                requirements,
+            ]
+            if self.wheelhouse_dir and os.path.isdir(self.wheelhouse_dir):
+                command.insert(-2, f"--find-links={self.wheelhouse_dir}")
+            return self._run_pip_install(command, len(specs))
+
+    def _run_pip_install(self, command, spec_count):
+        timeout = self._pip_timeout(spec_count)
+        try:
+            result = self._run_subprocess(command, timeout=timeout, stream_output=True)
+        except subprocess.TimeoutExpired:
+            return False, f"pip install timed out after {timeout}s."
 
         if result.returncode == 0:
             return True, "Installed."
 
-        message = (result.stderr or result.stdout or "pip install failed.").strip()
-        return False, self._short_error(message)
+        return False, self._short_error(self._pip_error_summary(result.stderr or result.stdout))
 
     def _read_python_version(self, executable):
-        result = self._run_subprocess(
-            [str(executable), "--version"],
-            timeout=15,
-        )
+        try:
+            version = INTERPRETER_CAPABILITIES.python_version(
+                executable,
+                run=self._run_subprocess,
+                timeout=PYTHON_VERSION_PROBE_TIMEOUT,
+            )
+        except InterpreterProbeError:
+            version = ""
 
-        raw = (result.stdout or result.stderr or executable.parent.name).strip()
-        return raw.replace("Python ", "").strip()
+        return version or Path(executable).parent.name
 
-    def _read_installed_packages(self, executable):
+    def _read_installed_packages(self, executable, timeout=PIP_LIST_TIMEOUT):
+        # Reading dist-info headers needs one sys.path probe instead of
+        # importing pip, which alone takes seconds per interpreter.
+        try:
+            return read_installed_packages_from_metadata(
+                executable,
+                run=self._run_subprocess,
+                timeout=min(PYTHON_VERSION_PROBE_TIMEOUT, timeout),
+            )
+        except (MetadataReadError, OSError):
+            pass
+
+        return self._read_installed_packages_with_pip(executable, timeout)
+
+    def _read_installed_packages_with_pip(self, executable, timeout=PIP_LIST_TIMEOUT):
         result = self._run_subprocess(
             [str(executable), "-m", "pip", "list", "--format=json"],
-            timeout=90,
+            timeout=timeout,
         )
 
         if result.returncode != 0:
@@ -555,15 +1271,27 @@ class EnvironmentSyncController(QObject):
 
         return packages
 
-    def _run_subprocess(self, command, timeout):
-        process = subprocess.Popen(
-            command,
-            stdout=subprocess.PIPE,
-            stderr=subprocess.PIPE,
-            text=True,
-            creationflags=CREATE_NO_WINDOW,
-        )
-        self._current_process = process
+    def _start_process(self, command, **popen_kwargs):
+        with self._process_lock:
+            # Checked under the lock so shutdown() cannot miss a child that
+            # starts while it is terminating the others.
+            if self._shutting_down:
+                raise RuntimeError("Environment sync was stopped.")
+
+            process = subprocess.Popen(
+                command,
+                text=True,
+                creationflags=CREATE_NO_WINDOW,
+                **popen_kwargs,
+            )
+            self._active_processes.add(process)
+        return process
+
+    def _run_subprocess(self, command, timeout, stream_output=False):
+        if stream_output:
+            return self._stream_subprocess(command, timeout)
+
+        process = self._start_process(command, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
         try:
             stdout, stderr = process.communicate(timeout=timeout)
         except subprocess.TimeoutExpired:
@@ -571,18 +1299,77 @@ class EnvironmentSyncController(QObject):
             stdout, stderr = process.communicate()
             raise
         finally:
-            if self._current_process is process:
-                self._current_process = None
+            with self._process_lock:
+                self._active_processes.discard(process)
 
         return subprocess.CompletedProcess(command, process.returncode, stdout, stderr)
 
+    def _stream_subprocess(self, command, timeout):
+        output_callback = getattr(self._pip_output, "callback", None)
+        profile = getattr(self._pip_output, "profile", None)
+        prefix = f"[{profile.version}] " if profile is not None else ""
+        log = self._sync_logger()
+        log.info("%s$ %s", prefix, subprocess.list2cmdline([str(part) for part in command]))
+
+        process = self._start_process(
+            command,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.STDOUT,
+            errors="replace",
+            bufsize=1,
+        )
+        # Reading line by line blocks, so the timeout is enforced by killing
+        # the child, which closes the pipe and ends the loop.
+        timed_out = threading.Event()
+
+        def expire():
+            timed_out.set()
+            process.kill()
+
+        watchdog = threading.Timer(timeout, expire)
+        watchdog.daemon = True
+        watchdog.start()
+
+        tail = deque(maxlen=SYNC_OUTPUT_TAIL_LINES)
+        try:
+            for line in process.stdout:
+                line = line.rstrip()
+                if not line:
+                    continue
+                tail.append(line)
+                log.info("%s%s", prefix, line)
+                if output_callback is not None:
+                    output_callback(line)
+            process.wait()
+        finally:
+            watchdog.cancel()
+            process.stdout.close()
+            with self._process_lock:
+                self._active_processes.discard(process)
+
+        output = "\n".join(tail)
+        if timed_out.is_set():
+            log.info("%stimed out after %ss", prefix, timeout)
+            raise subprocess.TimeoutExpired(command, timeout, output=output)
+
+        log.info("%sexit code %s", prefix, process.returncode)
+        return subprocess.CompletedProcess(command, process.returncode, output, "")
+
+    def _pip_error_summary(self, output):
+        lines = [line.strip() for line in str(output or "").splitlines() if line.strip()]
+        errors = [line for line in lines if line.startswith("ERROR:")]
+        # pip's own ERROR lines name the failing requirement; fall back to the
+        # last lines when a build backend failed without one.
+        return "\n".join(errors or lines[-5:]) or "pip install failed."
+
     def _package_key(self, name):
-        return re.sub(r"[-_.]+", "-", name).lower()
+        return normalize_package_name(name)
 
     def _package_preview(self, packages, limit=3):
-        names = sorted(package["name"] for package in packages.values())
-        preview = ", ".join(names[:limit])
-        remaining = len(names) - limit
+        # Only the first few names are shown; no need to sort thousands.
+        names = heapq.nsmallest(limit, (package["name"] for package in packages.values()))
+        preview = ", ".join(names)
+        remaining = len(packages) - limit
         if remaining > 0:
             preview += f" +{remaining}"
         return preview
@@ -606,14 +1393,7 @@ class EnvironmentSyncController(QObject):
         return preview
 
     def _version_key(self, value):
-        parts = re.findall(r"\d+|[a-zA-Z]+", str(value))
-        key = []
-        for part in parts:
-            if part.isdigit():
-                key.append((1, int(part)))
-            else:
-                key.append((0, part.lower()))
-        return key
+        return parse_version_key(str(value))
 
     def _clear_layout(self, layout):
         while layout.count():
@@ -0,0 +1,305 @@
+import os
+import re
+import threading
+from dataclasses import dataclass, field
+
+from python_discovery import interpreter_key
+from site_packages_metadata import normalize_package_name
+
+
+SYNC_ACTION_INSTALL = "install"
+SYNC_ACTION_UPGRADE = "upgrade"
+SYNC_ACTION_DOWNGRADE = "downgrade"
+
+# Used for a package that has never been installed here: roughly a resolve,
+# a mid-sized wheel download and the unpack on a typical connection.
+DEFAULT_PACKAGE_INSTALL_SECONDS = 8.0
+# Every pip run pays interpreter start-up and resolution once.
+PIP_RUN_OVERHEAD_SECONDS = 3.0
+INSTALL_HISTORY_SMOOTHING = 0.4
+MAX_INSTALL_HISTORY_ENTRIES = 2048
+
+
+@dataclass(frozen=True)
+class SyncAction:
+    key: str
+    name: str
+    kind: str
+    current_version: str
+    target_version: str
+    download_bytes: int = None
+    cached: bool = False
+    estimated_seconds: float = DEFAULT_PACKAGE_INSTALL_SECONDS
+
+    @property
+    def spec(self):
+        return f"{self.name}=={self.target_version}"
+
+
+@dataclass
+class ProfileSyncPreview:
+    version: str
+    executable: str
+    actions: list = field(default_factory=list)
+
+    @property
+    def key(self):
+        return interpreter_key(self.executable)
+
+    @property
+    def download_bytes(self):
+        return sum(action.download_bytes or 0 for action in self.actions if not action.cached)
+
+    @property
+    def unknown_downloads(self):
+        return sum(1 for action in self.actions if action.download_bytes is None and not action.cached)
+
+    @property
+    def estimated_seconds(self):
+        if not self.actions:
+            return 0.0
+        return PIP_RUN_OVERHEAD_SECONDS + sum(action.estimated_seconds for action in self.actions)
+
+    def count(self, kind):
+        return sum(1 for action in self.actions if action.kind == kind)
+
+
+@dataclass
+class SyncPreview:
+    profiles: list = field(default_factory=list)
+
+    @property
+    def total_actions(self):
+        return sum(len(profile.actions) for profile in self.profiles)
+
+    @property
+    def download_bytes(self):
+        return sum(profile.download_bytes for profile in self.profiles)
+
+    def estimated_seconds(self, concurrency=1):
+        # Profiles install in parallel: the wall time is at least the slowest
+        # one, and at least the total spread over the workers.
+        durations = [profile.estimated_seconds for profile in self.profiles if profile.actions]
+        if not durations:
+            return 0.0
+        return max(max(durations), sum(durations) / max(1, concurrency))
+
+    def selection(self):
+        # Keyed by interpreter_key(executable): two interpreters can share a
+        # Python version.
+        return {
+            profile.key: [action.spec for action in profile.actions]
+            for profile in self.profiles
+            if profile.actions
+        }
+
+    def restricted_to(self, selection):
+        profiles = []
+        for profile in self.profiles:
+            chosen = set(selection.get(profile.key, ()))
+            profiles.append(
+                ProfileSyncPreview(
+                    version=profile.version,
+                    executable=profile.executable,
+                    actions=[action for action in profile.actions if action.spec in chosen],
+                )
+            )
+        return SyncPreview(profiles=profiles)
+
+
+def _cpython_number(tag):
+    # "cp313" -> (3, 13)
+    if not tag.startswith("cp") or not tag[2:].isdigit() or len(tag) < 4:
+        return None
+    return int(tag[2]), int(tag[3:])
+
+
+def _wheel_fits(tags, python_version):
+    python_tags, abi_tag, _platform = tags
+    match = re.match(r"(\d+)\.(\d+)", str(python_version or ""))
+    if not match:
+        return False
+
+    major, minor = (int(part) for part in match.groups())
+    offered = set(python_tags.split("."))
+    if offered & {f"cp{major}{minor}", f"py{major}", f"py{major}{minor}"}:
+        return True
+
+    # abi3 wheels built for an older CPython load on every newer one.
+    if abi_tag == "abi3":
+        return any(
+            number is not None and number[0] == major and number[1] <= minor
+            for number in map(_cpython_number, offered)
+        )
+    return False
+
+
+class WheelCacheIndex:
+    # (key, version) -> [(tags, size)] for every wheel in the wheelhouse.
+    def __init__(self, wheelhouse):
+        self._wheels = {}
+        self._sizes_by_key = {}
+        if not wheelhouse or not os.path.isdir(wheelhouse):
+            return
+
+        for entry in os.scandir(wheelhouse):
+            if not entry.name.lower().endswith(".whl"):
+                continue
+            parts = entry.name[:-4].split("-")
+            if len(parts) < 5:
+                continue
+            try:
+                size = entry.stat().st_size
+            except OSError:
+                continue
+            key = normalize_package_name(parts[0])
+            self._wheels.setdefault((key, parts[1]), []).append((tuple(parts[-3:]), size))
+            self._sizes_by_key.setdefault(key, []).append(size)
+
+    def lookup(self, key, version, python_version):
+        # Returns (cached, estimated download bytes). A fitting wheel is
+        # already local; otherwise another build of the same package is the
+        # best size estimate there is.
+        for tags, size in self._wheels.get((key, version), []):
+            if _wheel_fits(tags, python_version):
+                return True, size
+
+        sizes = self._sizes_by_key.get(key)
+        if sizes:
+            return False, max(sizes)
+        return False, None
+
+
+def _smooth(previous, sample):
+    if previous is None:
+        return sample
+    return previous + INSTALL_HISTORY_SMOOTHING * (sample - previous)
+
+
+class InstallHistory:
+    def __init__(self):
+        self._seconds = {}
+        self._lock = threading.Lock()
+
+    def estimate(self, key):
+        with self._lock:
+            return self._seconds.get(key, DEFAULT_PACKAGE_INSTALL_SECONDS)
+
+    def record(self, specs, seconds):
+        # A batch is timed as a whole; each package gets an equal share.
+        keys = [normalize_package_name(spec.split("==", 1)[0]) for spec in specs]
+        if not keys or seconds <= 0:
+            return
+        share = max(seconds - PIP_RUN_OVERHEAD_SECONDS, 0.1) / len(keys)
+
+        with self._lock:
+            for key in keys:
+                self._seconds[key] = _smooth(self._seconds.pop(key, None), share)
+            while len(self._seconds) > MAX_INSTALL_HISTORY_ENTRIES:
+                self._seconds.pop(next(iter(self._seconds)))
+
+    def serialize(self):
+        with self._lock:
+            return {key: round(seconds, 3) for key, seconds in self._seconds.items()}
+
+    def load_serialized(self, data):
+        if not isinstance(data, dict):
+            return
+        with self._lock:
+            for key, seconds in list(data.items())[-MAX_INSTALL_HISTORY_ENTRIES:]:
+                try:
+                    self._seconds[str(key)] = float(seconds)
+                except (TypeError, ValueError):
+                    continue
+
+    def clear(self):
+        with self._lock:
+            self._seconds.clear()
+
+
+INSTALL_HISTORY = InstallHistory()
+
+
+def _action_kind(current_version, target_version, version_key):
+    if current_version is None:
+        return SYNC_ACTION_INSTALL
+    if version_key(target_version) >= version_key(current_version):
+        return SYNC_ACTION_UPGRADE
+    return SYNC_ACTION_DOWNGRADE
+
+
+def _sync_actions(profile, targets, version_key, wheel_cache, history):
+    actions = []
+    for key, target in sorted(targets.items(), key=lambda item: item[1]["name"].lower()):
+        current = profile.packages.get(key)
+        current_version = current["version"] if current else None
+        cached, download_bytes = wheel_cache.lookup(key, target["version"], profile.version)
+        actions.append(
+            SyncAction(
+                key=key,
+                name=target["name"],
+                kind=_action_kind(current_version, target["version"], version_key),
+                current_version=current_version or "",
+                target_version=target["version"],
+                download_bytes=download_bytes,
+                cached=cached,
+                estimated_seconds=history.estimate(key),
+            )
+        )
+    return actions
+
+
+def build_sync_preview(plan, version_key, wheel_cache=None, history=INSTALL_HISTORY):
+    wheel_cache = wheel_cache or WheelCacheIndex("")
+    profiles = []
+
+    for profile in plan.profiles:
+        if profile.error:
+            continue
+
+        targets = {}
+        targets.update(plan.missing_for(profile))
+        targets.update(plan.mismatched_for(profile))
+
+        profiles.append(
+            ProfileSyncPreview(
+                version=profile.version,
+                executable=profile.executable,
+                actions=_sync_actions(profile, targets, version_key, wheel_cache, history),
+            )
+        )
+
+    return SyncPreview(profiles=profiles)
+
+
+def build_lock_preview(lock, profiles, version_key, wheel_cache=None, history=INSTALL_HISTORY):
+    # The changes applying a lockfile would make to each target interpreter.
+    wheel_cache = wheel_cache or WheelCacheIndex("")
+    previews = []
+
+    for profile in profiles:
+        if profile.error:
+            continue
+
+        targets = {
+            key: {"name": package.name, "version": package.version}
+            for key, package in lock.install_targets(profile.packages).items()
+        }
+        previews.append(
+            ProfileSyncPreview(
+                version=profile.version,
+                executable=profile.executable,
+                actions=_sync_actions(profile, targets, version_key, wheel_cache, history),
+            )
+        )
+
+    return SyncPreview(profiles=previews)
+
+
+def format_bytes(size):
+    size = float(size or 0)
+    for unit in ("B", "KB", "MB"):
+        if size < 1024:
+            return f"{size:.0f} {unit}" if unit == "B" else f"{size:.1f} {unit}"
+        size /= 1024
+    return f"{size:.1f} GB"
@@ -0,0 +1,11 @@
+from PySide6.QtCore import QCoreApplication, QThread
+
+
+def event_loop_running():
+    # Queued signals and timers are only delivered while the calling thread is
+    # inside exec(). Without a running loop (tests, scripts, startup before
+    # app.exec()) work has to run inline or it would never complete.
+    if QCoreApplication.instance() is None:
+        return False
+
+    return QThread.currentThread().loopLevel() > 0
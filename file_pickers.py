@@ -1,5 +1,4 @@
 import os
-import subprocess
 from PySide6.QtWidgets import QFileDialog, QDialog, QVBoxLayout, QPushButton, QLabel, QComboBox, QVBoxLayout, QPushButton,QFrame
 from PySide6.QtCore import Qt
 from styles import (
@@ -10,6 +9,7 @@ from styles import (
     SCRIPT_PICKER_LABEL_STYLE,
     apply_native_title_bar_style,
 )
+from python_discovery import PYTHON_DISCOVERY
 from ui_highlights import flash_add_highlight
 
 # -------------------------------------------------------------
@@ -30,25 +30,13 @@ class FilePickerController:
     # Locate python installs
     # ============================================================
 
-    def _get_where_python_dirs(self):
-        """Return a list of python.exe paths from `where python` (silent)."""
-        try:
-            result = subprocess.run(
-                ["where", "python"],
-                capture_output=True,
-                text=True,
-                creationflags=0x08000000  # CREATE_NO_WINDOW
-            )
-
-            paths = [
-                line.strip()
-                for line in result.stdout.splitlines()
-                if line.lower().endswith("python.exe")
-            ]
-
-            return paths
-        except Exception:
-            return []
+    def _discovered_python_paths(self):
+        """Return python.exe paths from the cached interpreter discovery."""
+        recent_scripts = getattr(self.app, "state_data", {}).get("recent_scripts", [])
+        return [
+            interpreter.executable
+            for interpreter in PYTHON_DISCOVERY.discover(script_paths=recent_scripts)
+        ]
 
     # ============================================================
     # Select python interpreter
@@ -111,12 +99,9 @@ class FilePickerController:
         if last_dir and os.path.isdir(last_dir):
             return last_dir
 
-        # 2️⃣ Use `where python` as a hint
-        candidates = self._get_where_python_dirs()
-        for path in candidates:
-            if "WindowsApps" not in path:
-                path = os.path.normpath(path)
-                return os.path.dirname(path)
+        # 2️⃣ Use a discovered interpreter as a hint
+        for path in self._discovered_python_paths():
+            return os.path.dirname(os.path.normpath(path))
 
         return None
 
@@ -0,0 +1,192 @@
+import glob
+import os
+import subprocess
+import threading
+from dataclasses import dataclass
+
+
+CREATE_NO_WINDOW = 0x08000000 if os.name == "nt" else 0
+
+
+class InterpreterProbeError(Exception):
+    pass
+
+
+@dataclass
+class InterpreterCapabilities:
+    executable: str
+    signature: list
+    python_version: str = None
+    pyinstaller_version: str = None
+
+    @property
+    def pyinstaller_available(self):
+        return bool(self.pyinstaller_version)
+
+    def to_dict(self):
+        return {
+            "executable": self.executable,
+            "signature": self.signature,
+            "python_version": self.python_version,
+            "pyinstaller_version": self.pyinstaller_version,
+        }
+
+
+def interpreter_signature(python):
+    if not python:
+        return []
+
+    python = os.path.normpath(str(python))
+    signature = [_path_signature(python)]
+
+    # pip installs and upgrades add or rename entries directly inside
+    # site-packages, which bumps the folder mtime.
+    for site_packages in site_packages_candidates(python):
+        signature.append(_path_signature(site_packages))
+
+    return signature
+
+
+def site_packages_candidates(python):
+    python_dir = os.path.dirname(python)
+    prefix_dirs = [python_dir, os.path.dirname(python_dir)]
+
+    candidates = []
+    for prefix in prefix_dirs:
+        candidates.append(os.path.join(prefix, "Lib", "site-packages"))
+        candidates.extend(sorted(glob.glob(os.path.join(prefix, "lib", "python*", "site-packages"))))
+        candidates.append(os.path.join(prefix, "pyvenv.cfg"))
+
+    seen = set()
+    existing = []
+    for candidate in candidates:
+        key = os.path.normcase(os.path.normpath(candidate))
+        if key in seen or not os.path.exists(candidate):
+            continue
+        seen.add(key)
+        existing.append(os.path.normpath(candidate))
+    return existing
+
+
+def _path_signature(path):
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return [os.path.normcase(path), None, None]
+    return [os.path.normcase(path), stat.st_size, stat.st_mtime_ns]
+
+
+def _run_probe(command, timeout):
+    return subprocess.run(
+        command,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+        text=True,
+        timeout=timeout,
+        creationflags=CREATE_NO_WINDOW,
+    )
+
+
+def _probe_output(result):
+    return (getattr(result, "stdout", "") or getattr(result, "stderr", "") or "").strip()
+
+
+class InterpreterCapabilityCache:
+    def __init__(self):
+        self._entries = {}
+        self._lock = threading.Lock()
+
+    def _key(self, python):
+        return os.path.normcase(os.path.normpath(str(python)))
+
+    def _current_entry(self, python):
+        signature = interpreter_signature(python)
+        key = self._key(python)
+
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry.signature != signature:
+                entry = InterpreterCapabilities(
+                    executable=os.path.normpath(str(python)),
+                    signature=signature,
+                )
+                self._entries[key] = entry
+            return entry
+
+    def cached(self, python):
+        if not python:
+            return None
+
+        with self._lock:
+            entry = self._entries.get(self._key(python))
+
+        if entry is None or entry.signature != interpreter_signature(python):
+            return None
+        return entry
+
+    def python_version(self, python, run=None, timeout=5):
+        entry = self._current_entry(python)
+        if entry.python_version is not None:
+            return entry.python_version
+
+        result = (run or _run_probe)([str(python), "--version"], timeout)
+        if result.returncode != 0:
+            # Failures are not cached: a broken interpreter is usually fixed
+            # by reinstalling it, which changes the signature anyway.
+            raise InterpreterProbeError(_probe_output(result) or "Python interpreter failed to run.")
+
+        entry.python_version = _probe_output(result).replace("Python ", "").strip()
+        return entry.python_version
+
+    def pyinstaller_version(self, python, run=None, timeout=60):
+        entry = self._current_entry(python)
+        if entry.pyinstaller_version is not None:
+            return entry.pyinstaller_version
+
+        result = (run or _run_probe)([str(python), "-m", "PyInstaller", "--version"], timeout)
+        if result.returncode == 0:
+            entry.pyinstaller_version = _probe_output(result) or "unknown"
+        else:
+            # "Not installed" is cached too; installing PyInstaller touches
+            # site-packages and invalidates the entry.
+            entry.pyinstaller_version = ""
+        return entry.pyinstaller_version
+
+    def invalidate(self, python=None):
+        with self._lock:
+            if python is None:
+                self._entries.clear()
+            else:
+                self._entries.pop(self._key(python), None)
+
+    def serialize(self):
+        with self._lock:
+            return [entry.to_dict() for entry in self._entries.values()]
+
+    def load_serialized(self, serialized_entries):
+        if not isinstance(serialized_entries, list):
+            return
+
+        with self._lock:
+            for item in serialized_entries:
+                if not isinstance(item, dict):
+                    continue
+
+                executable = str(item.get("executable", "")).strip()
+                signature = item.get("signature")
+                if not executable or not isinstance(signature, list):
+                    continue
+
+                python_version = item.get("python_version")
+                pyinstaller_version = item.get("pyinstaller_version")
+                self._entries[self._key(executable)] = InterpreterCapabilities(
+                    executable=executable,
+                    signature=signature,
+                    python_version=python_version if isinstance(python_version, str) else None,
+                    pyinstaller_version=(
+                        pyinstaller_version if isinstance(pyinstaller_version, str) else None
+                    ),
+                )
+
+
+INTERPRETER_CAPABILITIES = InterpreterCapabilityCache()
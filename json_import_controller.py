@@ -1,6 +1,9 @@
 import json, os
 from PySide6.QtCore import QObject, QEvent
 
+from path_existence import PATH_EXISTENCE
+from state_store import STATE_STORE
+
 
 class JsonImportController(QObject):
     def __init__(self, app):
@@ -56,32 +59,35 @@ class JsonImportController(QObject):
             print("JSON load failed:", e)
             return
 
-        # optional safety
+        # optional safety: one batched check with a per-path timeout, so an
+        # unreachable drive cannot stall the import; unreachable entries stay.
+        interpreter_path = data.get("python_interpreter_path", "")
+        exists = PATH_EXISTENCE.check(
+            data.get("recent_scripts", [])
+            + data.get("recent_icons", [])
+            + ([interpreter_path] if interpreter_path else [])
+        )
+
         data["recent_scripts"] = [
             p for p in data.get("recent_scripts", [])
-            if os.path.isfile(p)
+            if exists.get(p) is not False
         ]
 
         data["recent_icons"] = [
             p for p in data.get("recent_icons", [])
-            if os.path.exists(p)
+            if exists.get(p) is not False
         ]
 
         data["python_interpreter_path"] = (
-            data.get("python_interpreter_path", "")
-            if os.path.isfile(data.get("python_interpreter_path", ""))
+            interpreter_path
+            if interpreter_path and exists.get(interpreter_path) is not False
             else ""
         )
 
         # 🔑 overwrite state
         app.state_data = data
 
-        state_path = app.state_ctrl._state_file_path()
-        try:
-            with open(state_path, "w", encoding="utf-8") as f:
-                json.dump(data, f, indent=4)
-        except Exception as e:
-            print("State overwrite failed:", e)
+        STATE_STORE.replace(app.state_ctrl._state_file_path(), data)
 
         # 🔑 sync BOTH dropdowns
         app.recent_controller.populate_recent_dropdown()
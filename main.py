@@ -14,8 +14,9 @@ from datetime_build_options import (
     UK_MASS_DATETIME_BUILD_LABEL,
     USA_MASS_DATETIME_BUILD_LABEL,
 )
-from environment_sync_controller import EnvironmentSyncController
+from environment_sync_controller import MAX_PARALLEL_ENVIRONMENT_SYNCS, EnvironmentSyncController
 from path_hover import attach_path_hovers
+from project_data_index import DEFAULT_DATA_FILE_PATTERNS
 from tooltips import attach_tooltips
 from PySide6.QtCore import QPoint, QSize, Qt, QTimer
 from PySide6.QtWidgets import QWidget,QVBoxLayout,QLabel,QPushButton,QFrame,QApplication,QHBoxLayout,QVBoxLayout,QCheckBox,QLineEdit,QHBoxLayout, QComboBox,QTextEdit,QListView,QScrollArea,QMessageBox,QDialogButtonBox
@@ -26,6 +27,7 @@ from PySide6.QtWidgets import QSizePolicy
 from file_pickers import FilePickerController
 from path_display_line_edit import PathDisplayLineEdit
 from state_controller import StateController
+from state_store import STATE_STORE
 from recent_controller import RecentController
 from ui_handlers import UIHandlers
 from json_import_controller import JsonImportController
@@ -147,6 +149,11 @@ class EXEBuilderApp(QWidget):
         self.minimize_after_build_enabled = getattr(self, "minimize_after_build_enabled", True)
         self.open_output_dir_after_build_enabled = getattr(self, "open_output_dir_after_build_enabled", False)
         self.suppress_exit_dialogue_enabled = getattr(self, "suppress_exit_dialogue_enabled", False)
+        self.incremental_build_enabled = getattr(self, "incremental_build_enabled", True)
+        self.mass_build_stamp_variants_enabled = getattr(self, "mass_build_stamp_variants_enabled", False)
+        self.spec_file_builds_enabled = getattr(self, "spec_file_builds_enabled", True)
+        self.data_file_patterns = getattr(self, "data_file_patterns", list(DEFAULT_DATA_FILE_PATTERNS))
+        self.env_sync_max_parallel = getattr(self, "env_sync_max_parallel", MAX_PARALLEL_ENVIRONMENT_SYNCS)
         self.tooltips_enabled = getattr(self, "tooltips_enabled", True)
         self.script_path = getattr(self, "script_path", "")
         self.icon_path = getattr(self, "icon_path", "")
@@ -365,14 +372,23 @@ class EXEBuilderApp(QWidget):
 
         self.env_sync_scan_btn = QPushButton("Scan Profiles")
         self.env_sync_match_btn = QPushButton("Sync Dependencies")
+        self.env_sync_export_btn = QPushButton("Export")
+        self.env_sync_apply_btn = QPushButton("Apply")
         self.env_sync_scan_btn.setFixedSize(145,35)
         self.env_sync_match_btn.setFixedSize(175,35)
+        self.env_sync_export_btn.setFixedSize(75,35)
+        self.env_sync_apply_btn.setFixedSize(75,35)
         self.env_sync_match_btn.setEnabled(False)
+        self.env_sync_export_btn.setEnabled(False)
         self.env_sync_scan_btn.setStyleSheet(ENV_SYNC_BUTTON_STYLE)
         self.env_sync_match_btn.setStyleSheet(ENV_SYNC_BUTTON_STYLE)
+        self.env_sync_export_btn.setStyleSheet(ENV_SYNC_BUTTON_STYLE)
+        self.env_sync_apply_btn.setStyleSheet(ENV_SYNC_BUTTON_STYLE)
 
         env_sync_action_layout.addWidget(self.env_sync_scan_btn)
         env_sync_action_layout.addWidget(self.env_sync_match_btn)
+        env_sync_action_layout.addWidget(self.env_sync_export_btn)
+        env_sync_action_layout.addWidget(self.env_sync_apply_btn)
         env_sync_action_layout.addStretch()
 
         self.env_sync_warning_label = QLabel(
@@ -1166,9 +1182,14 @@ class EXEBuilderApp(QWidget):
 
         self.exe_name_input.setReadOnly(False)
 
-        buttons = [
+        env_sync_buttons = (
             self.env_sync_scan_btn,
             self.env_sync_match_btn,
+            self.env_sync_export_btn,
+            self.env_sync_apply_btn,
+        )
+        buttons = [
+            *env_sync_buttons,
             self.open_python_site_btn,
             self.appened_py_version,
             self.icon_btn,
@@ -1179,7 +1200,7 @@ class EXEBuilderApp(QWidget):
         ]
 
         for btn in buttons:
-            if btn not in (self.env_sync_scan_btn, self.env_sync_match_btn):
+            if btn not in env_sync_buttons:
                 btn.setFixedSize(160, 35)
             btn.setFont(QFont("Rubik UI", 11, QFont.Bold))
         
@@ -1214,11 +1235,16 @@ class EXEBuilderApp(QWidget):
         attach_path_hovers(self)
         self._loading_state = False
         self.state_ctrl.load_state()
+        # The sync profile cache is read once the window is up, not during
+        # start-up.
+        QTimer.singleShot(0, self.environment_sync_controller.ensure_profiles_loaded)
         self.recent_controller.populate_recent_dropdown()
         self.validator.validation_status_message()
         self.json_import_controller.attach()
         self.env_sync_scan_btn.clicked.connect(self.ui_handlers.on_env_sync_scan)
         self.env_sync_match_btn.clicked.connect(self.ui_handlers.on_env_sync_match)
+        self.env_sync_export_btn.clicked.connect(self.ui_handlers.on_env_sync_export_lock)
+        self.env_sync_apply_btn.clicked.connect(self.ui_handlers.on_env_sync_apply_lock)
         self.interpreter_btn.clicked.connect(self.file_pickers.select_python_interpreter)
         self.python_delete_interpreter.clicked.connect(self.recent_controller.interpreter_delete)
         self.select_interpreter.currentIndexChanged.connect(self.recent_controller.on_recent_interpreter_selected)
@@ -1503,6 +1529,7 @@ class EXEBuilderApp(QWidget):
         self.build_controller.shutdown()
         self.environment_sync_controller.shutdown()
         self.state_ctrl.save_state()
+        STATE_STORE.flush()
         event.accept()
 
 # -------------------------------------------------------------
@@ -0,0 +1,147 @@
+import os
+import queue
+import threading
+import time
+
+from PySide6.QtCore import QObject, Signal
+
+from event_loop import event_loop_running
+
+
+PATH_EXISTENCE_TTL_SECONDS = 30.0
+# A stat on a disconnected share or a sleeping USB disk can hang for a long
+# time; past this the path is reported as unreachable and kept in the list.
+PATH_CHECK_TIMEOUT_SECONDS = 2.0
+PATH_CHECK_WORKERS = 8
+
+
+def _normalize(path):
+    return os.path.abspath(os.path.normpath(str(path)))
+
+
+class _Probe:
+    def __init__(self, path):
+        self.path = path
+        self.done = threading.Event()
+        self.exists = None
+
+
+class PathExistenceChecker:
+    # Results are True (file exists), False (missing) or None (the check
+    # timed out). Every result, unreachable included, is reused for the TTL
+    # so a dead drive is not probed on every dropdown refresh.
+    def __init__(
+        self,
+        ttl_seconds=PATH_EXISTENCE_TTL_SECONDS,
+        timeout_seconds=PATH_CHECK_TIMEOUT_SECONDS,
+        workers=PATH_CHECK_WORKERS,
+        probe=os.path.isfile,
+    ):
+        self.ttl_seconds = ttl_seconds
+        self.timeout_seconds = timeout_seconds
+        self._probe = probe
+        self._worker_count = workers
+        self._results = {}
+        self._in_flight = {}
+        self._queue = queue.Queue()
+        self._workers = []
+        self._lock = threading.Lock()
+
+    def _ensure_workers(self):
+        # Daemon threads: a probe stuck on a dead share must not keep the app
+        # from exiting.
+        while len(self._workers) < self._worker_count:
+            worker = threading.Thread(target=self._work, name="path-check", daemon=True)
+            worker.start()
+            self._workers.append(worker)
+
+    def _work(self):
+        while True:
+            probe = self._queue.get()
+            try:
+                probe.exists = bool(self._probe(probe.path))
+            except OSError:
+                probe.exists = False
+            with self._lock:
+                self._results[probe.path] = (time.monotonic(), probe.exists)
+                self._in_flight.pop(probe.path, None)
+                probe.done.set()
+
+    def cached(self, paths):
+        now = time.monotonic()
+        known = {}
+        with self._lock:
+            for path in paths:
+                entry = self._results.get(_normalize(path))
+                if entry is not None and now - entry[0] < self.ttl_seconds:
+                    known[path] = entry[1]
+        return known
+
+    def check(self, paths):
+        known = self.cached(paths)
+        pending = []
+        with self._lock:
+            self._ensure_workers()
+            for path in paths:
+                if path in known:
+                    continue
+                normalized = _normalize(path)
+                probe = self._in_flight.get(normalized)
+                if probe is None:
+                    probe = _Probe(normalized)
+                    self._in_flight[normalized] = probe
+                    self._queue.put(probe)
+                pending.append((path, probe))
+
+        deadline = time.monotonic() + self.timeout_seconds
+        for path, probe in pending:
+            if probe.done.wait(max(0.0, deadline - time.monotonic())):
+                known[path] = probe.exists
+            else:
+                with self._lock:
+                    if not probe.done.is_set():
+                        self._results[probe.path] = (time.monotonic(), None)
+                known[path] = probe.exists
+        return known
+
+    def invalidate(self, paths=None):
+        with self._lock:
+            if paths is None:
+                self._results.clear()
+                return
+            for path in paths:
+                self._results.pop(_normalize(path), None)
+
+
+PATH_EXISTENCE = PathExistenceChecker()
+
+
+class BackgroundPathCheck(QObject):
+    # Runs PathExistenceChecker.check off the GUI thread and hands the result
+    # back on it. Without a running event loop the check runs inline.
+    _checked = Signal(object, object)
+
+    def __init__(self, checker=PATH_EXISTENCE):
+        super().__init__()
+        self.checker = checker
+        self._checked.connect(self._deliver)
+
+    def request(self, paths, callback):
+        paths = list(paths)
+        if not paths:
+            return False
+
+        if not event_loop_running():
+            callback(self.checker.check(paths))
+            return False
+
+        thread = threading.Thread(
+            target=lambda: self._checked.emit(callback, self.checker.check(paths)),
+            name="recent-path-check",
+            daemon=True,
+        )
+        thread.start()
+        return True
+
+    def _deliver(self, callback, results):
+        callback(results)
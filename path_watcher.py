@@ -0,0 +1,137 @@
+import os
+import stat
+
+from PySide6.QtCore import QCoreApplication, QFileSystemWatcher, QObject, Signal
+
+from event_loop import event_loop_running
+
+
+def _normalize(path):
+    return os.path.abspath(os.path.normpath(str(path)))
+
+
+def _stat_kind(path):
+    try:
+        mode = os.stat(path).st_mode
+    except (OSError, ValueError):
+        return None
+    if stat.S_ISDIR(mode):
+        return "dir"
+    if stat.S_ISREG(mode):
+        return "file"
+    return None
+
+
+class PathWatcher(QObject):
+    # Watches the paths build readiness depends on (script, interpreter,
+    # output folder, icon) together with their parent folders. A path is
+    # stat'ed when it starts being tracked and again only when the watcher
+    # reports a change; `changed` is emitted when a path appears, disappears
+    # or switches between file and folder.
+    # Paths whose parent folder can't be watched, and every lookup made
+    # without a running event loop, are stat'ed each time.
+    changed = Signal()
+
+    def __init__(self):
+        super().__init__()
+        self._tracked = frozenset()
+        self._kinds = {}
+        self._watcher = QFileSystemWatcher(self)
+        self._watcher.fileChanged.connect(self._on_path_changed)
+        self._watcher.directoryChanged.connect(self._on_path_changed)
+
+    @property
+    def tracked(self):
+        return self._tracked
+
+    def watched_paths(self):
+        return {
+            _normalize(path)
+            for path in [*self._watcher.files(), *self._watcher.directories()]
+        }
+
+    def track(self, paths):
+        cleaned = (str(path or "").strip() for path in paths)
+        tracked = frozenset(_normalize(path) for path in cleaned if path)
+        if tracked == self._tracked:
+            return
+
+        self._tracked = tracked
+        for key in list(self._kinds):
+            if key not in tracked:
+                del self._kinds[key]
+        self._sync_watches()
+
+    def is_file(self, path):
+        return self._kind(path) == "file"
+
+    def is_dir(self, path):
+        return self._kind(path) == "dir"
+
+    def _kind(self, path):
+        path = str(path or "").strip()
+        if not path:
+            return None
+
+        key = _normalize(path)
+        if not event_loop_running():
+            return _stat_kind(key)
+
+        if key in self._kinds:
+            return self._kinds[key]
+
+        kind = _stat_kind(key)
+        if key in self._tracked and os.path.dirname(key) in self.watched_paths():
+            self._kinds[key] = kind
+        return kind
+
+    def _sync_watches(self):
+        if QCoreApplication.instance() is None:
+            return
+
+        wanted = set()
+        for key in self._tracked:
+            parent = os.path.dirname(key)
+            if os.path.isdir(parent):
+                wanted.add(parent)
+            if os.path.exists(key):
+                wanted.add(key)
+
+        watched = {
+            _normalize(path): path
+            for path in [*self._watcher.files(), *self._watcher.directories()]
+        }
+        stale = [path for key, path in watched.items() if key not in wanted]
+        if stale:
+            self._watcher.removePaths(stale)
+        missing = sorted(wanted.difference(watched))
+        if missing:
+            self._watcher.addPaths(missing)
+
+    def _on_path_changed(self, path):
+        changed = _normalize(path)
+        prefix = os.path.join(changed, "")
+        affected = [
+            key for key in self._tracked
+            if key == changed or key.startswith(prefix) or os.path.dirname(key) == changed
+        ]
+        if not affected:
+            return
+
+        # Qt drops the watch on a deleted file and a recreated one needs a new
+        # watch, so the watch list is brought back in line on every event.
+        self._sync_watches()
+        watched = self.watched_paths()
+
+        moved = False
+        for key in affected:
+            known = key in self._kinds
+            before = self._kinds.pop(key, None)
+            after = _stat_kind(key)
+            if os.path.dirname(key) in watched:
+                self._kinds[key] = after
+            if not known or before != after:
+                moved = True
+
+        if moved:
+            self.changed.emit()
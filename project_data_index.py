@@ -0,0 +1,350 @@
+import fnmatch
+import json
+import os
+import threading
+from dataclasses import dataclass, field
+from pathlib import Path
+
+from build_fingerprint import SKIPPED_PROJECT_DIRNAMES
+
+
+DEFAULT_DATA_FILE_PATTERNS = ("*.png",)
+DATA_INDEX_FILE_NAME = "data_file_index.json"
+DATA_INDEX_FORMAT_VERSION = 1
+MAX_INDEXED_ROOTS = 16
+
+PROJECT_CONTAINER_MARKERS = (".git", "pyproject.toml", "setup.py", "setup.cfg", "requirements.txt")
+PROJECT_CONTAINER_MAX_LEVELS = 3
+
+# One --add-data for a whole folder only pays off once the folder holds a
+# handful of files; below that, per-file entries keep the debug log readable.
+COLLAPSE_MIN_FILES = 8
+
+
+def normalize_data_file_patterns(patterns):
+    if isinstance(patterns, str):
+        patterns = patterns.replace(";", ",").split(",")
+
+    normalized = []
+    for pattern in patterns or ():
+        pattern = str(pattern).strip().lower()
+        if not pattern:
+            continue
+        if pattern.startswith("."):
+            pattern = "*" + pattern
+        if pattern not in normalized:
+            normalized.append(pattern)
+
+    return tuple(normalized) or DEFAULT_DATA_FILE_PATTERNS
+
+
+def _matches(filename, patterns):
+    lowered = filename.lower()
+    return any(fnmatch.fnmatchcase(lowered, pattern) for pattern in patterns)
+
+
+def _mtime_ns(path):
+    try:
+        return os.stat(path).st_mtime_ns
+    except OSError:
+        return None
+
+
+@dataclass
+class IndexedDirectory:
+    # A folder's mtime changes whenever an entry is added, removed or renamed
+    # in it, which is all the data-file list depends on.
+    mtime_ns: int
+    files: list = field(default_factory=list)
+    subdirs: list = field(default_factory=list)
+    has_skipped_dirs: bool = False
+
+    def to_dict(self):
+        return {
+            "mtime_ns": self.mtime_ns,
+            "files": self.files,
+            "subdirs": self.subdirs,
+            "has_skipped_dirs": self.has_skipped_dirs,
+        }
+
+
+@dataclass
+class _ContainerLookup:
+    container: str
+    checked: list
+
+
+@dataclass(frozen=True)
+class DataFileScan:
+    # (source, destination) pairs in os.walk order; a source is either a file
+    # or a fully covered folder.
+    entries: list
+    directories_scanned: int
+    directories_reused: int
+
+
+def _scan_directory(path, mtime_ns):
+    files = []
+    subdirs = []
+    has_skipped_dirs = False
+
+    with os.scandir(path) as iterator:
+        for entry in iterator:
+            try:
+                is_dir = entry.is_dir()
+            except OSError:
+                is_dir = False
+
+            if not is_dir:
+                files.append(entry.name)
+                continue
+
+            if entry.name.lower() in SKIPPED_PROJECT_DIRNAMES:
+                has_skipped_dirs = True
+                continue
+
+            try:
+                if entry.is_symlink():
+                    # os.walk lists linked folders but never descends into them.
+                    has_skipped_dirs = True
+                    continue
+            except OSError:
+                continue
+
+            subdirs.append(entry.name)
+
+    return IndexedDirectory(
+        mtime_ns=mtime_ns,
+        files=sorted(files),
+        subdirs=sorted(subdirs),
+        has_skipped_dirs=has_skipped_dirs,
+    )
+
+
+def _join_relative(relative, name):
+    return name if relative == "." else os.path.join(relative, name)
+
+
+class ProjectDataIndex:
+    def __init__(self):
+        self._roots = {}
+        self._root_order = []
+        self._containers = {}
+        self._lock = threading.Lock()
+        self._dirty = False
+
+    def _key(self, path):
+        return os.path.normcase(os.path.normpath(str(path)))
+
+    def _refresh_root(self, root):
+        key = self._key(root)
+        previous = self._roots.get(key, {})
+        directories = {}
+        scanned = 0
+        reused = 0
+
+        pending = ["."]
+        while pending:
+            relative = pending.pop()
+            path = root if relative == "." else os.path.join(root, relative)
+            mtime_ns = _mtime_ns(path)
+            if mtime_ns is None:
+                continue
+
+            directory = previous.get(relative)
+            if directory is None or directory.mtime_ns != mtime_ns:
+                try:
+                    directory = _scan_directory(path, mtime_ns)
+                except OSError:
+                    continue
+                scanned += 1
+            else:
+                reused += 1
+
+            directories[relative] = directory
+            pending.extend(_join_relative(relative, name) for name in directory.subdirs)
+
+        if scanned or directories.keys() != previous.keys():
+            self._dirty = True
+
+        self._roots[key] = directories
+        if key in self._root_order:
+            self._root_order.remove(key)
+        self._root_order.append(key)
+        for stale_key in self._root_order[:-MAX_INDEXED_ROOTS]:
+            self._roots.pop(stale_key, None)
+        del self._root_order[:-MAX_INDEXED_ROOTS]
+
+        return directories, scanned, reused
+
+    def scan(self, root, patterns=DEFAULT_DATA_FILE_PATTERNS, collapse_min_files=COLLAPSE_MIN_FILES):
+        root = os.path.normpath(str(root))
+        patterns = normalize_data_file_patterns(patterns)
+
+        with self._lock:
+            directories, scanned, reused = self._refresh_root(root)
+
+        coverage = {}
+
+        def covered_count(relative):
+            # Number of files in a fully covered subtree, or None when any file
+            # in it falls outside the patterns.
+            if relative in coverage:
+                return coverage[relative]
+
+            directory = directories.get(relative)
+            count = None
+            if directory is not None and not directory.has_skipped_dirs:
+                if all(_matches(name, patterns) for name in directory.files):
+                    count = len(directory.files)
+                    for name in directory.subdirs:
+                        child_count = covered_count(_join_relative(relative, name))
+                        if child_count is None:
+                            count = None
+                            break
+                        count += child_count
+
+            coverage[relative] = count
+            return count
+
+        entries = []
+
+        def visit(relative):
+            directory = directories.get(relative)
+            if directory is None:
+                return
+
+            folder = root if relative == "." else os.path.join(root, relative)
+            destination = "." if relative == "." else os.path.normpath(relative)
+
+            if relative != ".":
+                count = covered_count(relative)
+                if count is not None and count >= collapse_min_files:
+                    entries.append((os.path.normpath(folder), destination))
+                    return
+
+            for name in directory.files:
+                if _matches(name, patterns):
+                    entries.append((os.path.normpath(os.path.join(folder, name)), destination))
+
+            for name in directory.subdirs:
+                visit(_join_relative(relative, name))
+
+        visit(".")
+        return DataFileScan(entries=entries, directories_scanned=scanned, directories_reused=reused)
+
+    def find_project_container(self, project_root):
+        key = self._key(project_root)
+
+        with self._lock:
+            cached = self._containers.get(key)
+        # Creating or deleting a marker changes the mtime of the folder it
+        # sits in, so unchanged mtimes mean the previous answer still holds.
+        if cached is not None and all(
+            _mtime_ns(folder) == mtime_ns for folder, mtime_ns in cached.checked
+        ):
+            return cached.container
+
+        container = ""
+        checked = []
+        current = Path(project_root).resolve()
+        for _ in range(PROJECT_CONTAINER_MAX_LEVELS):
+            checked.append((str(current), _mtime_ns(current)))
+            if any((current / marker).exists() for marker in PROJECT_CONTAINER_MARKERS):
+                container = os.path.normpath(str(current))
+                break
+
+            parent = current.parent
+            if parent == current:
+                break
+            current = parent
+
+        with self._lock:
+            self._containers[key] = _ContainerLookup(container=container, checked=checked)
+        return container
+
+    def invalidate(self, root=None):
+        with self._lock:
+            if root is None:
+                self._roots.clear()
+                self._root_order.clear()
+                self._containers.clear()
+            else:
+                key = self._key(root)
+                self._roots.pop(key, None)
+                if key in self._root_order:
+                    self._root_order.remove(key)
+            self._dirty = True
+
+    def serialize(self):
+        with self._lock:
+            return {
+                "format": DATA_INDEX_FORMAT_VERSION,
+                "roots": [
+                    {
+                        "root": key,
+                        "directories": {
+                            relative: directory.to_dict()
+                            for relative, directory in self._roots[key].items()
+                        },
+                    }
+                    for key in self._root_order
+                    if key in self._roots
+                ],
+            }
+
+    def load_serialized(self, data):
+        if not isinstance(data, dict) or data.get("format") != DATA_INDEX_FORMAT_VERSION:
+            return
+
+        roots = data.get("roots")
+        if not isinstance(roots, list):
+            return
+
+        with self._lock:
+            for item in roots[-MAX_INDEXED_ROOTS:]:
+                if not isinstance(item, dict) or not isinstance(item.get("directories"), dict):
+                    continue
+
+                directories = {}
+                try:
+                    for relative, directory in item["directories"].items():
+                        directories[str(relative)] = IndexedDirectory(
+                            mtime_ns=int(directory["mtime_ns"]),
+                            files=[str(name) for name in directory.get("files", [])],
+                            subdirs=[str(name) for name in directory.get("subdirs", [])],
+                            has_skipped_dirs=bool(directory.get("has_skipped_dirs", False)),
+                        )
+                except (KeyError, TypeError, ValueError, AttributeError):
+                    continue
+
+                key = self._key(item.get("root", ""))
+                self._roots[key] = directories
+                if key in self._root_order:
+                    self._root_order.remove(key)
+                self._root_order.append(key)
+
+    def load(self, path):
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                self.load_serialized(json.load(f))
+        except (OSError, ValueError):
+            pass
+
+    def save(self, path):
+        if not self._dirty:
+            return False
+
+        temp_path = path + ".tmp"
+        try:
+            with open(temp_path, "w", encoding="utf-8") as f:
+                json.dump(self.serialize(), f, separators=(",", ":"))
+            os.replace(temp_path, path)
+        except OSError:
+            return False
+
+        self._dirty = False
+        return True
+
+
+PROJECT_DATA_INDEX = ProjectDataIndex()
@@ -0,0 +1,102 @@
+import re
+import time
+from dataclasses import dataclass, field
+
+
+PYINSTALLER_STAGES = ("Analysis", "PYZ", "PKG", "EXE", "COLLECT")
+PYINSTALLER_DONE_STAGE = "Done"
+
+# "checking PYZ", "Building PYZ because ...", "Building COLLECT COLLECT-00.toc"
+_STAGE_PATTERN = re.compile(
+    r"\b(?:checking|Building|Running)\s+(" + "|".join(PYINSTALLER_STAGES) + r")\b"
+)
+# Hooks and hidden imports are the per-module work PyInstaller logs while
+# walking the module graph during Analysis.
+_MODULE_PATTERN = re.compile(
+    r"\bProcessing (?:standard module|pre-safe-import-module|pre-find-module-path) hook\b"
+    r"|\bAnalyzing hidden import\b"
+)
+_DONE_PATTERN = re.compile(r"\bBuild complete!")
+
+
+@dataclass(frozen=True)
+class PyInstallerProgress:
+    stage: str
+    stage_index: int
+    modules_processed: int
+    lines_read: int
+    stage_started_at: float
+    stage_durations: dict = field(default_factory=dict)
+
+    @property
+    def stage_count(self):
+        return len(PYINSTALLER_STAGES)
+
+    @property
+    def summary(self):
+        if not self.stage:
+            return "Starting PyInstaller"
+        if self.modules_processed and self.stage == "Analysis":
+            return f"{self.stage} ({self.modules_processed} modules)"
+        return self.stage
+
+
+class PyInstallerLogParser:
+    def __init__(self, clock=time.monotonic):
+        self._clock = clock
+        self.stage = ""
+        self.stage_index = -1
+        self.modules_processed = 0
+        self.lines_read = 0
+        self.stage_started_at = clock()
+        self.stage_durations = {}
+
+    def feed(self, line):
+        """Consume one log line; returns True when the stage changed."""
+        self.lines_read += 1
+
+        if _MODULE_PATTERN.search(line):
+            self.modules_processed += 1
+
+        if _DONE_PATTERN.search(line):
+            return self._enter_stage(PYINSTALLER_DONE_STAGE, len(PYINSTALLER_STAGES))
+
+        match = _STAGE_PATTERN.search(line)
+        if match is None:
+            return False
+
+        stage = match.group(1)
+        index = PYINSTALLER_STAGES.index(stage)
+        # Stages only move forward; "checking X" lines for an earlier target
+        # (for example when the spec re-validates Analysis) are ignored.
+        if index <= self.stage_index:
+            return False
+
+        return self._enter_stage(stage, index)
+
+    def finish(self):
+        self._enter_stage(PYINSTALLER_DONE_STAGE, len(PYINSTALLER_STAGES))
+
+    def _enter_stage(self, stage, index):
+        if stage == self.stage:
+            return False
+
+        now = self._clock()
+        if self.stage and self.stage != PYINSTALLER_DONE_STAGE:
+            self.stage_durations[self.stage] = now - self.stage_started_at
+
+        self.stage = stage
+        self.stage_index = index
+        self.stage_started_at = now
+        return True
+
+    @property
+    def progress(self):
+        return PyInstallerProgress(
+            stage=self.stage,
+            stage_index=self.stage_index,
+            modules_processed=self.modules_processed,
+            lines_read=self.lines_read,
+            stage_started_at=self.stage_started_at,
+            stage_durations=dict(self.stage_durations),
+        )
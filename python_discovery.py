@@ -0,0 +1,310 @@
+import os
+import threading
+from dataclasses import dataclass
+from pathlib import Path
+
+
+DISCOVERY_SOURCE_PROGRAMS = "programs"
+DISCOVERY_SOURCE_REGISTRY = "registry"
+DISCOVERY_SOURCE_PATH = "path"
+DISCOVERY_SOURCE_CONDA = "conda"
+DISCOVERY_SOURCE_VENV = "venv"
+DISCOVERY_SOURCES = (
+    DISCOVERY_SOURCE_PROGRAMS,
+    DISCOVERY_SOURCE_REGISTRY,
+    DISCOVERY_SOURCE_PATH,
+    DISCOVERY_SOURCE_CONDA,
+    DISCOVERY_SOURCE_VENV,
+)
+
+DISCOVERY_FORMAT_VERSION = 1
+MAX_CACHED_LISTINGS = 256
+
+VENV_DIRNAMES = (".venv", "venv", "env")
+# A venv usually sits in the project root, one level above a script kept in
+# src/ or app/.
+VENV_SEARCH_LEVELS = 2
+CONDA_ROOT_DIRNAMES = ("anaconda3", "miniconda3", "miniforge3", "mambaforge")
+
+# Windows installs put python.exe in the prefix, venvs in Scripts/; the bin/
+# layout covers MSYS2 and the Linux test runs.
+_INTERPRETER_LAYOUTS = ("python.exe", os.path.join("Scripts", "python.exe"), os.path.join("bin", "python"))
+
+
+@dataclass(frozen=True)
+class DiscoveredInterpreter:
+    executable: str
+    source: str
+
+
+@dataclass
+class _CachedListing:
+    mtime_ns: int
+    executables: list
+
+
+def interpreter_key(executable):
+    # Two installs can report the same Python version (a conda base and one of
+    # its envs, a Programs install and conda); the executable tells them apart.
+    return os.path.normcase(os.path.normpath(str(executable)))
+
+
+def _mtime_ns(path):
+    try:
+        return os.stat(path).st_mtime_ns
+    except OSError:
+        return None
+
+
+def default_programs_root():
+    return Path.home() / "AppData" / "Local" / "Programs" / "Python"
+
+
+def _interpreter_in(folder):
+    for layout in _INTERPRETER_LAYOUTS:
+        candidate = os.path.join(folder, layout)
+        if os.path.isfile(candidate):
+            return os.path.normpath(candidate)
+    return ""
+
+
+def _child_interpreters(folder):
+    try:
+        children = sorted(entry.path for entry in os.scandir(folder) if entry.is_dir())
+    except OSError:
+        return []
+    return [executable for executable in map(_interpreter_in, children) if executable]
+
+
+def _venv_interpreters(folder):
+    return [
+        executable
+        for executable in (_interpreter_in(os.path.join(folder, name)) for name in VENV_DIRNAMES)
+        if executable
+    ]
+
+
+def _folder_interpreter(folder):
+    executable = _interpreter_in(folder)
+    return [executable] if executable else []
+
+
+def _path_interpreter(folder):
+    candidate = os.path.join(folder, "python.exe" if os.name == "nt" else "python")
+    return [os.path.normpath(candidate)] if os.path.isfile(candidate) else []
+
+
+def _conda_environment_file_entries(path):
+    try:
+        with open(path, "r", encoding="utf-8", errors="replace") as f:
+            folders = [line.strip() for line in f if line.strip()]
+    except OSError:
+        return []
+    return [executable for executable in map(_interpreter_in, folders) if executable]
+
+
+def read_registry_interpreters():
+    # PEP 514 registrations, which is what the py launcher lists.
+    try:
+        import winreg
+    except ImportError:
+        return []
+
+    views = (
+        (winreg.HKEY_CURRENT_USER, 0),
+        (winreg.HKEY_LOCAL_MACHINE, winreg.KEY_WOW64_64KEY),
+        (winreg.HKEY_LOCAL_MACHINE, winreg.KEY_WOW64_32KEY),
+    )
+
+    executables = []
+    for hive, view in views:
+        try:
+            root = winreg.OpenKey(hive, r"Software\Python", 0, winreg.KEY_READ | view)
+        except OSError:
+            continue
+
+        with root:
+            for company in _registry_subkeys(winreg, root):
+                if company == "PyLauncher":
+                    continue
+                try:
+                    company_key = winreg.OpenKey(root, company)
+                except OSError:
+                    continue
+
+                with company_key:
+                    for tag in _registry_subkeys(winreg, company_key):
+                        executable = _registry_install_executable(winreg, company_key, tag)
+                        if executable:
+                            executables.append(executable)
+
+    return executables
+
+
+def _registry_subkeys(winreg, key):
+    index = 0
+    while True:
+        try:
+            yield winreg.EnumKey(key, index)
+        except OSError:
+            return
+        index += 1
+
+
+def _registry_install_executable(winreg, company_key, tag):
+    try:
+        install_key = winreg.OpenKey(company_key, tag + r"\InstallPath")
+    except OSError:
+        return ""
+
+    with install_key:
+        try:
+            return winreg.QueryValueEx(install_key, "ExecutablePath")[0]
+        except OSError:
+            pass
+        try:
+            install_dir = winreg.QueryValueEx(install_key, "")[0]
+        except OSError:
+            return ""
+    return os.path.join(install_dir, "python.exe") if install_dir else ""
+
+
+def _conda_roots(environ):
+    bases = [os.path.expanduser("~"), environ.get("LOCALAPPDATA", ""), environ.get("PROGRAMDATA", "")]
+    roots = [os.path.join(base, name) for base in bases if base for name in CONDA_ROOT_DIRNAMES]
+    if environ.get("CONDA_PREFIX"):
+        roots.append(environ["CONDA_PREFIX"])
+    return roots
+
+
+class PythonDiscovery:
+    def __init__(self, registry_reader=read_registry_interpreters):
+        self._registry_reader = registry_reader
+        self._listings = {}
+        self._lock = threading.Lock()
+
+    def _key(self, kind, folder):
+        return f"{kind}|{os.path.normcase(os.path.normpath(str(folder)))}"
+
+    def _listing(self, kind, folder, scan):
+        # Installing, removing or renaming an environment changes the mtime
+        # of the folder holding it, so an unchanged mtime means the previous
+        # listing still holds and the folder is not walked again.
+        key = self._key(kind, folder)
+        mtime_ns = _mtime_ns(folder)
+        if mtime_ns is None:
+            with self._lock:
+                self._listings.pop(key, None)
+            return []
+
+        with self._lock:
+            cached = self._listings.get(key)
+        if cached is not None and cached.mtime_ns == mtime_ns:
+            return list(cached.executables)
+
+        executables = scan(folder)
+        with self._lock:
+            self._listings.pop(key, None)
+            self._listings[key] = _CachedListing(mtime_ns=mtime_ns, executables=list(executables))
+            while len(self._listings) > MAX_CACHED_LISTINGS:
+                self._listings.pop(next(iter(self._listings)))
+        return executables
+
+    def _source_executables(self, source, programs_root, script_paths, environ):
+        if source == DISCOVERY_SOURCE_PROGRAMS:
+            return self._listing(source, programs_root, _child_interpreters)
+
+        if source == DISCOVERY_SOURCE_REGISTRY:
+            try:
+                return list(self._registry_reader())
+            except OSError:
+                return []
+
+        if source == DISCOVERY_SOURCE_PATH:
+            # Same answer as "where python", without spawning it.
+            folders = [folder for folder in environ.get("PATH", "").split(os.pathsep) if folder]
+            return [
+                executable
+                for folder in folders
+                for executable in self._listing(source, folder, _path_interpreter)
+            ]
+
+        if source == DISCOVERY_SOURCE_CONDA:
+            executables = []
+            for root in _conda_roots(environ):
+                executables.extend(self._listing(source, root, _folder_interpreter))
+                executables.extend(self._listing(source, os.path.join(root, "envs"), _child_interpreters))
+            environments_file = os.path.join(os.path.expanduser("~"), ".conda", "environments.txt")
+            executables.extend(self._listing(source, environments_file, _conda_environment_file_entries))
+            return executables
+
+        if source == DISCOVERY_SOURCE_VENV:
+            executables = []
+            for script_path in script_paths:
+                folder = os.path.dirname(os.path.normpath(str(script_path)))
+                for _ in range(VENV_SEARCH_LEVELS):
+                    if not folder:
+                        break
+                    executables.extend(self._listing(source, folder, _venv_interpreters))
+                    parent = os.path.dirname(folder)
+                    if parent == folder:
+                        break
+                    folder = parent
+            return executables
+
+        raise ValueError(f"Unknown interpreter discovery source: {source}")
+
+    def discover(self, sources=DISCOVERY_SOURCES, programs_root=None, script_paths=(), environ=None):
+        environ = os.environ if environ is None else environ
+        programs_root = str(programs_root or default_programs_root())
+
+        seen = set()
+        discovered = []
+        for source in sources:
+            for executable in self._source_executables(source, programs_root, script_paths, environ):
+                executable = os.path.normpath(str(executable))
+                key = interpreter_key(executable)
+                # The WindowsApps entry is the Store installer stub, not an
+                # interpreter.
+                if key in seen or "windowsapps" in key:
+                    continue
+                seen.add(key)
+                if os.path.isfile(executable):
+                    discovered.append(DiscoveredInterpreter(executable=executable, source=source))
+
+        return discovered
+
+    def clear(self):
+        with self._lock:
+            self._listings.clear()
+
+    def serialize(self):
+        with self._lock:
+            return {
+                "format": DISCOVERY_FORMAT_VERSION,
+                "listings": [
+                    {"key": key, "mtime_ns": listing.mtime_ns, "executables": listing.executables}
+                    for key, listing in self._listings.items()
+                ],
+            }
+
+    def load_serialized(self, data):
+        if not isinstance(data, dict) or data.get("format") != DISCOVERY_FORMAT_VERSION:
+            return
+
+        listings = data.get("listings")
+        if not isinstance(listings, list):
+            return
+
+        with self._lock:
+            for item in listings[-MAX_CACHED_LISTINGS:]:
+                try:
+                    self._listings[str(item["key"])] = _CachedListing(
+                        mtime_ns=int(item["mtime_ns"]),
+                        executables=[str(path) for path in item.get("executables", [])],
+                    )
+                except (KeyError, TypeError, ValueError, AttributeError):
+                    continue
+
+
+PYTHON_DISCOVERY = PythonDiscovery()
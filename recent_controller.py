@@ -1,5 +1,5 @@
 import time
-import os, json
+import os
 from PySide6.QtWidgets import QMessageBox, QDialogButtonBox
 from PySide6.QtCore import Qt
 from styles import (
@@ -7,6 +7,9 @@ from styles import (
     RECENT_DELETE_MESSAGE_BOX_STYLE,
     apply_native_title_bar_style,
 )
+from event_loop import event_loop_running
+from path_existence import PATH_EXISTENCE, BackgroundPathCheck
+from state_store import STATE_STORE
 from ui_highlights import flash_add_highlight, flash_delete_highlight
 
 MAX_RECENTS = 50
@@ -94,6 +97,39 @@ def _wrap_delete_confirmation_path(path, max_line_length=DELETE_CONFIRMATION_PAT
 class RecentController:
     def __init__(self, app):
         self.app = app
+        self._path_checks = BackgroundPathCheck()
+
+    def _checked_recent_paths(self, state_path, data, state_key, refresh):
+        # The dropdown is filled straight away from what is already known:
+        # entries known to be missing are pruned, unchecked ones are shown.
+        # When the background check finds a missing entry, the dropdown is
+        # refilled.
+        raw_paths = data.get(state_key, [])
+        paths = [os.path.abspath(os.path.normpath(p)) for p in raw_paths if p]
+
+        known = PATH_EXISTENCE.cached(paths)
+        unchecked = [p for p in paths if p not in known]
+        if unchecked:
+            if event_loop_running():
+                self._path_checks.request(
+                    unchecked,
+                    lambda results: self._on_recent_paths_checked(results, refresh),
+                )
+            else:
+                # Nothing would deliver a background result; check inline.
+                known.update(PATH_EXISTENCE.check(unchecked))
+
+        valid_paths = [p for p in paths if known.get(p) is not False]
+
+        if len(valid_paths) != len(raw_paths):
+            data[state_key] = valid_paths
+            STATE_STORE.replace(state_path, data)
+
+        return valid_paths
+
+    def _on_recent_paths_checked(self, results, refresh):
+        if any(exists is False for exists in results.values()):
+            refresh()
 
     def _show_recent_delete_confirmation(
         self,
@@ -173,15 +209,7 @@ class RecentController:
             return
 
         state_path = app.state_ctrl._state_file_path()
-
-        try:
-            if os.path.isfile(state_path):
-                with open(state_path, "r", encoding="utf-8") as f:
-                    data = json.load(f)
-            else:
-                data = {}
-        except:
-            data = {}
+        data = STATE_STORE.open(state_path)
 
         lst = data.get("recent_interpreters", [])
 
@@ -193,11 +221,7 @@ class RecentController:
 
         data["recent_interpreters"] = lst
 
-        try:
-            with open(state_path, "w", encoding="utf-8") as f:
-                json.dump(data, f, indent=4)
-        except Exception as e:
-            print("Recent interpreters save error:", e)
+        STATE_STORE.replace(state_path, data)
 
         app.state_data = data
         self.populate_recent_interpreters_dropdown()
@@ -219,15 +243,7 @@ class RecentController:
         item.setFlags(item.flags() & ~Qt.ItemIsEnabled)
     
         state_path = app.state_ctrl._state_file_path()
-
-        try:
-            if os.path.isfile(state_path):
-                with open(state_path, "r", encoding="utf-8") as f:
-                    data = json.load(f)
-            else:
-                data = {}
-        except:
-            data = {}
+        data = STATE_STORE.open(state_path)
 
         # paths = sorted(
         #     data.get("recent_interpreters", []),
@@ -237,23 +253,13 @@ class RecentController:
         #     )
         # )
 
-        raw_paths = data.get("recent_interpreters", [])
-
-        # 🔑 CLEAN STALE ENTRIES
-        valid_paths = [
-            os.path.abspath(os.path.normpath(p))
-            for p in raw_paths
-            if p and os.path.isfile(os.path.abspath(os.path.normpath(p)))
-        ]
-
-        # 🔑 WRITE BACK CLEANED LIST
-        if len(valid_paths) != len(raw_paths):
-            data["recent_interpreters"] = valid_paths
-            try:
-                with open(state_path, "w", encoding="utf-8") as f:
-                    json.dump(data, f, indent=4)
-            except:
-                pass
+        # 🔑 CLEAN STALE ENTRIES (checked off the GUI thread)
+        valid_paths = self._checked_recent_paths(
+            state_path,
+            data,
+            "recent_interpreters",
+            self.populate_recent_interpreters_dropdown,
+        )
 
         # 🔑 USE CLEAN LIST
         paths = sorted(
@@ -279,8 +285,6 @@ class RecentController:
 
             if not ap:
                 continue
-            if not os.path.isfile(ap):
-                continue
             if ap in seen:
                 continue
 
@@ -322,15 +326,7 @@ class RecentController:
             app.python_path = ""
 
         state_path = app.state_ctrl._state_file_path()
-
-        try:
-            if os.path.isfile(state_path):
-                with open(state_path, "r", encoding="utf-8") as f:
-                    data = json.load(f)
-            else:
-                data = {}
-        except:
-            data = {}
+        data = STATE_STORE.open(state_path)
 
         lst = data.get("recent_interpreters", [])
 
@@ -340,8 +336,7 @@ class RecentController:
         data["recent_interpreters"] = lst
         app.state_data = data
 
-        with open(state_path, "w", encoding="utf-8") as f:
-            json.dump(data, f, indent=4)
+        STATE_STORE.replace(state_path, data)
 
         app.validator.validation_status_message()
         self.populate_recent_interpreters_dropdown()
@@ -364,24 +359,12 @@ class RecentController:
         )
 
         state_path = app.state_ctrl._state_file_path()
-
-        try:
-            if os.path.isfile(state_path):
-                with open(state_path, "r", encoding="utf-8") as f:
-                    data = json.load(f)
-            else:
-                data = {}
-        except:
-            data = {}
+        data = STATE_STORE.open(state_path)
 
         data["recent_interpreters"] = []
         app.state_data = data
 
-        try:
-            with open(state_path, "w", encoding="utf-8") as f:
-                json.dump(data, f, indent=4)
-        except Exception as e:
-            print("Delete all interpreters error:", e)
+        STATE_STORE.replace(state_path, data)
 
         # 🔑 clear current UI/state
         if hasattr(app, "python_entry_input"):
@@ -404,15 +387,7 @@ class RecentController:
             return
 
         state_path = app.state_ctrl._state_file_path()
-
-        try:
-            if os.path.isfile(state_path):
-                with open(state_path, "r", encoding="utf-8") as f:
-                    data = json.load(f)
-            else:
-                data = {}
-        except:
-            data = {}
+        data = STATE_STORE.open(state_path)
 
         lst = data.get("recent_scripts", [])
 
@@ -424,11 +399,7 @@ class RecentController:
 
         data["recent_scripts"] = lst
 
-        try:
-            with open(state_path, "w", encoding="utf-8") as f:
-                json.dump(data, f, indent=4)
-        except Exception as e:
-            print("Recent scripts save error:", e)
+        STATE_STORE.replace(state_path, data)
 
         app.state_data = data
         self.populate_recent_dropdown() 
@@ -450,15 +421,7 @@ class RecentController:
         item.setFlags(item.flags() & ~Qt.ItemIsEnabled)
        
         state_path = app.state_ctrl._state_file_path()
-
-        try:
-            if os.path.isfile(state_path):
-                with open(state_path, "r", encoding="utf-8") as f:
-                    data = json.load(f)
-            else:
-                data = {}
-        except:
-            data = {}
+        data = STATE_STORE.open(state_path)
 
         # paths = sorted(
         #     data.get("recent_scripts", []),
@@ -468,23 +431,13 @@ class RecentController:
         #     )
         # )
 
-        raw_paths = data.get("recent_scripts", [])
-
-        # 🔑 CLEAN STALE ENTRIES
-        valid_paths = [
-            os.path.abspath(os.path.normpath(p))
-            for p in raw_paths
-            if p and os.path.isfile(os.path.abspath(os.path.normpath(p)))
-        ]
-
-        # 🔑 WRITE BACK CLEANED LIST
-        if len(valid_paths) != len(raw_paths):
-            data["recent_scripts"] = valid_paths
-            try:
-                with open(state_path, "w", encoding="utf-8") as f:
-                    json.dump(data, f, indent=4)
-            except:
-                pass
+        # 🔑 CLEAN STALE ENTRIES (checked off the GUI thread)
+        valid_paths = self._checked_recent_paths(
+            state_path,
+            data,
+            "recent_scripts",
+            self.populate_recent_dropdown,
+        )
 
         # 🔑 USE CLEAN LIST
         paths = sorted(
@@ -510,8 +463,6 @@ class RecentController:
 
             if not ap:
                 continue
-            if not os.path.isfile(ap):
-                continue
             if ap in seen:
                 continue
 
@@ -577,15 +528,7 @@ class RecentController:
             app.script_path = ""
 
         state_path = app.state_ctrl._state_file_path()
-
-        try:
-            if os.path.isfile(state_path):
-                with open(state_path, "r", encoding="utf-8") as f:
-                    data = json.load(f)
-            else:
-                data = {}
-        except:
-            data = {}
+        data = STATE_STORE.open(state_path)
 
         lst = data.get("recent_scripts", [])
 
@@ -595,8 +538,7 @@ class RecentController:
         data["recent_scripts"] = lst
         app.state_data = data
 
-        with open(state_path, "w", encoding="utf-8") as f:
-            json.dump(data, f, indent=4)
+        STATE_STORE.replace(state_path, data)
 
         self.populate_recent_dropdown()
         app.validator.validation_status_message()
@@ -617,26 +559,14 @@ class RecentController:
         )
 
         state_path = app.state_ctrl._state_file_path()
-
-        try:
-            if os.path.isfile(state_path):
-                with open(state_path, "r", encoding="utf-8") as f:
-                    data = json.load(f)
-            else:
-                data = {}
-        except:
-            data = {}
+        data = STATE_STORE.open(state_path)
 
         # 🔑 clear list
         data["recent_scripts"] = []
 
         app.state_data = data
 
-        try:
-            with open(state_path, "w", encoding="utf-8") as f:
-                json.dump(data, f, indent=4)
-        except Exception as e:
-            print("Delete all recent scripts error:", e)
+        STATE_STORE.replace(state_path, data)
 
         # 🔑 clear UI + runtime state
         if hasattr(app, "script_path_input"):
@@ -689,15 +619,7 @@ class RecentController:
             return
 
         state_path = app.state_ctrl._state_file_path()
-
-        try:
-            if os.path.isfile(state_path):
-                with open(state_path, "r", encoding="utf-8") as f:
-                    data = json.load(f)
-            else:
-                data = {}
-        except:
-            data = {}
+        data = STATE_STORE.open(state_path)
 
         lst = data.get("recent_icons", [])
 
@@ -709,11 +631,7 @@ class RecentController:
 
         data["recent_icons"] = lst
 
-        try:
-            with open(state_path, "w", encoding="utf-8") as f:
-                json.dump(data, f, indent=4)
-        except Exception as e:
-            print("Recent icons save error:", e)
+        STATE_STORE.replace(state_path, data)
 
         self.populate_recent_icons_dropdown()
         app.state_data = data
@@ -735,38 +653,20 @@ class RecentController:
         item.setFlags(item.flags() & ~Qt.ItemIsEnabled)
 
         state_path = app.state_ctrl._state_file_path()
-
-        try:
-            if os.path.isfile(state_path):
-                with open(state_path, "r", encoding="utf-8") as f:
-                    data = json.load(f)
-            else:
-                data = {}
-        except:
-            data = {}
+        data = STATE_STORE.open(state_path)
 
         # paths = sorted(
         #     data.get("recent_icons", []),
         #     key=lambda p: os.path.basename(p).lower()
         # )
 
-        raw_paths = data.get("recent_icons", [])
-
-        # 🔑 CLEAN STALE ENTRIES
-        valid_paths = [
-            os.path.abspath(os.path.normpath(p))
-            for p in raw_paths
-            if p and os.path.isfile(os.path.abspath(os.path.normpath(p)))
-        ]
-
-        # 🔑 WRITE BACK CLEANED LIST
-        if len(valid_paths) != len(raw_paths):
-            data["recent_icons"] = valid_paths
-            try:
-                with open(state_path, "w", encoding="utf-8") as f:
-                    json.dump(data, f, indent=4)
-            except:
-                pass
+        # 🔑 CLEAN STALE ENTRIES (checked off the GUI thread)
+        valid_paths = self._checked_recent_paths(
+            state_path,
+            data,
+            "recent_icons",
+            self.populate_recent_icons_dropdown,
+        )
 
         # 🔑 USE CLEAN LIST
         paths = sorted(
@@ -789,8 +689,6 @@ class RecentController:
 
             if not ap:
                 continue
-            if not os.path.isfile(ap):
-                continue
             if ap in seen:
                 continue
 
@@ -828,15 +726,7 @@ class RecentController:
             app.icon_path = ""
 
         state_path = app.state_ctrl._state_file_path()
-
-        try:
-            if os.path.isfile(state_path):
-                with open(state_path, "r", encoding="utf-8") as f:
-                    data = json.load(f)
-            else:
-                data = {}
-        except:
-            data = {}
+        data = STATE_STORE.open(state_path)
 
         lst = data.get("recent_icons", [])
 
@@ -846,8 +736,7 @@ class RecentController:
         data["recent_icons"] = lst
         app.state_data = data
 
-        with open(state_path, "w", encoding="utf-8") as f:
-            json.dump(data, f, indent=4)
+        STATE_STORE.replace(state_path, data)
 
         self.populate_recent_icons_dropdown()
         app.validator.validation_status_message()
@@ -869,25 +758,13 @@ class RecentController:
         )
 
         state_path = app.state_ctrl._state_file_path()
-
-        try:
-            if os.path.isfile(state_path):
-                with open(state_path, "r", encoding="utf-8") as f:
-                    data = json.load(f)
-            else:
-                data = {}
-        except:
-            data = {}
+        data = STATE_STORE.open(state_path)
 
         data["recent_icons"] = []
 
         app.state_data = data
 
-        try:
-            with open(state_path, "w", encoding="utf-8") as f:
-                json.dump(data, f, indent=4)
-        except Exception as e:
-            print("Delete all recent icons error:", e)
+        STATE_STORE.replace(state_path, data)
 
         if hasattr(app, "icon_path_input"):
             app.icon_path_input.clear()
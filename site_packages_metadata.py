@@ -0,0 +1,171 @@
+import hashlib
+import json
+import os
+import re
+
+from interpreter_cache import interpreter_signature, site_packages_candidates
+
+
+SYS_PATH_PROBE = "import json, sys; print(json.dumps(sys.path))"
+# Entries pip adds, removes or rewrites on install; anything else in
+# site-packages is package code and irrelevant to the installed set.
+_INSTALL_RECORD_SUFFIXES = (".dist-info", ".egg-info", ".egg-link", ".pth")
+
+
+class MetadataReadError(Exception):
+    pass
+
+
+def normalize_package_name(name):
+    return re.sub(r"[-_.]+", "-", name).lower()
+
+
+def probe_sys_path(executable, run, timeout):
+    # Starting the interpreter with site enabled is what puts user
+    # site-packages and .pth entries on sys.path, exactly as pip sees them.
+    result = run([str(executable), "-c", SYS_PATH_PROBE], timeout=timeout)
+    if result.returncode != 0:
+        raise MetadataReadError((result.stderr or result.stdout or "sys.path probe failed.").strip())
+
+    try:
+        paths = json.loads(result.stdout or "[]")
+    except ValueError as exc:
+        raise MetadataReadError(f"Unreadable sys.path probe output: {exc}") from exc
+
+    return [str(path) for path in paths if path]
+
+
+def _read_headers(path):
+    name = ""
+    version = ""
+    try:
+        with open(path, "r", encoding="utf-8", errors="replace") as f:
+            for line in f:
+                if not line.strip():
+                    # Headers end at the first blank line; the long
+                    # description that follows can be megabytes.
+                    break
+                key, separator, value = line.partition(":")
+                if not separator:
+                    continue
+                key = key.strip().lower()
+                if key == "name" and not name:
+                    name = value.strip()
+                elif key == "version" and not version:
+                    version = value.strip()
+                if name and version:
+                    break
+    except OSError:
+        return "", ""
+    return name, version
+
+
+def _metadata_files(path_entry):
+    if path_entry.lower().endswith(".egg") and os.path.isdir(path_entry):
+        yield os.path.join(path_entry, "EGG-INFO", "PKG-INFO")
+        return
+
+    try:
+        entries = sorted(os.scandir(path_entry), key=lambda entry: entry.name)
+    except (OSError, NotADirectoryError):
+        return
+
+    for entry in entries:
+        lowered = entry.name.lower()
+        if lowered.endswith(".dist-info"):
+            yield os.path.join(entry.path, "METADATA")
+        elif lowered.endswith(".egg-info"):
+            # Old setuptools installs write egg-info as a single file.
+            yield os.path.join(entry.path, "PKG-INFO") if entry.is_dir() else entry.path
+        elif lowered.endswith(".egg-link"):
+            yield from _egg_link_metadata(entry.path)
+
+
+def _egg_link_metadata(link_path):
+    try:
+        with open(link_path, "r", encoding="utf-8", errors="replace") as f:
+            project_dir = f.readline().strip()
+    except OSError:
+        return
+
+    if not project_dir or not os.path.isdir(project_dir):
+        return
+
+    for name in sorted(os.listdir(project_dir)):
+        if name.lower().endswith(".egg-info"):
+            yield os.path.join(project_dir, name, "PKG-INFO")
+
+
+def read_installed_distributions(paths):
+    packages = {}
+    for path_entry in paths:
+        for metadata_file in _metadata_files(path_entry):
+            name, version = _read_headers(metadata_file)
+            if not name or not version:
+                continue
+
+            key = normalize_package_name(name)
+            # The first match on sys.path shadows later ones, as at import time.
+            if key in packages:
+                continue
+            packages[key] = {"name": name, "version": version}
+
+    return packages
+
+
+def read_installed_packages_from_metadata(executable, run, timeout):
+    packages = read_installed_distributions(probe_sys_path(executable, run, timeout))
+    if not packages:
+        # Every working interpreter has at least pip installed; an empty result
+        # means the layout was not understood, so let the caller fall back.
+        raise MetadataReadError("No package metadata found on sys.path.")
+    return packages
+
+
+def user_site_packages(python_version, environ=None):
+    match = re.match(r"(\d+)\.(\d+)", str(python_version or ""))
+    if not match:
+        return ""
+
+    major, minor = match.groups()
+    environ = os.environ if environ is None else environ
+    if os.name == "nt":
+        appdata = environ.get("APPDATA", "")
+        if not appdata:
+            return ""
+        return os.path.join(appdata, "Python", f"Python{major}{minor}", "site-packages")
+    return os.path.join(os.path.expanduser("~"), ".local", "lib", f"python{major}.{minor}", "site-packages")
+
+
+def _install_records(path):
+    try:
+        with os.scandir(path) as iterator:
+            records = []
+            for entry in iterator:
+                if not entry.name.lower().endswith(_INSTALL_RECORD_SUFFIXES):
+                    continue
+                try:
+                    mtime_ns = entry.stat().st_mtime_ns
+                except OSError:
+                    mtime_ns = None
+                records.append([entry.name, mtime_ns])
+    except OSError:
+        return None
+    return sorted(records)
+
+
+def environment_fingerprint(executable, python_version=""):
+    # The folder mtimes alone miss a reinstall of the same version within the
+    # filesystem's timestamp granularity; the dist-info names and their own
+    # mtimes catch that without spawning the interpreter.
+    parts = [interpreter_signature(executable)]
+
+    directories = [path for path in site_packages_candidates(os.path.normpath(str(executable))) if os.path.isdir(path)]
+    user_site = user_site_packages(python_version)
+    if user_site:
+        directories.append(user_site)
+
+    for directory in directories:
+        parts.append([os.path.normcase(directory), _install_records(directory)])
+
+    return hashlib.sha256(json.dumps(parts).encode("utf-8")).hexdigest()
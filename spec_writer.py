@@ -0,0 +1,235 @@
+import hashlib
+import os
+from dataclasses import dataclass, field
+
+
+SPEC_FILE_SUFFIX = ".spec"
+SPEC_HEADER = (
+    "# -*- mode: python ; coding: utf-8 -*-\n"
+    "# Generated by Win-11-Python-EXE-Builder from the build options.\n"
+    "# Rewritten only when those options change; edits here are overwritten.\n"
+)
+
+# Options that take a value, either as "--opt=value" or "--opt value".
+_VALUE_OPTIONS = {
+    "--add-data",
+    "--collect-all",
+    "--distpath",
+    "--hidden-import",
+    "--icon",
+    "--name",
+    "--paths",
+    "--runtime-hook",
+    "--specpath",
+    "--workpath",
+}
+_FLAG_OPTIONS = {"--clean", "--noconfirm", "--onedir", "--windowed", "--noconsole"}
+
+
+class SpecConversionError(ValueError):
+    pass
+
+
+@dataclass
+class SpecOptions:
+    name: str = ""
+    scripts: list = field(default_factory=list)
+    pathex: list = field(default_factory=list)
+    datas: list = field(default_factory=list)
+    hiddenimports: list = field(default_factory=list)
+    collect_all: list = field(default_factory=list)
+    runtime_hooks: list = field(default_factory=list)
+    icon: str = ""
+    console: bool = True
+    clean: bool = False
+    noconfirm: bool = False
+    distpath: str = ""
+    workpath: str = ""
+    specpath: str = ""
+
+
+@dataclass(frozen=True)
+class SpecCommand:
+    cmd: list
+    spec_file: str
+    written: bool
+    digest: str
+
+
+def split_pyinstaller_command(cmd):
+    for index in range(len(cmd) - 1):
+        if cmd[index] == "-m" and cmd[index + 1] == "PyInstaller":
+            return list(cmd[: index + 2]), list(cmd[index + 2:])
+    raise SpecConversionError("Command does not run PyInstaller as a module.")
+
+
+def _split_data_arg(value):
+    source, separator, destination = value.rpartition(os.pathsep)
+    if not separator or not source:
+        raise SpecConversionError(f"Unrecognised --add-data value: {value}")
+    return source, destination or "."
+
+
+def parse_build_options(options):
+    spec = SpecOptions()
+    tokens = list(options)
+    index = 0
+
+    while index < len(tokens):
+        token = tokens[index]
+        index += 1
+
+        if not token.startswith("--"):
+            spec.scripts.append(token)
+            continue
+
+        option, has_value, value = token.partition("=")
+        if option in _FLAG_OPTIONS and not has_value:
+            if option in {"--windowed", "--noconsole"}:
+                spec.console = False
+            elif option == "--clean":
+                spec.clean = True
+            elif option == "--noconfirm":
+                spec.noconfirm = True
+            continue
+
+        if option not in _VALUE_OPTIONS:
+            raise SpecConversionError(f"Option {option} has no spec equivalent here.")
+
+        if not has_value:
+            if index >= len(tokens):
+                raise SpecConversionError(f"Option {option} is missing its value.")
+            value = tokens[index]
+            index += 1
+
+        if option == "--add-data":
+            spec.datas.append(_split_data_arg(value))
+        elif option == "--collect-all":
+            spec.collect_all.append(value)
+        elif option == "--hidden-import":
+            spec.hiddenimports.append(value)
+        elif option == "--paths":
+            spec.pathex.append(value)
+        elif option == "--runtime-hook":
+            spec.runtime_hooks.append(value)
+        elif option == "--icon":
+            spec.icon = value
+        else:
+            setattr(spec, option[2:], value)
+
+    if not spec.name or not spec.scripts or not spec.specpath:
+        raise SpecConversionError("Build options need --name, --specpath and an entry script.")
+
+    return spec
+
+
+def _list_literal(values, indent="    "):
+    if not values:
+        return "[]"
+    lines = "".join(f"{indent}    {value!r},\n" for value in values)
+    return f"[\n{lines}{indent}]"
+
+
+def render_spec(spec):
+    # Same layout PyInstaller's makespec produces for --onedir, with every
+    # path absolute so the file does not depend on where it is stored.
+    icon = "'NONE'" if spec.icon in {"", "NONE"} else repr([spec.icon])
+
+    return (
+        SPEC_HEADER
+        + "from PyInstaller.utils.hooks import collect_all\n"
+        + "\n"
+        + f"datas = {_list_literal(spec.datas, indent='')}\n"
+        + "binaries = []\n"
+        + f"hiddenimports = {_list_literal(spec.hiddenimports, indent='')}\n"
+        + f"for package in {spec.collect_all!r}:\n"
+        + "    collected = collect_all(package)\n"
+        + "    datas += collected[0]\n"
+        + "    binaries += collected[1]\n"
+        + "    hiddenimports += collected[2]\n"
+        + "\n"
+        + "a = Analysis(\n"
+        + f"    {_list_literal(spec.scripts)},\n"
+        + f"    pathex={_list_literal(spec.pathex)},\n"
+        + "    binaries=binaries,\n"
+        + "    datas=datas,\n"
+        + "    hiddenimports=hiddenimports,\n"
+        + "    hookspath=[],\n"
+        + "    hooksconfig={},\n"
+        + f"    runtime_hooks={_list_literal(spec.runtime_hooks)},\n"
+        + "    excludes=[],\n"
+        + "    noarchive=False,\n"
+        + ")\n"
+        + "pyz = PYZ(a.pure)\n"
+        + "\n"
+        + "exe = EXE(\n"
+        + "    pyz,\n"
+        + "    a.scripts,\n"
+        + "    [],\n"
+        + "    exclude_binaries=True,\n"
+        + f"    name={spec.name!r},\n"
+        + "    debug=False,\n"
+        + "    bootloader_ignore_signals=False,\n"
+        + "    strip=False,\n"
+        + "    upx=True,\n"
+        + f"    console={spec.console!r},\n"
+        + "    disable_windowed_traceback=False,\n"
+        + "    argv_emulation=False,\n"
+        + "    target_arch=None,\n"
+        + "    codesign_identity=None,\n"
+        + "    entitlements_file=None,\n"
+        + f"    icon={icon},\n"
+        + ")\n"
+        + "coll = COLLECT(\n"
+        + "    exe,\n"
+        + "    a.binaries,\n"
+        + "    a.datas,\n"
+        + "    strip=False,\n"
+        + "    upx=True,\n"
+        + "    upx_exclude=[],\n"
+        + f"    name={spec.name!r},\n"
+        + ")\n"
+    )
+
+
+def _digest(data):
+    return hashlib.sha256(data).hexdigest()
+
+
+def write_spec_if_changed(spec_file, text):
+    data = text.encode("utf-8")
+    digest = _digest(data)
+
+    try:
+        with open(spec_file, "rb") as f:
+            if _digest(f.read()) == digest:
+                return False, digest
+    except OSError:
+        pass
+
+    os.makedirs(os.path.dirname(spec_file), exist_ok=True)
+    temp_file = spec_file + ".tmp"
+    with open(temp_file, "wb") as f:
+        f.write(data)
+    os.replace(temp_file, spec_file)
+    return True, digest
+
+
+def build_spec_command(cmd):
+    prefix, options = split_pyinstaller_command(cmd)
+    spec = parse_build_options(options)
+    spec_file = os.path.join(spec.specpath, spec.name + SPEC_FILE_SUFFIX)
+    written, digest = write_spec_if_changed(spec_file, render_spec(spec))
+
+    spec_cmd = list(prefix)
+    if spec.noconfirm:
+        spec_cmd.append("--noconfirm")
+    if spec.clean:
+        spec_cmd.append("--clean")
+    if spec.distpath:
+        spec_cmd.append(f"--distpath={spec.distpath}")
+    if spec.workpath:
+        spec_cmd.append(f"--workpath={spec.workpath}")
+    spec_cmd.append(spec_file)
+
+    return SpecCommand(cmd=spec_cmd, spec_file=spec_file, written=written, digest=digest)
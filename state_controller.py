@@ -1,5 +1,4 @@
 import os
-import json
 
 from datetime_build_options import (
     ISO_MASS_DATETIME_BUILD_SENTINEL,
@@ -8,6 +7,19 @@ from datetime_build_options import (
     UK_MASS_DATETIME_BUILD_SENTINEL,
     USA_MASS_DATETIME_BUILD_SENTINEL,
 )
+from build_history import BUILD_HISTORY
+from environment_sync_controller import MAX_PARALLEL_ENVIRONMENT_SYNCS
+from environment_profile_cache import PROFILE_CACHE_FILE_NAME
+from environment_sync_preview import INSTALL_HISTORY
+from interpreter_cache import INTERPRETER_CAPABILITIES
+from python_discovery import PYTHON_DISCOVERY
+from state_store import STATE_STORE
+from project_data_index import (
+    DATA_INDEX_FILE_NAME,
+    DEFAULT_DATA_FILE_PATTERNS,
+    PROJECT_DATA_INDEX,
+    normalize_data_file_patterns,
+)
 
 class StateController:
     NO_DATETIME_LABEL = DATETIME_NO_DATETIME_LABEL
@@ -39,6 +51,12 @@ class StateController:
 
         return os.path.join(base_dir, "exe_builder_state.json")
 
+    def _data_index_file_path(self) -> str:
+        return os.path.join(os.path.dirname(self._state_file_path()), DATA_INDEX_FILE_NAME)
+
+    def _env_sync_cache_file_path(self) -> str:
+        return os.path.join(os.path.dirname(self._state_file_path()), PROFILE_CACHE_FILE_NAME)
+
         
     # ============================================================
     # LOAD
@@ -63,13 +81,15 @@ class StateController:
 
         if not os.path.isfile(state_path):
             self.app.state_data = {"recent_scripts": []}
+            env_sync_controller = getattr(self.app, "environment_sync_controller", None)
+            if env_sync_controller is not None:
+                env_sync_controller.attach_profile_cache(self._env_sync_cache_file_path())
             return
 
         blocked_widgets = []
 
         try:
-            with open(state_path, "r", encoding="utf-8") as f:
-                data = json.load(f)
+            data = STATE_STORE.open(state_path)
 
             def _norm(p):
                 return os.path.normpath(p) if p else ""
@@ -108,6 +128,13 @@ class StateController:
             self.app.minimize_after_build_enabled = data.get("minimize_after_build_enabled", True)
             self.app.open_output_dir_after_build_enabled = data.get("open_output_dir_after_build_enabled", False)
             self.app.suppress_exit_dialogue_enabled = data.get("suppress_exit_dialogue_enabled", False)
+            self.app.incremental_build_enabled = data.get("incremental_build_enabled", True)
+            self.app.mass_build_stamp_variants_enabled = data.get("mass_build_stamp_variants_enabled", False)
+            self.app.spec_file_builds_enabled = data.get("spec_file_builds_enabled", True)
+            self.app.env_sync_max_parallel = data.get("env_sync_max_parallel", MAX_PARALLEL_ENVIRONMENT_SYNCS)
+            self.app.data_file_patterns = list(
+                normalize_data_file_patterns(data.get("data_file_patterns", DEFAULT_DATA_FILE_PATTERNS))
+            )
 
             self.app.script_path = _norm(data.get("last_script_path", ""))
             self.app.icon_path = _norm(data.get("last_icon_path", ""))
@@ -129,6 +156,7 @@ class StateController:
             self.app.datetime_format = data.get("datetime_format", None)
 
             self.app.last_build_seconds = data.get("last_build_seconds", 45)
+            BUILD_HISTORY.load_serialized(data.get("build_history", []))
 
             self.app.icon_user_cleared = data.get("icon_user_cleared", False)
             self.app.script_user_cleared = data.get("script_user_cleared", False)
@@ -234,15 +262,20 @@ class StateController:
                 if hasattr(self.app, "select_interpreter"):
                     self.app.select_interpreter.setCurrentIndex(0)
 
+            INTERPRETER_CAPABILITIES.load_serialized(data.get("interpreter_capabilities", []))
+            PYTHON_DISCOVERY.load_serialized(data.get("python_discovery", {}))
+            INSTALL_HISTORY.load_serialized(data.get("env_sync_install_history", {}))
+            PROJECT_DATA_INDEX.load(self._data_index_file_path())
+
+            # Scanned profiles live in their own compact cache file; older
+            # state files carried them inline and are migrated once.
             env_sync_controller = getattr(self.app, "environment_sync_controller", None)
             if env_sync_controller is not None:
-                env_sync_profiles = data.get("env_sync_profiles", [])
-                if env_sync_profiles:
-                    env_sync_controller.load_serialized_profiles(
-                        env_sync_profiles,
-                        update_ui=True,
-                    )
-                
+                env_sync_controller.attach_profile_cache(
+                    self._env_sync_cache_file_path(),
+                    legacy_profiles=data.pop("env_sync_profiles", None),
+                )
+
             self.app.validator.update_ui_state()
 
         except Exception as e:
@@ -266,14 +299,7 @@ class StateController:
         state_path = self._state_file_path()
 
         # preserve existing recent scripts from memory/file
-        existing_data = {}
-
-        try:
-            if os.path.isfile(state_path):
-                with open(state_path, "r", encoding="utf-8") as f:
-                    existing_data = json.load(f)
-        except Exception:
-            existing_data = {}
+        existing_data = STATE_STORE.open(state_path)
 
         recent_scripts = getattr(self.app, "state_data", {}).get(
             "recent_scripts",
@@ -290,15 +316,6 @@ class StateController:
             existing_data.get("recent_interpreters", [])
         )
 
-        env_sync_controller = getattr(self.app, "environment_sync_controller", None)
-        if env_sync_controller is not None:
-            env_sync_profiles = env_sync_controller.serialize_profiles()
-        else:
-            env_sync_profiles = getattr(self.app, "state_data", {}).get(
-                "env_sync_profiles",
-                existing_data.get("env_sync_profiles", [])
-            )
-
         data = {
             # --- Paths / core selections ---
             "last_script_path": _norm(self.app.script_path),
@@ -320,10 +337,13 @@ class StateController:
             "recent_scripts": recent_scripts,
             "recent_icons": recent_icons,
             "recent_interpreters": recent_interpreters,
-            "env_sync_profiles": env_sync_profiles,
+            "interpreter_capabilities": INTERPRETER_CAPABILITIES.serialize(),
+            "python_discovery": PYTHON_DISCOVERY.serialize(),
+            "env_sync_install_history": INSTALL_HISTORY.serialize(),
 
             # --- Build info ---
             "last_build_seconds": self.app.last_build_seconds,
+            "build_history": BUILD_HISTORY.serialize(),
 
             # --- Toggles / settings ---
             "tooltips_enabled": getattr(self.app, "tooltips_enabled", True),
@@ -331,6 +351,15 @@ class StateController:
             "minimize_after_build_enabled": getattr(self.app, "minimize_after_build_enabled", True),
             "open_output_dir_after_build_enabled": getattr(self.app, "open_output_dir_after_build_enabled", False),
             "suppress_exit_dialogue_enabled": getattr(self.app, "suppress_exit_dialogue_enabled", False),
+            "incremental_build_enabled": getattr(self.app, "incremental_build_enabled", True),
+            "mass_build_stamp_variants_enabled": getattr(self.app, "mass_build_stamp_variants_enabled", False),
+            "spec_file_builds_enabled": getattr(self.app, "spec_file_builds_enabled", True),
+            "env_sync_max_parallel": getattr(self.app, "env_sync_max_parallel", MAX_PARALLEL_ENVIRONMENT_SYNCS),
+            "data_file_patterns": list(
+                normalize_data_file_patterns(
+                    getattr(self.app, "data_file_patterns", DEFAULT_DATA_FILE_PATTERNS)
+                )
+            ),
 
             # --- User flags ---
             "icon_user_cleared": getattr(self.app, "icon_user_cleared", False),
@@ -346,8 +375,15 @@ class StateController:
         self.app.state_data = data
 
 
-        try:
-            with open(state_path, "w", encoding="utf-8") as f:
-                json.dump(data, f, indent=4)
-        except Exception as e:
-            print("State save error:", e)
+        # Written after a short delay, so the recents updates that usually
+        # follow a save go out in the same write.
+        STATE_STORE.replace(state_path, data)
+
+        # The data-file index can hold thousands of folders, so it lives in
+        # its own file next to the state file and is only rewritten when a
+        # build rescanned something.
+        PROJECT_DATA_INDEX.save(self._data_index_file_path())
+
+        env_sync_controller = getattr(self.app, "environment_sync_controller", None)
+        if env_sync_controller is not None:
+            env_sync_controller.save_profile_cache()
@@ -0,0 +1,141 @@
+import json
+import os
+import tempfile
+import threading
+
+from PySide6.QtCore import QTimer
+
+from event_loop import event_loop_running
+
+
+# Several writes from one user action (a save_state plus a recents update,
+# say) land inside this window and reach the disk as one.
+STATE_WRITE_DELAY_MS = 250
+
+
+def _same_path(first, second):
+    if not first or not second:
+        return False
+    return os.path.normcase(os.path.abspath(first)) == os.path.normcase(os.path.abspath(second))
+
+
+def _file_signature(path):
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+    return stat.st_mtime_ns, stat.st_size
+
+
+def _read_state_file(path):
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            data = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    return data if isinstance(data, dict) else {}
+
+
+def _write_state_file(path, text):
+    # Write next to the target and swap it in, so a crash mid-write leaves
+    # the previous state file intact instead of a truncated one.
+    folder = os.path.dirname(path) or "."
+    os.makedirs(folder, exist_ok=True)
+    fd, temp_path = tempfile.mkstemp(prefix=".state-", suffix=".tmp", dir=folder)
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            f.write(text)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(temp_path, path)
+    except BaseException:
+        try:
+            os.remove(temp_path)
+        except OSError:
+            pass
+        raise
+
+
+class StateStore:
+    def __init__(self, write_delay_ms=STATE_WRITE_DELAY_MS):
+        self.write_delay_ms = write_delay_ms
+        self._path = ""
+        self._data = None
+        self._signature = None
+        self._dirty = False
+        self._timer = None
+        self._lock = threading.RLock()
+
+    def open(self, path):
+        # Reads are served from memory. The file is only parsed again when
+        # something other than this store changed it (a stat, not a parse).
+        with self._lock:
+            if self._data is not None and _same_path(path, self._path):
+                if self._dirty or _file_signature(self._path) == self._signature:
+                    return self._data
+            else:
+                self.flush()
+
+            self._path = str(path)
+            self._signature = _file_signature(self._path)
+            self._data = _read_state_file(self._path)
+            self._dirty = False
+            return self._data
+
+    def update(self, path, values):
+        with self._lock:
+            self.open(path).update(values)
+            self._schedule_write()
+
+    def replace(self, path, data):
+        with self._lock:
+            self.open(path)
+            self._data = data
+            self._schedule_write()
+
+    def _schedule_write(self):
+        self._dirty = True
+        if not event_loop_running():
+            # Nothing would fire the timer (tests, scripts, shutdown).
+            self.flush()
+            return
+
+        if self._timer is None:
+            self._timer = QTimer()
+            self._timer.setSingleShot(True)
+            self._timer.timeout.connect(self.flush)
+        self._timer.start(self.write_delay_ms)
+
+    def flush(self):
+        with self._lock:
+            if self._timer is not None:
+                self._timer.stop()
+            if not self._dirty or not self._path:
+                return False
+
+            text = json.dumps(self._data, indent=4)
+            try:
+                _write_state_file(self._path, text)
+            except OSError as e:
+                print("State save error:", e)
+                return False
+
+            self._signature = _file_signature(self._path)
+            self._dirty = False
+            return True
+
+    @property
+    def pending(self):
+        return self._dirty
+
+    def clear(self):
+        with self._lock:
+            if self._timer is not None:
+                self._timer.stop()
+            self._path = ""
+            self._data = None
+            self._signature = None
+            self._dirty = False
+
+
+STATE_STORE = StateStore()
@@ -744,6 +744,40 @@ SCRIPT_PICKER_CONFIRM_STYLE = f"""
     }}
 """
 
+SYNC_PREVIEW_TREE_STYLE = f"""
+    QTreeWidget {{
+        background-color: {qcolor_name(Colors.TITLE_BG)};
+        color: {qcolor_name(Colors.TEXT_LIGHT)};
+        border: 2px solid {qcolor_name(Colors.BLACK)};
+        border-radius: 4px;
+        font-family: "Rubik UI";
+        font-size: 12px;
+        font-weight: bold;
+    }}
+
+    QTreeWidget::item:selected {{
+        background-color: {qcolor_name(Colors.SELECTION_BG)};
+    }}
+
+    QHeaderView::section {{
+        background-color: {qcolor_name(Colors.PANEL_BG)};
+        color: {qcolor_name(Colors.TEXT_LIGHT)};
+        border: none;
+        padding: 4px;
+        font-family: "Rubik UI";
+        font-size: 12px;
+        font-weight: bold;
+    }}
+
+    {vertical_scrollbar_style("QTreeWidget")}
+"""
+
+SYNC_PREVIEW_CANCEL_STYLE = (
+    SCRIPT_PICKER_CONFIRM_STYLE
+    .replace(qcolor_name(Colors.SUCCESS_PRESSED), qcolor_name(Colors.DANGER_HOVER))
+    .replace(qcolor_name(Colors.SUCCESS), qcolor_name(Colors.CANCEL))
+)
+
 CONFIRMATION_MESSAGE_BOX_STYLE = f"""
     QMessageBox {{
         background-color: {qcolor_name(Colors.POPUP_BG)};
@@ -0,0 +1,70 @@
+import random
+import statistics
+import sys
+import time
+
+from environment_sync_controller import EnvironmentSyncController, PythonEnvironmentProfile
+
+
+def synthetic_profiles(profile_count=6, package_count=10_000, seed=0):
+    # Each interpreter shares most of a common pool at the same versions and
+    # drifts on a small slice, roughly what several data-science
+    # environments kept loosely in step look like.
+    rng = random.Random(seed)
+    pool = {
+        f"package-{index:05d}": f"{rng.randint(0, 3)}.{rng.randint(0, 20)}.{rng.randint(0, 9)}"
+        for index in range(int(package_count * 1.2))
+    }
+    names = list(pool)
+
+    profiles = []
+    for profile_index in range(profile_count):
+        packages = {}
+        for name in rng.sample(names, package_count):
+            version = pool[name]
+            if rng.random() < 0.05:
+                version = f"{version}rc{rng.randint(1, 3)}"
+            packages[name] = {"name": name, "version": version}
+
+        minor = 8 + profile_index
+        profiles.append(
+            PythonEnvironmentProfile(
+                version=f"3.{minor}.{profile_index}",
+                executable=f"C:/Python3{minor}/python.exe",
+                packages=packages,
+            )
+        )
+    return profiles
+
+
+def benchmark_sync_plan(profile_count=6, package_count=10_000, repeat=5, seed=0):
+    controller = EnvironmentSyncController(wheelhouse_dir="")
+    profiles = synthetic_profiles(profile_count, package_count, seed)
+
+    timings = []
+    plan = None
+    for _ in range(max(1, repeat)):
+        started = time.perf_counter()
+        plan = controller.build_sync_plan(profiles)
+        timings.append(time.perf_counter() - started)
+
+    return {
+        "profiles": profile_count,
+        "packages": package_count,
+        "union_packages": len(plan.union_packages),
+        "actions": plan.total_actions,
+        "best_seconds": min(timings),
+        "median_seconds": statistics.median(timings),
+    }
+
+
+if __name__ == "__main__":
+    package_count = int(sys.argv[1]) if len(sys.argv) > 1 else 10_000
+    profile_count = int(sys.argv[2]) if len(sys.argv) > 2 else 6
+    result = benchmark_sync_plan(profile_count=profile_count, package_count=package_count)
+    print(
+        f"{result['profiles']} profiles x {result['packages']} packages: "
+        f"{result['union_packages']} union, {result['actions']} actions, "
+        f"best {result['best_seconds'] * 1000:.1f} ms, "
+        f"median {result['median_seconds'] * 1000:.1f} ms"
+    )
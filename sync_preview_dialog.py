@@ -0,0 +1,174 @@
+import os
+from collections import Counter
+
+from PySide6.QtCore import Qt
+from PySide6.QtWidgets import (
+    QDialog,
+    QFrame,
+    QHBoxLayout,
+    QLabel,
+    QPushButton,
+    QTreeWidget,
+    QTreeWidgetItem,
+    QVBoxLayout,
+)
+
+from environment_sync_preview import format_bytes
+from styles import (
+    Colors,
+    SCRIPT_PICKER_CONFIRM_STYLE,
+    SCRIPT_PICKER_FRAME_STYLE,
+    SCRIPT_PICKER_LABEL_STYLE,
+    SYNC_PREVIEW_CANCEL_STYLE,
+    SYNC_PREVIEW_TREE_STYLE,
+    apply_native_title_bar_style,
+)
+
+
+SYNC_PREVIEW_COLUMNS = ("Package", "Change", "Download", "Time")
+
+
+def _format_seconds(seconds):
+    seconds = int(round(seconds))
+    if seconds < 60:
+        return f"~{seconds}s"
+    return f"~{seconds // 60}m {seconds % 60:02d}s"
+
+
+def _download_text(action):
+    if action.cached:
+        return "cached"
+    if action.download_bytes is None:
+        return "?"
+    return format_bytes(action.download_bytes)
+
+
+def _change_text(action):
+    if action.current_version:
+        return f"{action.kind} {action.current_version} -> {action.target_version}"
+    return f"{action.kind} {action.target_version}"
+
+
+class SyncPreviewDialog(QDialog):
+    def __init__(self, parent, preview, concurrency=1, title="Environment Sync Preview"):
+        super().__init__(parent)
+
+        self.preview = preview
+        self.concurrency = max(1, concurrency)
+
+        self.setWindowTitle(title)
+        self.resize(560, 420)
+        self.setWindowFlags(
+            (self.windowFlags() & ~Qt.WindowContextHelpButtonHint)
+            | Qt.WindowCloseButtonHint
+        )
+        apply_native_title_bar_style(
+            self,
+            caption=Colors.PANEL_BG,
+            border=Colors.PANEL_BG,
+        )
+
+        layout = QVBoxLayout(self)
+
+        self.frame = QFrame()
+        self.frame.setFrameShape(QFrame.NoFrame)
+        self.frame.setStyleSheet(SCRIPT_PICKER_FRAME_STYLE)
+
+        frame_layout = QVBoxLayout(self.frame)
+        frame_layout.setContentsMargins(8, 8, 8, 8)
+        frame_layout.setSpacing(6)
+
+        self.tree = QTreeWidget()
+        self.tree.setColumnCount(len(SYNC_PREVIEW_COLUMNS))
+        self.tree.setHeaderLabels(SYNC_PREVIEW_COLUMNS)
+        self.tree.setStyleSheet(SYNC_PREVIEW_TREE_STYLE)
+        self._populate()
+        frame_layout.addWidget(self.tree)
+
+        self.summary_label = QLabel()
+        self.summary_label.setWordWrap(True)
+        self.summary_label.setStyleSheet(SCRIPT_PICKER_LABEL_STYLE)
+        frame_layout.addWidget(self.summary_label)
+
+        buttons = QHBoxLayout()
+        buttons.addStretch(1)
+
+        self.sync_btn = QPushButton("Sync Selected")
+        self.sync_btn.setFixedWidth(120)
+        self.sync_btn.setStyleSheet(SCRIPT_PICKER_CONFIRM_STYLE)
+        self.sync_btn.clicked.connect(self.accept)
+        buttons.addWidget(self.sync_btn)
+
+        cancel_btn = QPushButton("Cancel")
+        cancel_btn.setFixedWidth(120)
+        cancel_btn.setStyleSheet(SYNC_PREVIEW_CANCEL_STYLE)
+        cancel_btn.clicked.connect(self.reject)
+        buttons.addWidget(cancel_btn)
+
+        frame_layout.addLayout(buttons)
+        layout.addWidget(self.frame)
+
+        self.tree.itemChanged.connect(self._update_summary)
+        self._update_summary()
+
+    def _populate(self):
+        self.tree.clear()
+        versions = Counter(profile.version for profile in self.preview.profiles if profile.actions)
+        for profile in self.preview.profiles:
+            if not profile.actions:
+                continue
+
+            label = f"Python {profile.version}"
+            if versions[profile.version] > 1:
+                label += f" ({os.path.dirname(profile.executable)})"
+            profile_item = QTreeWidgetItem([label, "", "", ""])
+            profile_item.setFlags(
+                profile_item.flags() | Qt.ItemIsUserCheckable | Qt.ItemIsAutoTristate
+            )
+            profile_item.setToolTip(0, profile.executable)
+            profile_item.setData(0, Qt.UserRole, profile.key)
+
+            for action in profile.actions:
+                item = QTreeWidgetItem([
+                    action.name,
+                    _change_text(action),
+                    _download_text(action),
+                    _format_seconds(action.estimated_seconds),
+                ])
+                item.setFlags(item.flags() | Qt.ItemIsUserCheckable)
+                item.setCheckState(0, Qt.Checked)
+                item.setData(0, Qt.UserRole, action)
+                profile_item.addChild(item)
+
+            self.tree.addTopLevelItem(profile_item)
+            profile_item.setExpanded(True)
+
+        for column in range(len(SYNC_PREVIEW_COLUMNS)):
+            self.tree.resizeColumnToContents(column)
+
+    def selection(self):
+        selection = {}
+        for index in range(self.tree.topLevelItemCount()):
+            profile_item = self.tree.topLevelItem(index)
+            specs = [
+                profile_item.child(row).data(0, Qt.UserRole).spec
+                for row in range(profile_item.childCount())
+                if profile_item.child(row).checkState(0) == Qt.Checked
+            ]
+            if specs:
+                selection[profile_item.data(0, Qt.UserRole)] = specs
+        return selection
+
+    def _update_summary(self, *_args):
+        selected = self.preview.restricted_to(self.selection())
+
+        count = selected.total_actions
+        download = format_bytes(selected.download_bytes)
+        unknown = sum(profile.unknown_downloads for profile in selected.profiles)
+        if unknown:
+            download += f" + {unknown} unknown"
+        self.summary_label.setText(
+            f"{count} package change(s) selected. Download: {download}. "
+            f"Estimated time: {_format_seconds(selected.estimated_seconds(self.concurrency))}."
+        )
+        self.sync_btn.setEnabled(count > 0)
@@ -266,6 +266,8 @@ def attach_tooltips(app):
         blocked_hover_widgets=[
             app.env_sync_scan_btn,
             app.env_sync_match_btn,
+            app.env_sync_export_btn,
+            app.env_sync_apply_btn,
             app.env_sync_warning_label,
             app.env_sync_log_input,
         ],
@@ -295,6 +297,20 @@ def attach_tooltips(app):
         "compatibility; some packages may not install on every Python version."
     )
 
+    QtTooltip(
+        app.env_sync_export_btn,
+        "Saves the scanned union package set as a pinned lockfile.\n"
+        "A .txt file is a pip requirements file, with hashes when every package has a\n"
+        "wheel in the wheelhouse; a .json file keeps the same pins in JSON."
+    )
+
+    QtTooltip(
+        app.env_sync_apply_btn,
+        "Installs the pins from a lockfile into every detected Python install.\n"
+        "Only those installs are read first; packages already at the pinned\n"
+        "version are left alone."
+    )
+
     QtTooltip(
         app.select_recent_icons,
         "Select a recent Icon from this drop down list."
@@ -7,6 +7,10 @@ from datetime_build_options import (
     UK_MASS_DATETIME_BUILD_SENTINEL,
     USA_MASS_DATETIME_BUILD_SENTINEL,
 )
+from environment_lockfile import LockfileError, read_lockfile
+from PySide6.QtWidgets import QDialog, QFileDialog
+from state_store import STATE_STORE
+from sync_preview_dialog import SyncPreviewDialog
 from ui_highlights import flash_delete_highlight
 
 MASS_DATETIME_BUILD_SENTINELS = {
@@ -245,6 +249,7 @@ class UIHandlers:
         state_file = app.state_ctrl._state_file_path()
         state_dir = os.path.dirname(state_file)
         os.makedirs(state_dir, exist_ok=True)
+        STATE_STORE.flush()
 
         try:
             if os.path.isfile(state_file):
@@ -350,7 +355,6 @@ class UIHandlers:
 
             
         if hasattr(app, "validator"):
-            app.validator.validation_status_message()
             app.validator.update_ui_state()
 
         app.exe_name = value  # 🔑 ensure source of truth is updated
@@ -424,8 +428,96 @@ class UIHandlers:
 
     def on_env_sync_match(self):
         app = self.app
+        controller = app.environment_sync_controller
+        if controller.is_running:
+            app.set_env_sync_status("Environment sync is already running.")
+            return
+
+        preview = controller.preview_sync()
+        if preview is None:
+            app.set_env_sync_status("Scanning Python profiles...")
+            if not controller.start_scan_async(on_finished=lambda _plan: self._show_sync_preview()):
+                app.set_env_sync_status("Environment sync is already running.")
+            return
+
+        self._show_sync_preview(preview)
+
+    def _show_sync_preview(self, preview=None):
+        app = self.app
+        controller = app.environment_sync_controller
+        if preview is None:
+            preview = controller.preview_sync()
+        if preview is None or preview.total_actions == 0:
+            app.set_env_sync_status("All interpreters already match.")
+            return
+
+        dialog = SyncPreviewDialog(app, preview, controller._sync_concurrency(len(preview.profiles)))
+        if dialog.exec() != QDialog.Accepted:
+            return
+
         app.set_env_sync_status("Syncing dependencies...")
-        if not app.environment_sync_controller.start_sync_async():
+        if not controller.start_sync_async(dialog.selection()):
+            app.set_env_sync_status("Environment sync is already running.")
+
+    def on_env_sync_export_lock(self):
+        app = self.app
+        path, _ = QFileDialog.getSaveFileName(
+            app,
+            "Export Environment Lockfile",
+            os.path.join(getattr(app, "output_path", "") or os.path.expanduser("~"), "requirements.lock.txt"),
+            "Requirements with hashes (*.txt);;JSON (*.json)",
+        )
+        if not path:
+            return
+
+        app.set_env_sync_status("Exporting lockfile...")
+        if not app.environment_sync_controller.start_export_lock_async(path):
+            app.set_env_sync_status("Environment sync is already running.")
+
+    def on_env_sync_apply_lock(self):
+        app = self.app
+        path, _ = QFileDialog.getOpenFileName(
+            app,
+            "Apply Environment Lockfile",
+            getattr(app, "output_path", "") or os.path.expanduser("~"),
+            "Lockfiles (*.txt *.json)",
+        )
+        if not path:
+            return
+
+        try:
+            lock = read_lockfile(path)
+        except LockfileError as exc:
+            app.set_env_sync_status(f"Lockfile apply failed.\n{exc}")
+            return
+
+        app.set_env_sync_status("Checking interpreters against the lockfile...")
+        started = app.environment_sync_controller.start_lock_preview_async(
+            lock,
+            on_finished=lambda preview: self._confirm_lock_apply(lock, preview),
+        )
+        if not started:
+            app.set_env_sync_status("Environment sync is already running.")
+
+    def _confirm_lock_apply(self, lock, preview):
+        app = self.app
+        controller = app.environment_sync_controller
+        if preview.total_actions == 0:
+            app.set_env_sync_status("Every interpreter already matches the lockfile.")
+            return
+
+        dialog = SyncPreviewDialog(
+            app,
+            preview,
+            controller._sync_concurrency(len(preview.profiles)),
+            title="Apply Lockfile Preview",
+        )
+        if dialog.exec() != QDialog.Accepted:
+            app.set_env_sync_status("Lockfile apply cancelled.")
+            return
+
+        app.set_env_sync_status(f"Applying {len(lock.packages)} pinned packages...")
+        if not controller.start_apply_lock_async(lock, dialog.selection()):
             app.set_env_sync_status("Environment sync is already running.")
     
     def _on_exe_name_user_edit(self, text):
@@ -434,7 +526,6 @@ class UIHandlers:
             return
         app.exe_name_user_modified = True
         if hasattr(app, "validator"):
-            app.validator.validation_status_message()
             app.validator.update_ui_state()
 
 
@@ -34,6 +34,8 @@ from styles import (
     utility_icon_button_disabled_style,
     utility_icon_button_style,
 )
+from path_watcher import PathWatcher
+from validation_scheduler import StyleBatch, ValidationScheduler
 
 class ValidationController:
     def __init__(self, app):
@@ -41,7 +43,21 @@ class ValidationController:
         app = EXEBuilderApp instance
         """
         self.app = app
+        self.paths = PathWatcher()
+        self._scheduler = ValidationScheduler(self._apply_ui_state)
+        # A watched input appearing or disappearing revalidates on its own.
+        self.paths.changed.connect(self.update_ui_state)
             
+    def _track_inputs(self):
+        app = self.app
+        self.paths.track([
+            getattr(app, "entry_script", ""),
+            app.script_path_input.text(),
+            getattr(app, "python_interpreter_path", ""),
+            app.output_path_input.text(),
+            getattr(app, "icon_path", ""),
+        ])
+
     def set_build_error(self, message: str):
         self.app.build_error = message
         self.validation_status_message()
@@ -52,6 +68,7 @@ class ValidationController:
     # =================================================
     
     def inputs_are_valid(self):
+        self._track_inputs()
         script = self.app.script_path_input.text().strip()
         outdir = self.app.output_path_input.text().strip()
         exe_name = self.app.exe_name_input.text().strip()
@@ -62,13 +79,13 @@ class ValidationController:
         outdir = os.path.normpath(outdir) if outdir else ""
         python = os.path.normpath(python) if python else ""
 
-        if not python or not os.path.isfile(python):
+        if not python or not self.paths.is_file(python):
             return False
 
-        if not script or not os.path.isfile(script):
+        if not script or not self.paths.is_file(script):
             return False
 
-        if not outdir or not os.path.isdir(outdir):
+        if not outdir or not self.paths.is_dir(outdir):
             return False
 
         if not exe_name:
@@ -77,6 +94,7 @@ class ValidationController:
         return True
     
     def validation_status_message(self):
+        self._track_inputs()
 
         script = os.path.normpath(self.app.script_path_input.text().strip() or "")
         outdir = os.path.normpath(self.app.output_path_input.text().strip() or "")
@@ -89,11 +107,11 @@ class ValidationController:
         # -------------------------------
         state = {}
 
-        script_ok = bool(script and os.path.isfile(script))
-        outdir_ok = bool(outdir and os.path.isdir(outdir))
+        script_ok = bool(script and self.paths.is_file(script))
+        outdir_ok = bool(outdir and self.paths.is_dir(outdir))
         exe_ok = bool(exe_name)
-        python_ok = bool(python and os.path.isfile(python))
-        icon_ok = bool(icon_path and os.path.isfile(icon_path))
+        python_ok = bool(python and self.paths.is_file(python))
+        icon_ok = bool(icon_path and self.paths.is_file(icon_path))
 
         state.update({
             "script_ok": script_ok,
@@ -174,14 +192,25 @@ class ValidationController:
         return state
 
     def update_ui_state(self):
+        self._scheduler.request()
+
+    def flush_ui_state(self):
+        self._scheduler.flush()
+
+    def _apply_ui_state(self):
         app = self.app
+        if getattr(app, "_is_closing", False):
+            return
+
         building = getattr(app, "building", False)
+        styles = StyleBatch()
+        self._track_inputs()
 
         # -------------------------------
         # INPUT STATES
         # -------------------------------
         script = getattr(app, "entry_script", "")
-        script_ok = bool(script and os.path.isfile(script))
+        script_ok = bool(script and self.paths.is_file(script))
 
         outdir = app.output_path_input.text().strip()
         outdir = os.path.normpath(outdir) if outdir else ""
@@ -190,7 +219,7 @@ class ValidationController:
         is_desktop = outdir and os.path.normpath(outdir) == os.path.normpath(desktop)
 
         python_path = getattr(app, "python_interpreter_path", "").strip()
-        python_ok = bool(python_path and os.path.isfile(python_path))
+        python_ok = bool(python_path and self.paths.is_file(python_path))
 
         icon_path = getattr(app, "icon_path", "").strip()
         exe_name = app.exe_name_input.text().strip()
@@ -199,7 +228,7 @@ class ValidationController:
 
         is_ready = (
             script_ok and
-            outdir and os.path.isdir(outdir) and
+            outdir and self.paths.is_dir(outdir) and
             python_ok and
             exe_name
         )
@@ -289,28 +318,28 @@ class ValidationController:
 
             if not enabled:
                 if isinstance(btn, QCheckBox):
-                    btn.setStyleSheet(build_disabled_checkbox())
+                    styles.set(btn, build_disabled_checkbox())
                 elif btn in (
                     getattr(app, "refresh_btn", None),
                     getattr(app, "output_refresh_btn", None),
                 ):
-                    btn.setStyleSheet(build_disabled_button())
+                    styles.set(btn, build_disabled_button())
                 elif is_utility_icon_button(btn):
-                    btn.setStyleSheet(utility_icon_button_disabled_style(building))
+                    styles.set(btn, utility_icon_button_disabled_style(building))
                 elif building:
-                    btn.setStyleSheet(build_disabled_button())
+                    styles.set(btn, build_disabled_button())
                 else:
-                    btn.setStyleSheet(button_base(border_width=4))
+                    styles.set(btn, button_base(border_width=4))
             elif color:
-                btn.setStyleSheet(button_with_border(color))
+                styles.set(btn, button_with_border(color))
             else:
                 if isinstance(btn, QCheckBox):
-                    btn.setStyleSheet("")
+                    styles.set(btn, "")
                     return
                 if is_utility_icon_button(btn):
-                    btn.setStyleSheet(utility_icon_button_style())
+                    styles.set(btn, utility_icon_button_style())
                 else:
-                    btn.setStyleSheet(button_base(border_width=4))
+                    styles.set(btn, button_base(border_width=4))
 
         # -------------------------------
         # VALUE STATE (TEXT-BASED)
@@ -374,7 +403,7 @@ class ValidationController:
             set_btn(app.open_app_data_btn, not building)
         set_btn(app.open_output_dir_after_build, not building and not is_desktop)
         if is_desktop:
-            app.open_output_dir_after_build.setStyleSheet(
+            styles.set(app.open_output_dir_after_build,
                 build_disabled_checkbox_without_checkmark()
             )
         # 🔑 mutual exclusion + build lock
@@ -410,6 +439,17 @@ class ValidationController:
                 and bool(sync_plan and sync_plan.total_actions > 0),
             )
 
+        if hasattr(app, "env_sync_export_btn"):
+            sync_plan = getattr(env_sync_controller, "last_plan", None)
+            app.env_sync_export_btn.setEnabled(
+                not building
+                and not env_sync_running
+                and bool(sync_plan and sync_plan.union_packages),
+            )
+
+        if hasattr(app, "env_sync_apply_btn"):
+            app.env_sync_apply_btn.setEnabled(not building and not env_sync_running)
+
         set_btn(app.open_python_site_btn, not building)
         set_btn(app.interpreter_btn, not building)
         set_btn(app.interpreter_refresh_btn, not building and python_ok)
@@ -462,12 +502,12 @@ class ValidationController:
         # -------------------------------
 
         if building:
-            app.interpreter_btn.setStyleSheet(build_disabled_button())
+            styles.set(app.interpreter_btn, build_disabled_button())
         else:
             if python_ok:
-                app.interpreter_btn.setStyleSheet(filled_button(Colors.SUCCESS))
+                styles.set(app.interpreter_btn, filled_button(Colors.SUCCESS))
             else:
-                app.interpreter_btn.setStyleSheet(filled_button(Colors.ERROR))
+                styles.set(app.interpreter_btn, filled_button(Colors.ERROR))
 
         # -------------------------------
         # BUTTON COLOR: Script Folder
@@ -476,31 +516,32 @@ class ValidationController:
         folder_ok = bool(script_ok)
 
         if building:
-            app.folder_btn.setStyleSheet(build_disabled_button())
+            styles.set(app.folder_btn, build_disabled_button())
         else:
             if folder_ok:
-                app.folder_btn.setStyleSheet(filled_button(Colors.SUCCESS))
+                styles.set(app.folder_btn, filled_button(Colors.SUCCESS))
             else:
-                app.folder_btn.setStyleSheet(filled_button(Colors.ERROR))
+                styles.set(app.folder_btn, filled_button(Colors.ERROR))
 
         # -------------------------------
         # BUTTON COLOR: Output Folder
         # -------------------------------
 
-        output_ok = bool(outdir and os.path.isdir(outdir))
+        output_ok = bool(outdir and self.paths.is_dir(outdir))
 
         if building:
-            app.output_btn.setStyleSheet(build_disabled_button())
+            styles.set(app.output_btn, build_disabled_button())
         else:
             if output_ok:
-                app.output_btn.setStyleSheet(filled_button(Colors.SUCCESS))
+                styles.set(app.output_btn, filled_button(Colors.SUCCESS))
             else:
-                app.output_btn.setStyleSheet(filled_button(Colors.ERROR))
+                styles.set(app.output_btn, filled_button(Colors.ERROR))
 
         # -------------------------------
         # STATUS ONLY (lock applies here ONLY)
         # -------------------------------
         if getattr(app, "_status_lock", False):
+            styles.apply()
             return
 
         if building:
@@ -523,10 +564,10 @@ class ValidationController:
         else:
             color = Colors.ERROR
 
-        app.status_label.setStyleSheet(status_text_style(color))
+        styles.set(app.status_label, status_text_style(color))
 
         if building:
-            app.status_label.setStyleSheet(status_text_style(Colors.SUCCESS))
+            styles.set(app.status_label, status_text_style(Colors.SUCCESS))
 
         section_title_frames = [
             getattr(app, "title_frame", None),
@@ -540,7 +581,7 @@ class ValidationController:
 
         for frame in section_title_frames:
             if frame:
-                frame.setStyleSheet(
+                styles.set(frame,
                     BUILD_DISABLED_TITLE_FRAME_STYLE if building else TITLE_FRAME_STYLE
                 )
 
@@ -550,21 +591,23 @@ class ValidationController:
         for btn in [
             getattr(app, "env_sync_scan_btn", None),
             getattr(app, "env_sync_match_btn", None),
+            getattr(app, "env_sync_export_btn", None),
+            getattr(app, "env_sync_apply_btn", None),
         ]:
             if btn:
-                btn.setStyleSheet(
+                styles.set(btn,
                     build_disabled_button() if building else ENV_SYNC_BUTTON_STYLE
                 )
 
         if hasattr(app, "env_sync_log_input"):
-            app.env_sync_log_input.setStyleSheet(
+            styles.set(app.env_sync_log_input,
                 env_sync_disabled_status_line_style()
                 if building
                 else ENV_SYNC_STATUS_LINE_STYLE
             )
 
         if hasattr(app, "env_sync_rows_scroll_area"):
-            app.env_sync_rows_scroll_area.setStyleSheet(
+            styles.set(app.env_sync_rows_scroll_area,
                 ENV_SYNC_SCROLL_AREA_DISABLED_STYLE
                 if building
                 else ENV_SYNC_SCROLL_AREA_STYLE
@@ -597,14 +640,14 @@ class ValidationController:
 
         for label in env_sync_labels:
             if label:
-                label.setStyleSheet(env_sync_label_style)
+                styles.set(label, env_sync_label_style)
 
         env_sync_warning_label = getattr(app, "env_sync_warning_label", None)
         if env_sync_warning_label:
             env_sync_warning_color = (
                 Colors.BUILD_DISABLED_TEXT if building else Colors.WARNING
             )
-            env_sync_warning_label.setStyleSheet(
+            styles.set(env_sync_warning_label,
                 f"QLabel {{ color: {qcolor_name(env_sync_warning_color)}; }}"
             )
 
@@ -663,22 +706,6 @@ class ValidationController:
                 elif btn == app.refresh_btn:
                     set_refresh_button_icon(btn, can_revert_name)
                             
-        # -------------------------------
-        # LOCK + GREY INPUTS DURING BUILD
-        # -------------------------------
-
-        script = app.script_path_input.text().strip()
-        outdir = app.output_path_input.text().strip()
-        python_path = getattr(app, "python_interpreter_path", "").strip()
-        exe_name = app.exe_name_input.text().strip()
-        icon_path = getattr(app, "icon_path", "").strip()
-
-        script_ok = bool(script and os.path.isfile(os.path.normpath(script)))
-        outdir_ok = bool(outdir and os.path.isdir(os.path.normpath(outdir)))
-        python_ok = bool(python_path and os.path.isfile(os.path.normpath(python_path)))
-        exe_ok = bool(exe_name)
-        icon_ok = bool(icon_path and os.path.isfile(os.path.normpath(icon_path)))
-
         # -------------------------------
         # LOCK + GREY (respect validation)
         # -------------------------------
@@ -700,37 +727,38 @@ class ValidationController:
         # -------------------------------
         if building:
             for widget, _ in path_mapping:
-                widget.setStyleSheet(build_disabled_line_edit_style())
+                styles.set(widget, build_disabled_line_edit_style())
 
-            app.exe_name_input.setStyleSheet(build_disabled_line_edit_style())
+            styles.set(app.exe_name_input, build_disabled_line_edit_style())
         else:
             for widget, ok in validation_mapping:
 
-                widget.setStyleSheet("")  # reset first
-
                 # 🔑 ICON (optional → grey if empty)
                 if widget is app.icon_path_input and not widget.text().strip():
-                    widget.setStyleSheet(line_edit_style(Colors.MUTED_BORDER))
+                    styles.set(widget, line_edit_style(Colors.MUTED_BORDER))
 
                 elif widget is app.output_path_input and not widget.text().strip():
                     # output = required → force RED if empty
-                    widget.setStyleSheet(line_edit_style(Colors.ERROR))
+                    styles.set(widget, line_edit_style(Colors.ERROR))
 
                 elif ok:
-                    widget.setStyleSheet(line_edit_style(Colors.SUCCESS))
+                    styles.set(widget, line_edit_style(Colors.SUCCESS))
                 else:
-                    widget.setStyleSheet(line_edit_style(Colors.ERROR))
+                    styles.set(widget, line_edit_style(Colors.ERROR))
 
             # 🔑 THEN reapply validation styling
             self.validation_status_message()
-        self.update_build_button()
+        self.update_build_button(styles)
+        styles.apply()
 
-    def update_build_button(self):
+    def update_build_button(self, styles=None):
         app = self.app
 
         if not hasattr(app, "build_btn"):
             return
 
+        batch = styles or StyleBatch()
+
         state = self.validation_status_message()
         building = getattr(app, "building", False)
         is_ready = state["is_ready"]
@@ -741,7 +769,7 @@ class ValidationController:
                 return
             btn.setEnabled(enabled)
             if color:
-                btn.setStyleSheet(filled_button(color, radius=5))
+                batch.set(btn, filled_button(color, radius=5))
         try:
             app.build_btn.clicked.disconnect()
         except:
@@ -763,5 +791,7 @@ class ValidationController:
 
 
         # 🔑 restore toggle styling (it gets wiped during validation cycles)
-        app.appened_py_version.setStyleSheet(APPEND_PY_VERSION_STYLE)
+        batch.set(app.appened_py_version, APPEND_PY_VERSION_STYLE)
+        if styles is None:
+            batch.apply()
 
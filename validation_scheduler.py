@@ -0,0 +1,58 @@
+from PySide6.QtCore import QTimer
+
+from event_loop import event_loop_running
+
+
+class ValidationScheduler:
+    # Handlers ask for a refresh back-to-back (recent lists, pickers, build
+    # callbacks); every request inside one event-loop turn shares a single
+    # recompute. Without a running loop the callback runs inline.
+    def __init__(self, callback):
+        self._callback = callback
+        self._dirty = False
+        self._scheduled = False
+
+    @property
+    def pending(self):
+        return self._dirty
+
+    def request(self):
+        if not event_loop_running():
+            self._dirty = False
+            self._callback()
+            return
+
+        self._dirty = True
+        if not self._scheduled:
+            self._scheduled = True
+            QTimer.singleShot(0, self._run)
+
+    def flush(self):
+        if self._dirty:
+            self._run()
+
+    def _run(self):
+        self._scheduled = False
+        if not self._dirty:
+            return
+        self._dirty = False
+        self._callback()
+
+
+class StyleBatch:
+    # setStyleSheet re-polishes a widget even when the sheet is unchanged, and
+    # one validation pass can style the same button twice. Only the last
+    # sheet per widget is applied, and only when it differs.
+    def __init__(self):
+        self._sheets = {}
+
+    def set(self, widget, sheet):
+        self._sheets[id(widget)] = (widget, sheet)
+
+    def apply(self):
+        sheets, self._sheets = self._sheets, {}
+        for widget, sheet in sheets.values():
+            current = getattr(widget, "styleSheet", None)
+            if callable(current) and current() == sheet:
+                continue
+            widget.setStyleSheet(sheet)
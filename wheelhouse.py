@@ -0,0 +1,97 @@
+import json
+import os
+import posixpath
+import re
+from urllib.parse import unquote
+
+
+WHEELHOUSE_DIR_NAME = "wheelhouse"
+# Wheels pip fetched from the index, as opposed to ones "pip wheel" built
+# from an sdist on this machine. Only these are safe to pin by hash: a local
+# build never matches anything the index serves.
+INDEX_WHEELS_FILE_NAME = "index-wheels.json"
+
+# "Downloading numpy-2.3.0-...whl (12.6 MB)", "Using cached numpy-...whl",
+# or the full URL on older pips.
+_INDEX_WHEEL_PATTERN = re.compile(r"^\s*(?:Downloading|Using cached)\s+(\S+?\.whl)\b")
+
+
+def default_wheelhouse_dir():
+    return os.path.join(
+        os.getenv("LOCALAPPDATA") or os.path.expanduser("~"),
+        "EXEBuilder",
+        WHEELHOUSE_DIR_NAME,
+    )
+
+
+def wheelhouse_install_command(executable, specs, wheelhouse):
+    # Wheel filenames carry their tags, so one folder serves every interpreter:
+    # pip only considers the files compatible with the one it runs under.
+    return [
+        str(executable),
+        "-m",
+        "pip",
+        "install",
+        "--disable-pip-version-check",
+        "--no-index",
+        f"--find-links={wheelhouse}",
+        *specs,
+    ]
+
+
+def wheelhouse_gather_command(executable, specs, wheelhouse):
+    # "pip wheel" also builds sdist-only packages once, where "pip download"
+    # would leave every interpreter to build them again at install time.
+    return [
+        str(executable),
+        "-m",
+        "pip",
+        "wheel",
+        "--disable-pip-version-check",
+        f"--wheel-dir={wheelhouse}",
+        f"--find-links={wheelhouse}",
+        *specs,
+    ]
+
+
+def index_wheel_filename(line):
+    # The wheel a pip output line says came from the index, or "".
+    match = _INDEX_WHEEL_PATTERN.match(str(line))
+    if match is None:
+        return ""
+    return posixpath.basename(unquote(match.group(1)))
+
+
+def wheelhouse_wheels(wheelhouse):
+    try:
+        return {entry.name for entry in os.scandir(wheelhouse) if entry.name.lower().endswith(".whl")}
+    except OSError:
+        return set()
+
+
+def read_index_wheels(wheelhouse):
+    try:
+        with open(os.path.join(wheelhouse, INDEX_WHEELS_FILE_NAME), "r", encoding="utf-8") as f:
+            data = json.load(f)
+    except (OSError, ValueError):
+        return set()
+    if not isinstance(data, list):
+        return set()
+    return {str(name) for name in data}
+
+
+def record_index_wheels(wheelhouse, filenames):
+    known = read_index_wheels(wheelhouse)
+    merged = known | set(filenames)
+    if merged == known:
+        return False
+
+    path = os.path.join(wheelhouse, INDEX_WHEELS_FILE_NAME)
+    temp_path = path + ".tmp"
+    try:
+        with open(temp_path, "w", encoding="utf-8") as f:
+            json.dump(sorted(merged), f, indent=2)
+        os.replace(temp_path, path)
+    except OSError:
+        return False
+    return True